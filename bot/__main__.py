@@ -8,10 +8,17 @@ from aiogram.types import BotCommand
 from bot.config.logging_config import get_logger, setup_logging
 from bot.config.settings import settings
 from bot.database.engine import close_db
+from bot.services.ai_service import (
+    close_openai_client,
+    prewarm_openai_client,
+    purge_expired_ai_cache,
+)
 from bot.telegram.bot import create_bot, create_dispatcher, setup_handlers
 
 logger = get_logger(__name__)
 
+_background_tasks: set[asyncio.Task] = set()
+
 
 async def set_bot_commands(bot):
     """Set bot commands for menu.
@@ -28,16 +35,34 @@ async def set_bot_commands(bot):
     logger.info("Bot commands set")
 
 
+async def purge_ai_cache_periodically():
+    """Delete expired persistent AI cache entries at a fixed interval."""
+    while True:
+        try:
+            await purge_expired_ai_cache()
+        except Exception as e:
+            logger.warning("Failed to purge AI cache: %s", e)
+        await asyncio.sleep(settings.ai_cache_cleanup_interval_seconds)
+
+
 async def on_startup():
     """Actions to perform on bot startup."""
     logger.info("Starting Greek Learning Bot...")
     logger.info(f"Debug mode: {settings.debug}")
+    await prewarm_openai_client()
+
+    if settings.ai_persistent_cache_enabled:
+        _background_tasks.add(asyncio.create_task(purge_ai_cache_periodically()))
 
 
 async def on_shutdown():
     """Actions to perform on bot shutdown."""
     logger.info("Shutting down Greek Learning Bot...")
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
     await close_db()
+    await close_openai_client()
     logger.info("Bot stopped")
 
 
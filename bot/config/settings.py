@@ -35,10 +35,29 @@ class Settings(BaseSettings):
         default="gpt-4",
         description="OpenAI model to use (gpt-4, gpt-4-turbo, gpt-3.5-turbo)",
     )
+    openai_model_fast: str = Field(
+        default="gpt-4o-mini",
+        description="Smaller OpenAI model for simple tasks (word translation, examples)",
+    )
     openai_max_tokens: int = Field(
         default=1000,
         description="Maximum tokens for OpenAI responses",
     )
+    openai_max_tokens_ask: int = Field(
+        default=800,
+        ge=1,
+        description="Maximum tokens for assistant answers",
+    )
+    openai_max_tokens_grammar: int = Field(
+        default=800,
+        ge=1,
+        description="Maximum tokens for grammar explanations",
+    )
+    openai_max_tokens_translate: int = Field(
+        default=400,
+        ge=1,
+        description="Maximum tokens for single word translations",
+    )
     openai_temperature: float = Field(
         default=0.7,
         ge=0.0,
@@ -51,10 +70,104 @@ class Settings(BaseSettings):
         le=300.0,
         description="OpenAI API request timeout in seconds",
     )
+    openai_max_retries: int = Field(
+        default=3,
+        ge=0,
+        le=8,
+        description="Retries with exponential backoff for rate-limited or failed OpenAI requests",
+    )
+    openai_circuit_fail_max: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive OpenAI outage errors that stop requests to a model",
+    )
+    openai_circuit_reset_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Seconds before a stopped model is probed again",
+    )
     openai_vision_model: str = Field(
         default="gpt-4o",
         description="OpenAI model for vision tasks (must support vision)",
     )
+    openai_vision_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum vision requests in flight when processing several images",
+    )
+    openai_max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum concurrent connections in the shared OpenAI HTTP pool",
+    )
+    openai_max_keepalive_connections: int = Field(
+        default=50,
+        ge=0,
+        description="Maximum idle keep-alive connections kept in the OpenAI HTTP pool",
+    )
+    ai_cache_max_size: int = Field(
+        default=4096,
+        ge=1,
+        description="Maximum number of cached AI translations and cards",
+    )
+    ai_cache_ttl_seconds: int = Field(
+        default=86400,
+        ge=1,
+        description="Lifetime of cached AI translations and cards in seconds",
+    )
+    openai_requests_per_minute: int = Field(
+        default=500,
+        ge=1,
+        description="Client-side limit of OpenAI requests per minute",
+    )
+    openai_tokens_per_minute: int = Field(
+        default=200000,
+        ge=1,
+        description="Client-side limit of estimated OpenAI tokens per minute",
+    )
+    ai_persistent_cache_enabled: bool = Field(
+        default=True,
+        description="Keep AI translations and cards in the database across restarts",
+    )
+    ai_persistent_cache_ttl_days: int = Field(
+        default=30,
+        ge=1,
+        description="Lifetime of AI responses kept in the database in days",
+    )
+    ai_cache_cleanup_interval_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description="How often expired AI responses are deleted from the database",
+    )
+    openai_embedding_model: str = Field(
+        default="text-embedding-3-small",
+        description="OpenAI model used to embed prompts for the semantic cache",
+    )
+    ai_semantic_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse answers to near-duplicate standalone questions",
+    )
+    ai_semantic_cache_threshold: float = Field(
+        # Questions differing in a single word embed very closely
+        default=0.98,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for a semantic cache hit",
+    )
+    ai_semantic_cache_max_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of answers kept per semantic cache",
+    )
+    ai_semantic_cache_ttl_seconds: int = Field(
+        default=604800,
+        ge=1,
+        description="Lifetime of semantically cached answers in seconds",
+    )
+    openai_user: str = Field(
+        default="lang-bot",
+        description="End-user identifier sent with every OpenAI request",
+    )
     max_image_size_mb: float = Field(
         default=20.0,
         ge=1.0,
@@ -1,5 +1,6 @@
 """Database models."""
 
+from bot.database.models.ai_cache import AICacheEntry, AISemanticCacheEntry
 from bot.database.models.card import Card
 from bot.database.models.conversation import ConversationMessage, MessageRole
 from bot.database.models.deck import Deck
@@ -15,4 +16,6 @@ __all__ = [
     "LearningStats",
     "ConversationMessage",
     "MessageRole",
+    "AICacheEntry",
+    "AISemanticCacheEntry",
 ]
@@ -0,0 +1,47 @@
+"""Persistent caches of AI responses."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, LargeBinary, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from bot.database.base import Base
+
+
+class AICacheEntry(Base):
+    """Cached AI response shared by all users.
+
+    Keeps translations and generated cards across bot restarts.
+    """
+
+    __tablename__ = "ai_cache"
+
+    key: Mapped[bytes] = mapped_column(LargeBinary(16), primary_key=True)
+    value: Mapped[str] = mapped_column(Text, nullable=False)  # JSON-encoded response
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<AICacheEntry(key={self.key.hex()}, expires_at={self.expires_at})>"
+
+
+class AISemanticCacheEntry(Base):
+    """Cached AI answer matched by embedding similarity.
+
+    Lets open-ended questions reuse answers to paraphrased prompts across
+    bot restarts.
+    """
+
+    __tablename__ = "ai_semantic_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    namespace: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    embedding: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # float32 vector
+    response: Mapped[str] = mapped_column(Text, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<AISemanticCacheEntry(id={self.id}, namespace={self.namespace})>"
@@ -1,5 +1,7 @@
 """Database repositories."""
 
+from bot.database.repositories.ai_cache_repo import AICacheRepository
+from bot.database.repositories.ai_semantic_cache_repo import AISemanticCacheRepository
 from bot.database.repositories.base import BaseRepository
 from bot.database.repositories.card_repo import CardRepository
 from bot.database.repositories.conversation_repo import ConversationRepository
@@ -14,4 +16,6 @@ __all__ = [
     "CardRepository",
     "ReviewRepository",
     "ConversationRepository",
+    "AICacheRepository",
+    "AISemanticCacheRepository",
 ]
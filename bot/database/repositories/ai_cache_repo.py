@@ -0,0 +1,60 @@
+"""AI response cache repository."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import CursorResult, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.database.models.ai_cache import AICacheEntry
+from bot.database.repositories.base import BaseRepository
+
+
+class AICacheRepository(BaseRepository[AICacheEntry]):
+    """Repository for AICacheEntry model."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize AI cache repository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(AICacheEntry, session)
+
+    async def get_value(self, key: bytes) -> str | None:
+        """Get a cached value that has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            JSON-encoded value or None if missing or expired
+        """
+        query = select(AICacheEntry.value).where(
+            AICacheEntry.key == key,
+            AICacheEntry.expires_at > datetime.now(UTC),
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def set_values(self, values: dict[bytes, str], ttl: timedelta) -> None:
+        """Insert or replace cached values.
+
+        Args:
+            values: JSON-encoded values by cache key
+            ttl: Lifetime of the entries
+        """
+        expires_at = datetime.now(UTC) + ttl
+        for key, value in values.items():
+            await self.session.merge(AICacheEntry(key=key, value=value, expires_at=expires_at))
+        await self.session.flush()
+
+    async def delete_expired(self) -> int:
+        """Delete expired entries (cleanup task).
+
+        Returns:
+            Number of entries deleted
+        """
+        query = delete(AICacheEntry).where(AICacheEntry.expires_at <= datetime.now(UTC))
+        cursor_result: CursorResult = await self.session.execute(query)  # type: ignore[assignment]
+        await self.session.flush()
+        return cursor_result.rowcount or 0
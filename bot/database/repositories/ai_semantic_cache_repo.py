@@ -0,0 +1,78 @@
+"""AI semantic cache repository."""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import CursorResult, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.database.models.ai_cache import AISemanticCacheEntry
+from bot.database.repositories.base import BaseRepository
+
+
+class AISemanticCacheRepository(BaseRepository[AISemanticCacheEntry]):
+    """Repository for AISemanticCacheEntry model."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize AI semantic cache repository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(AISemanticCacheEntry, session)
+
+    async def get_entries(self, namespace: str, limit: int) -> Sequence[AISemanticCacheEntry]:
+        """Get the newest entries of a namespace that have not expired.
+
+        Args:
+            namespace: Cache namespace
+            limit: Maximum number of entries
+
+        Returns:
+            Entries ordered from oldest to newest
+        """
+        query = (
+            select(AISemanticCacheEntry)
+            .where(
+                AISemanticCacheEntry.namespace == namespace,
+                AISemanticCacheEntry.expires_at > datetime.now(UTC),
+            )
+            .order_by(AISemanticCacheEntry.id.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return list(reversed(result.scalars().all()))
+
+    async def add_entry(
+        self, namespace: str, embedding: bytes, response: str, ttl: timedelta
+    ) -> AISemanticCacheEntry:
+        """Store a cached answer.
+
+        Args:
+            namespace: Cache namespace
+            embedding: Encoded embedding of the prompt
+            response: Cached answer
+            ttl: Lifetime of the entry
+
+        Returns:
+            Created entry
+        """
+        return await self.create(
+            namespace=namespace,
+            embedding=embedding,
+            response=response,
+            expires_at=datetime.now(UTC) + ttl,
+        )
+
+    async def delete_expired(self) -> int:
+        """Delete expired entries (cleanup task).
+
+        Returns:
+            Number of entries deleted
+        """
+        query = delete(AISemanticCacheEntry).where(
+            AISemanticCacheEntry.expires_at <= datetime.now(UTC)
+        )
+        cursor_result: CursorResult = await self.session.execute(query)  # type: ignore[assignment]
+        await self.session.flush()
+        return cursor_result.rowcount or 0
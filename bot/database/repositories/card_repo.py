@@ -2,10 +2,11 @@
 
 from datetime import UTC, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import Float, case, cast, func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database.models.card import Card
+from bot.database.models.deck import Deck
 from bot.database.repositories.base import BaseRepository
 
 
@@ -94,6 +95,92 @@ class CardRepository(BaseRepository[Card]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_session_cards(
+        self,
+        deck_id: int,
+        new_limit: int,
+        due_limit: int,
+        current_time: datetime | None = None,
+    ) -> tuple[list[Card], list[Card]]:
+        """Get new and due cards for a learning session in one query.
+
+        Args:
+            deck_id: Deck ID
+            new_limit: Maximum number of new cards
+            due_limit: Maximum number of due cards
+            current_time: Current time (defaults to now)
+
+        Returns:
+            Tuple of (new cards, due cards), selected as by get_new_cards and
+            get_due_cards; due cards are ordered by next_review (oldest first)
+        """
+        if current_time is None:
+            current_time = datetime.now(UTC)
+
+        new_ids = (
+            select(Card.id, literal(True).label("is_new"))
+            .where(Card.deck_id == deck_id, Card.repetitions == 0)
+            .limit(new_limit)
+            .subquery()
+        )
+        due_ids = (
+            select(Card.id, literal(False).label("is_new"))
+            .where(
+                Card.deck_id == deck_id,
+                Card.next_review <= current_time,
+                Card.repetitions > 0,
+            )
+            .order_by(Card.next_review.asc())
+            .limit(due_limit)
+            .subquery()
+        )
+        picked = union_all(select(new_ids), select(due_ids)).subquery()
+
+        query = (
+            select(Card, picked.c.is_new)
+            .join(picked, Card.id == picked.c.id)
+            .order_by(Card.next_review.asc(), Card.id)
+        )
+        result = await self.session.execute(query)
+
+        new_cards: list[Card] = []
+        due_cards: list[Card] = []
+        for card, is_new in result.tuples():
+            (new_cards if is_new else due_cards).append(card)
+        return new_cards, due_cards
+
+    async def get_next_card(
+        self, deck_id: int, current_time: datetime | None = None
+    ) -> Card | None:
+        """Get the card to show next in a deck.
+
+        Applies the same order as get_next_card_for_learning in the database,
+        so only one row is fetched: new cards first (most recently created
+        first), then due cards (most overdue first).
+
+        Args:
+            deck_id: Deck ID
+            current_time: Current time (defaults to now)
+
+        Returns:
+            Next card or None if no cards are new or due
+        """
+        if current_time is None:
+            current_time = datetime.now(UTC)
+
+        is_new = Card.repetitions == 0
+        query = (
+            select(Card)
+            .where(Card.deck_id == deck_id, is_new | (Card.next_review <= current_time))
+            .order_by(
+                case((is_new, 0), else_=1),
+                case((is_new, Card.created_at)).desc(),
+                Card.next_review.asc(),
+            )
+            .limit(1)
+        )
+        return await self.session.scalar(query)
+
     async def count_due_cards(self, deck_id: int, current_time: datetime | None = None) -> int:
         """Count cards due for review.
 
@@ -136,6 +223,65 @@ class CardRepository(BaseRepository[Card]):
         result = await self.session.execute(query)
         return result.scalar_one()
 
+    async def count_deck_cards(
+        self, deck_id: int, current_time: datetime | None = None
+    ) -> tuple[int, int, int]:
+        """Count all, new and due cards of a deck in one query.
+
+        Args:
+            deck_id: Deck ID
+            current_time: Current time (defaults to now)
+
+        Returns:
+            Tuple of (total, new, due) card counts, with the same new and due
+            criteria as count_new_cards and count_due_cards
+        """
+        if current_time is None:
+            current_time = datetime.now(UTC)
+
+        query = (
+            select(
+                func.count(),
+                func.count().filter(Card.repetitions == 0),
+                func.count().filter(Card.next_review <= current_time, Card.repetitions > 0),
+            )
+            .select_from(Card)
+            .where(Card.deck_id == deck_id)
+        )
+        result = await self.session.execute(query)
+        total, new, due = result.one()
+        return total, new, due
+
+    async def get_deck_progress_counts(self, deck_id: int) -> tuple[int, int, int, int, float]:
+        """Count cards of a deck by learning stage in one query.
+
+        Args:
+            deck_id: Deck ID
+
+        Returns:
+            Tuple of (total, new, learning, mastered, average success rate).
+            Learning cards have 1-4 repetitions and mastered cards 5 or more.
+            The success rate is a percentage averaged over reviewed cards.
+        """
+        success_rate = case(
+            (Card.total_reviews > 0, cast(Card.correct_reviews, Float) * 100 / Card.total_reviews),
+            else_=None,
+        )
+        query = (
+            select(
+                func.count(),
+                func.count().filter(Card.repetitions == 0),
+                func.count().filter(Card.repetitions > 0, Card.repetitions < 5),
+                func.count().filter(Card.repetitions >= 5),
+                func.avg(success_rate),
+            )
+            .select_from(Card)
+            .where(Card.deck_id == deck_id)
+        )
+        result = await self.session.execute(query)
+        total, new, learning, mastered, avg_success_rate = result.one()
+        return total, new, learning, mastered, float(avg_success_rate or 0)
+
     async def search_cards(self, deck_id: int, search_term: str) -> list[Card]:
         """Search cards by front or back text.
 
@@ -154,12 +300,30 @@ class CardRepository(BaseRepository[Card]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_user_card(self, card_id: int, user_id: int) -> Card | None:
+        """Get a card if it belongs to one of the user's decks.
+
+        Args:
+            card_id: Card ID
+            user_id: User ID
+
+        Returns:
+            Card instance or None if not found or owned by another user
+        """
+        query = (
+            select(Card)
+            .join(Deck, Card.deck_id == Deck.id)
+            .where(Card.id == card_id, Deck.user_id == user_id)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
     async def search_user_cards(
         self,
         user_id: int,
         search_term: str,
         limit: int = 10,
-    ) -> list[tuple[Card, int]]:
+    ) -> list[tuple[Card, Deck]]:
         """Search all user's cards across all decks.
 
         Args:
@@ -168,13 +332,11 @@ class CardRepository(BaseRepository[Card]):
             limit: Maximum results
 
         Returns:
-            List of (Card, deck_id) tuples for matching cards
+            List of (Card, Deck) tuples for matching cards
         """
-        from bot.database.models.deck import Deck
-
         search_pattern = f"%{search_term}%"
         query = (
-            select(Card, Deck.id)
+            select(Card, Deck)
             .join(Deck, Card.deck_id == Deck.id)
             .where(
                 Deck.user_id == user_id,
@@ -185,6 +347,34 @@ class CardRepository(BaseRepository[Card]):
         result = await self.session.execute(query)
         return list(result.tuples().all())
 
+    async def find_user_card(self, user_id: int, search_term: str) -> tuple[Card, Deck, int] | None:
+        """Find the first of the user's cards matching a search term.
+
+        Matches like search_user_cards, but fetches one row and counts the
+        other matches with a window function.
+
+        Args:
+            user_id: User ID
+            search_term: Search term
+
+        Returns:
+            Tuple of (Card, Deck, number of matching cards), or None if no
+            card matches
+        """
+        search_pattern = f"%{search_term}%"
+        query = (
+            select(Card, Deck, func.count().over())
+            .join(Deck, Card.deck_id == Deck.id)
+            .where(
+                Deck.user_id == user_id,
+                (Card.front.ilike(search_pattern)) | (Card.back.ilike(search_pattern)),
+            )
+            .limit(1)
+        )
+        result = await self.session.execute(query)
+        row = result.tuples().first()
+        return (row[0], row[1], row[2]) if row else None
+
     async def get_due_cards_from_decks(
         self,
         deck_ids: list[int],
@@ -310,46 +500,29 @@ class CardRepository(BaseRepository[Card]):
         result = await self.session.execute(query)
         return result.scalar_one()
 
-    async def find_cards_by_lemmas(
-        self,
-        user_id: int,
-        lemmas: list[str],
-        limit: int = 100,
-    ) -> list[tuple[Card, int]]:
-        """Find cards matching any of the provided lemmas.
+    async def find_existing_lemmas(self, user_id: int, lemmas: list[str]) -> set[str]:
+        """Find which lemmas already exist as a front or back of the user's cards.
 
-        Searches both front and back fields. Useful for bulk vocabulary check.
+        Matches are exact and case-insensitive. Only the matched text is
+        fetched, in one query, so no cards are loaded.
 
         Args:
             user_id: User ID
-            lemmas: List of lemmas to search for
-            limit: Maximum results
+            lemmas: Lemmas to look for
 
         Returns:
-            List of (Card, deck_id) tuples for matching cards
+            Lowercased lemmas that match a card
         """
-        from sqlalchemy import or_
-
-        from bot.database.models.deck import Deck
-
-        if not lemmas:
-            return []
-
-        # Build OR conditions for all lemmas (exact match, case-insensitive)
-        conditions = []
-        for lemma in lemmas:
-            lemma_lower = lemma.lower()
-            conditions.append(func.lower(Card.front) == lemma_lower)
-            conditions.append(func.lower(Card.back) == lemma_lower)
+        wanted = {lemma.lower() for lemma in lemmas}
+        if not wanted:
+            return set()
 
+        front = func.lower(Card.front)
+        back = func.lower(Card.back)
         query = (
-            select(Card, Deck.id)
+            select(front, back)
             .join(Deck, Card.deck_id == Deck.id)
-            .where(
-                Deck.user_id == user_id,
-                or_(*conditions),
-            )
-            .limit(limit)
+            .where(Deck.user_id == user_id, front.in_(wanted) | back.in_(wanted))
         )
         result = await self.session.execute(query)
-        return list(result.tuples().all())
+        return wanted.intersection(text for row in result.tuples() for text in row)
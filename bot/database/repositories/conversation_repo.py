@@ -51,6 +51,40 @@ class ConversationRepository(BaseRepository[ConversationMessage]):
             token_count=token_count,
         )
 
+    async def add_messages(
+        self,
+        user_id: int,
+        messages: list[tuple[MessageRole, str, datetime]],
+        conversation_id: str = "default",
+        message_type: str | None = None,
+    ) -> list[ConversationMessage]:
+        """Add several messages to the conversation in one flush.
+
+        Args:
+            user_id: User's database ID
+            messages: (role, content, created_at) of each message, in order
+            conversation_id: Conversation identifier
+            message_type: Type of AI interaction
+
+        Returns:
+            Created message instances
+        """
+        instances = [
+            ConversationMessage(
+                user_id=user_id,
+                role=role.value,
+                content=content,
+                conversation_id=conversation_id,
+                message_type=message_type,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            for role, content, created_at in messages
+        ]
+        self.session.add_all(instances)
+        await self.session.flush()
+        return instances
+
     async def get_recent_messages(
         self,
         user_id: int,
@@ -73,13 +107,42 @@ class ConversationRepository(BaseRepository[ConversationMessage]):
                 ConversationMessage.user_id == user_id,
                 ConversationMessage.conversation_id == conversation_id,
             )
-            .order_by(ConversationMessage.created_at.desc())
+            .order_by(ConversationMessage.created_at.desc(), ConversationMessage.id.desc())
             .limit(limit)
         )
         result = await self.session.execute(query)
         messages = list(result.scalars().all())
         return list(reversed(messages))
 
+    async def get_recent_message_contents(
+        self,
+        user_id: int,
+        conversation_id: str = "default",
+        limit: int = 10,
+    ) -> list[tuple[str, str]]:
+        """Get role and content of recent messages without loading full models.
+
+        Args:
+            user_id: User's database ID
+            conversation_id: Conversation identifier
+            limit: Maximum number of messages to return
+
+        Returns:
+            List of (role, content) tuples ordered oldest first
+        """
+        query = (
+            select(ConversationMessage.role, ConversationMessage.content)
+            .where(
+                ConversationMessage.user_id == user_id,
+                ConversationMessage.conversation_id == conversation_id,
+            )
+            .order_by(ConversationMessage.created_at.desc(), ConversationMessage.id.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        rows = list(result.tuples().all())
+        return list(reversed(rows))
+
     async def get_conversation_history(
         self,
         user_id: int,
@@ -104,7 +167,7 @@ class ConversationRepository(BaseRepository[ConversationMessage]):
                 ConversationMessage.user_id == user_id,
                 ConversationMessage.conversation_id == conversation_id,
             )
-            .order_by(ConversationMessage.created_at.asc())
+            .order_by(ConversationMessage.created_at.asc(), ConversationMessage.id.asc())
             .offset(offset)
         )
         if limit is not None:
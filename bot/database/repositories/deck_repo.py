@@ -63,16 +63,18 @@ class DeckRepository(BaseRepository[Deck]):
         Returns:
             Tuple of (Deck instance or None, card count)
         """
-        deck = await self.get_by_id(deck_id)
-        if not deck:
-            return None, 0
-
-        # Count cards in this deck
-        query = select(func.count()).select_from(Card).where(Card.deck_id == deck_id)
+        # Count cards in a correlated subquery to load both in one round trip
+        card_count = (
+            select(func.count()).select_from(Card).where(Card.deck_id == Deck.id).scalar_subquery()
+        )
+        query = select(Deck, card_count).where(Deck.id == deck_id)
         result = await self.session.execute(query)
-        card_count = result.scalar_one()
+        row = result.one_or_none()
+        if row is None:
+            return None, 0
 
-        return deck, card_count
+        deck, count = row
+        return deck, count
 
     async def count_user_decks(self, user_id: int) -> int:
         """Count total number of decks for a user.
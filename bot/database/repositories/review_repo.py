@@ -2,7 +2,7 @@
 
 from datetime import UTC, date, datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import SQLColumnExpression, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database.models.review import Review
@@ -20,6 +20,45 @@ class ReviewRepository(BaseRepository[Review]):
         """
         super().__init__(Review, session)
 
+    def add_review(
+        self,
+        card_id: int,
+        user_id: int,
+        quality: int,
+        reviewed_at: datetime,
+        time_spent: int | None,
+        ease_factor_before: float,
+        interval_before: int,
+    ) -> Review:
+        """Add a review to the session without flushing.
+
+        The row is inserted with the next flush, together with other pending
+        changes such as the reviewed card's new SRS values.
+
+        Args:
+            card_id: Reviewed card ID
+            user_id: User ID
+            quality: Quality rating
+            reviewed_at: Review time
+            time_spent: Time spent on the card in seconds
+            ease_factor_before: Card ease factor before the review
+            interval_before: Card interval before the review
+
+        Returns:
+            Pending review instance
+        """
+        review = Review(
+            card_id=card_id,
+            user_id=user_id,
+            quality=quality,
+            reviewed_at=reviewed_at,
+            time_spent=time_spent,
+            ease_factor_before=ease_factor_before,
+            interval_before=interval_before,
+        )
+        self.session.add(review)
+        return review
+
     async def get_card_reviews(self, card_id: int, limit: int | None = None) -> list[Review]:
         """Get all reviews for a card.
 
@@ -71,6 +110,45 @@ class ReviewRepository(BaseRepository[Review]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_aggregates(
+        self,
+        user_id: int,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> tuple[int, int, int, int]:
+        """Summarize a user's reviews in one query.
+
+        Args:
+            user_id: User ID
+            start_date: Count reviews at or after this time
+            end_date: Count reviews before this time
+
+        Returns:
+            Tuple of (total reviews, correct reviews, total time in seconds,
+            number of distinct days with reviews)
+        """
+        # Postgres takes date() of a timestamptz in the session time zone; days
+        # are counted in UTC, like the UTC datetimes the bot stores
+        reviewed_at: SQLColumnExpression[datetime] = Review.reviewed_at
+        if self.session.get_bind().dialect.name == "postgresql":
+            reviewed_at = func.timezone("UTC", reviewed_at)
+
+        query = select(
+            func.count(),
+            func.count().filter(Review.quality >= 3),
+            func.coalesce(func.sum(Review.time_spent), 0),
+            func.count(func.distinct(func.date(reviewed_at))),
+        ).where(Review.user_id == user_id)
+
+        if start_date:
+            query = query.where(Review.reviewed_at >= start_date)
+        if end_date:
+            query = query.where(Review.reviewed_at < end_date)
+
+        result = await self.session.execute(query)
+        total, correct, total_time, days_active = result.one()
+        return total, correct, total_time, days_active
+
     async def get_daily_review_count(self, user_id: int, target_date: date | None = None) -> int:
         """Get number of reviews for a specific day.
 
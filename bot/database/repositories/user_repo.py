@@ -1,6 +1,7 @@
 """User repository."""
 
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database.models.user import User
@@ -51,36 +52,66 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Tuple of (User instance, created flag)
         """
+        # Existing users are the common case: one read, and a write only
+        # when their Telegram profile changed
         user = await self.get_by_telegram_id(telegram_id)
 
-        if user:
-            # Update user info if changed
-            updated = False
-            if username and user.username != username:
-                user.username = username
-                updated = True
-            if first_name and user.first_name != first_name:
-                user.first_name = first_name
-                updated = True
-            if last_name and user.last_name != last_name:
-                user.last_name = last_name
-                updated = True
-            if language_code and user.language_code != language_code:
-                user.language_code = language_code
-                updated = True
-
-            if updated:
-                await self.session.flush()
-                await self.session.refresh(user)
-
-            return user, False
-
-        # Create new user
-        user = await self.create(
-            telegram_id=telegram_id,
-            username=username,
-            first_name=first_name,
-            last_name=last_name,
-            language_code=language_code,
+        if user is None:
+            user = await self._insert_if_absent(
+                telegram_id=telegram_id,
+                username=username,
+                first_name=first_name,
+                last_name=last_name,
+                language_code=language_code,
+            )
+            if user is not None:
+                return user, True
+
+            # Another update from the same user created it concurrently
+            user = await self.get_by_telegram_id(telegram_id)
+            if user is None:
+                raise RuntimeError(f"User {telegram_id} was neither created nor found")
+
+        # Update user info if changed
+        changes = {
+            field: value
+            for field, value in (
+                ("username", username),
+                ("first_name", first_name),
+                ("last_name", last_name),
+                ("language_code", language_code),
+            )
+            if value and getattr(user, field) != value
+        }
+        if changes:
+            for field, value in changes.items():
+                setattr(user, field, value)
+            await self.session.flush()
+
+        return user, False
+
+    async def _insert_if_absent(self, telegram_id: int, **values: str | None) -> User | None:
+        """Insert a user unless one with the Telegram ID already exists.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING RETURNING, so concurrent
+        first messages from a new user cannot fail on the unique constraint.
+
+        Args:
+            telegram_id: Telegram user ID
+            **values: Other user columns
+
+        Returns:
+            Created user, or None if the user already existed
+        """
+        insert: postgresql.Insert | sqlite.Insert
+        if self.session.get_bind().dialect.name == "postgresql":
+            insert = postgresql.insert(User)
+        else:
+            insert = sqlite.insert(User)
+        query = (
+            insert.values(telegram_id=telegram_id, **values)
+            .on_conflict_do_nothing(index_elements=[User.telegram_id])
+            .returning(User)
         )
-        return user, True
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
@@ -1,6 +1,8 @@
 """AI assistant messages in Russian."""
 
-import html
+from html import escape as _esc
+
+from bot.utils.helpers import intern_constants
 
 MSG_AI_WELCOME = (
     "<b>ИИ-помощник по языку</b>\n\n"
@@ -27,7 +29,7 @@ def get_translation_result(translation: str) -> str:
     Returns:
         Formatted translation message
     """
-    return f"<b>Перевод:</b>\n\n{html.escape(translation)}"
+    return f"<b>Перевод:</b>\n\n{_esc(translation)}"
 
 
 def get_grammar_result(explanation: str) -> str:
@@ -39,7 +41,7 @@ def get_grammar_result(explanation: str) -> str:
     Returns:
         Formatted explanation message
     """
-    return f"<b>Грамматический разбор:</b>\n\n{html.escape(explanation)}"
+    return f"<b>Грамматический разбор:</b>\n\n{_esc(explanation)}"
 
 
 def get_ai_response(response: str) -> str:
@@ -51,7 +53,7 @@ def get_ai_response(response: str) -> str:
     Returns:
         Formatted AI response message
     """
-    return f"<b>ИИ-помощник:</b>\n\n{html.escape(response)}"
+    return f"<b>ИИ-помощник:</b>\n\n{_esc(response)}"
 
 
 def get_history_cleared_message(count: int) -> str:
@@ -76,3 +78,6 @@ MSG_AI_CONNECTION_ERROR = (
 )
 MSG_AI_SERVICE_ERROR = "Ошибка сервиса ИИ. Попробуй позже."
 MSG_AI_UNEXPECTED_ERROR = "Произошла неожиданная ошибка. Попробуй позже."
+
+
+intern_constants(globals())
@@ -1,6 +1,8 @@
 """Card management messages in Russian."""
 
-import html
+from html import escape as _esc
+
+from bot.utils.helpers import intern_constants
 
 # Card list messages
 MSG_NO_DECKS_FOR_CARD = "У тебя пока нет колод.\n\nСначала создай колоду через <b>Мои колоды</b>."
@@ -43,7 +45,7 @@ def get_card_step_2(front: str) -> str:
         Step 2 message
     """
     return (
-        f"Лицевая сторона: <b>{html.escape(front)}</b>\n\n"
+        f"Лицевая сторона: <b>{_esc(front)}</b>\n\n"
         f"<b>Создание карточки - Шаг 2/3</b>\n\n"
         f"Введи <b>русский перевод</b> (обратная сторона карточки):"
     )
@@ -60,8 +62,8 @@ def get_card_step_3(front: str, back: str) -> str:
         Step 3 message
     """
     return (
-        f"Лицевая сторона: <b>{html.escape(front)}</b>\n"
-        f"Обратная сторона: <b>{html.escape(back)}</b>\n\n"
+        f"Лицевая сторона: <b>{_esc(front)}</b>\n"
+        f"Обратная сторона: <b>{_esc(back)}</b>\n\n"
         f"<b>Создание карточки - Шаг 3/3</b>\n\n"
         f"Введи <b>пример использования</b> (или отправь /skip):"
     )
@@ -78,11 +80,11 @@ def get_card_created_message(front: str, back: str, example: str | None) -> str:
     Returns:
         Success message
     """
-    example_text = html.escape(example) if example else "Нет"
+    example_text = _esc(example) if example else "Нет"
     return (
         f"<b>Карточка успешно создана!</b>\n\n"
-        f"<b>Лицевая сторона:</b> {html.escape(front)}\n"
-        f"<b>Обратная сторона:</b> {html.escape(back)}\n"
+        f"<b>Лицевая сторона:</b> {_esc(front)}\n"
+        f"<b>Обратная сторона:</b> {_esc(back)}\n"
         f"<b>Пример:</b> {example_text}"
     )
 
@@ -111,11 +113,11 @@ def get_ai_card_created_message(front: str, back: str, example: str | None) -> s
     Returns:
         Success message
     """
-    example_text = html.escape(example) if example else "Нет"
+    example_text = _esc(example) if example else "Нет"
     return (
         f"<b>Карточка создана с помощью ИИ!</b>\n\n"
-        f"<b>Лицевая сторона:</b> {html.escape(front)}\n"
-        f"<b>Обратная сторона:</b> {html.escape(back)}\n"
+        f"<b>Лицевая сторона:</b> {_esc(front)}\n"
+        f"<b>Обратная сторона:</b> {_esc(back)}\n"
         f"<b>Пример:</b> {example_text}"
     )
 
@@ -137,11 +139,11 @@ def get_card_details_message(
     Returns:
         Details message
     """
-    example_text = html.escape(example) if example else "Нет"
+    example_text = _esc(example) if example else "Нет"
     return (
         f"<b>Детали карточки</b>\n\n"
-        f"<b>Лицевая сторона:</b> {html.escape(front)}\n"
-        f"<b>Обратная сторона:</b> {html.escape(back)}\n"
+        f"<b>Лицевая сторона:</b> {_esc(front)}\n"
+        f"<b>Обратная сторона:</b> {_esc(back)}\n"
         f"<b>Пример:</b> {example_text}\n\n"
         f"<b>Статистика:</b>\n"
         f"- Повторений: {reviews}\n"
@@ -173,12 +175,12 @@ def get_edit_step_1(front: str, back: str, example: str | None) -> str:
     Returns:
         Edit step 1 message
     """
-    example_text = html.escape(example) if example else "Нет"
+    example_text = _esc(example) if example else "Нет"
     return (
         f"<b>Редактирование карточки</b>\n\n"
         f"<b>Текущие данные:</b>\n"
-        f"- Лицевая сторона: {html.escape(front)}\n"
-        f"- Обратная сторона: {html.escape(back)}\n"
+        f"- Лицевая сторона: {_esc(front)}\n"
+        f"- Обратная сторона: {_esc(back)}\n"
         f"- Пример: {example_text}\n\n"
         f"<b>Шаг 1/3:</b> Введи новую <b>лицевую сторону</b>\n"
         f"(или отправь /skip чтобы оставить текущую):"
@@ -196,7 +198,7 @@ def get_edit_step_2(front: str) -> str:
     """
     return (
         f"<b>Редактирование карточки</b>\n\n"
-        f"Новая лицевая сторона: <b>{html.escape(front)}</b>\n\n"
+        f"Новая лицевая сторона: <b>{_esc(front)}</b>\n\n"
         f"<b>Шаг 2/3:</b> Введи новую <b>обратную сторону</b>\n"
         f"(или отправь /skip чтобы оставить текущую):"
     )
@@ -214,8 +216,8 @@ def get_edit_step_3(front: str, back: str) -> str:
     """
     return (
         f"<b>Редактирование карточки</b>\n\n"
-        f"Лицевая сторона: <b>{html.escape(front)}</b>\n"
-        f"Обратная сторона: <b>{html.escape(back)}</b>\n\n"
+        f"Лицевая сторона: <b>{_esc(front)}</b>\n"
+        f"Обратная сторона: <b>{_esc(back)}</b>\n\n"
         f"<b>Шаг 3/3:</b> Введи новый <b>пример использования</b>\n"
         f"(или отправь /skip чтобы оставить текущий, /clear чтобы удалить):"
     )
@@ -232,11 +234,11 @@ def get_card_updated_message(front: str, back: str, example: str | None) -> str:
     Returns:
         Success message
     """
-    example_text = html.escape(example) if example else "Нет"
+    example_text = _esc(example) if example else "Нет"
     return (
         f"<b>Карточка обновлена!</b>\n\n"
-        f"<b>Лицевая сторона:</b> {html.escape(front)}\n"
-        f"<b>Обратная сторона:</b> {html.escape(back)}\n"
+        f"<b>Лицевая сторона:</b> {_esc(front)}\n"
+        f"<b>Обратная сторона:</b> {_esc(back)}\n"
         f"<b>Пример:</b> {example_text}"
     )
 
@@ -255,10 +257,13 @@ def get_delete_confirm_message(front: str, back: str) -> str:
     return (
         f"<b>Удаление карточки</b>\n\n"
         f"Ты уверен, что хочешь удалить карточку?\n\n"
-        f"<b>Лицевая сторона:</b> {html.escape(front)}\n"
-        f"<b>Обратная сторона:</b> {html.escape(back)}\n\n"
+        f"<b>Лицевая сторона:</b> {_esc(front)}\n"
+        f"<b>Обратная сторона:</b> {_esc(back)}\n\n"
         f"<i>Это действие нельзя отменить.</i>"
     )
 
 
 MSG_CARD_DELETED = "Карточка успешно удалена."
+
+
+intern_constants(globals())
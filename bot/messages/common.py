@@ -1,5 +1,7 @@
 """Common messages and button labels in Russian."""
 
+from bot.utils.helpers import intern_constants
+
 # Main menu buttons
 BTN_MY_DECKS = "Мои колоды"
 BTN_LEARN = "Учить"
@@ -18,3 +20,6 @@ MSG_CANCEL_ACTION = "Действие отменено."
 MSG_INVALID_DATA = "Неверные данные"
 MSG_ERROR_GENERIC = "Произошла ошибка при обработке запроса.\nПожалуйста, попробуйте позже."
 MSG_ERROR_CALLBACK = "Произошла ошибка. Попробуйте снова."
+
+
+intern_constants(globals())
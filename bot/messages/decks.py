@@ -1,6 +1,8 @@
 """Deck management messages in Russian."""
 
-import html
+from html import escape as _esc
+
+from bot.utils.helpers import intern_constants
 
 # Deck list messages
 MSG_NO_DECKS = "<b>У тебя пока нет колод.</b>\n\nСоздай первую колоду, чтобы начать обучение!"
@@ -34,7 +36,7 @@ def get_deck_name_confirm(name: str) -> str:
         Confirmation message
     """
     return (
-        f"Название колоды: <b>{html.escape(name)}</b>\n\n"
+        f"Название колоды: <b>{_esc(name)}</b>\n\n"
         f"Теперь введи описание (или отправь /skip, чтобы пропустить):"
     )
 
@@ -49,10 +51,10 @@ def get_deck_created_message(name: str, description: str | None) -> str:
     Returns:
         Success message
     """
-    desc_text = html.escape(description) if description else "Нет описания"
+    desc_text = _esc(description) if description else "Нет описания"
     return (
         f"<b>Колода успешно создана!</b>\n\n"
-        f"<b>Название:</b> {html.escape(name)}\n"
+        f"<b>Название:</b> {_esc(name)}\n"
         f"<b>Описание:</b> {desc_text}"
     )
 
@@ -69,9 +71,9 @@ def get_deck_details_message(name: str, description: str | None, card_count: int
     Returns:
         Details message
     """
-    desc_text = html.escape(description) if description else "Нет описания"
+    desc_text = _esc(description) if description else "Нет описания"
     return (
-        f"<b>{html.escape(name)}</b>\n\n"
+        f"<b>{_esc(name)}</b>\n\n"
         f"<b>Описание:</b> {desc_text}\n"
         f"<b>Карточек:</b> {card_count}\n\n"
         f"Что хочешь сделать?"
@@ -90,7 +92,7 @@ def get_deck_delete_confirm_message(name: str) -> str:
     """
     return (
         f"<b>Удалить колоду?</b>\n\n"
-        f"Ты уверен, что хочешь удалить <b>{html.escape(name)}</b>?\n"
+        f"Ты уверен, что хочешь удалить <b>{_esc(name)}</b>?\n"
         f"Все карточки в этой колоде тоже будут удалены!\n\n"
         f"Это действие нельзя отменить."
     )
@@ -105,7 +107,7 @@ def get_deck_deleted_message(name: str) -> str:
     Returns:
         Deleted message
     """
-    return f"Колода <b>{html.escape(name)}</b> удалена."
+    return f"Колода <b>{_esc(name)}</b> удалена."
 
 
 # Deck keyboard button labels
@@ -155,5 +157,8 @@ def get_deck_toggle_message(name: str, is_now_active: bool) -> str:
         Toggle confirmation message
     """
     if is_now_active:
-        return MSG_DECK_ENABLED.format(name=html.escape(name))
-    return MSG_DECK_DISABLED.format(name=html.escape(name))
+        return MSG_DECK_ENABLED.format(name=_esc(name))
+    return MSG_DECK_DISABLED.format(name=_esc(name))
+
+
+intern_constants(globals())
@@ -1,8 +1,9 @@
 """Exercise session messages in Russian."""
 
-import html
+from html import escape as _esc
 
 from bot.messages.common import BTN_EXERCISES  # noqa: F401 - re-export for convenience
+from bot.utils.helpers import intern_constants
 
 # Exercise type selection
 MSG_SELECT_EXERCISE_TYPE = (
@@ -58,10 +59,10 @@ def get_task_message(
 
     return (
         f"<code>{stats}</code>\n\n"
-        f"<b>Слово:</b> {html.escape(word)}\n"
-        f"<b>Перевод:</b> {html.escape(translation)}\n\n"
-        f"<b>Задание:</b> {html.escape(task_text)}\n"
-        f"<code>{html.escape(task_hint)}</code>\n\n"
+        f"<b>Слово:</b> {_esc(word)}\n"
+        f"<b>Перевод:</b> {_esc(translation)}\n\n"
+        f"<b>Задание:</b> {_esc(task_text)}\n"
+        f"<code>{_esc(task_hint)}</code>\n\n"
         f"Напиши ответ:"
     )
 
@@ -75,7 +76,7 @@ def get_correct_answer_message(feedback: str) -> str:
     Returns:
         Correct answer message
     """
-    return f"<b>Правильно!</b>\n\n{html.escape(feedback)}"
+    return f"<b>Правильно!</b>\n\n{_esc(feedback)}"
 
 
 def get_incorrect_answer_message(
@@ -93,8 +94,8 @@ def get_incorrect_answer_message(
     """
     return (
         f"<b>Неправильно</b>\n\n"
-        f"<b>Правильный ответ:</b> {html.escape(correct_answer)}\n\n"
-        f"{html.escape(feedback)}"
+        f"<b>Правильный ответ:</b> {_esc(correct_answer)}\n\n"
+        f"{_esc(feedback)}"
     )
 
 
@@ -118,9 +119,9 @@ def get_shown_answer_message(
     Returns:
         Shown answer message
     """
-    text = f"<b>Ответ:</b> {html.escape(correct_answer)}\n\n"
+    text = f"<b>Ответ:</b> {_esc(correct_answer)}\n\n"
     if feedback:
-        text += f"{html.escape(feedback)}"
+        text += f"{_esc(feedback)}"
     return text
 
 
@@ -172,3 +173,6 @@ EXERCISE_TYPE_LABELS = {
     "conjugations": "Спряжение",
     "cases": "Падежи",
 }
+
+
+intern_constants(globals())
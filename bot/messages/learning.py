@@ -1,6 +1,8 @@
 """Learning session messages in Russian."""
 
-import html
+from html import escape as _esc
+
+from bot.utils.helpers import intern_constants
 
 # Direction indicators for card display
 DIRECTION_GREEK_TO_RUSSIAN = "EL -> RU"
@@ -44,7 +46,7 @@ def get_card_front_message(progress: str, question: str, direction: str) -> str:
     """
     return (
         f"<b>Сессия обучения</b> ({progress}) <code>{direction}</code>\n\n"
-        f"<b>Вопрос:</b>\n{html.escape(question)}\n\n"
+        f"<b>Вопрос:</b>\n{_esc(question)}\n\n"
         f"Подумай над ответом, затем нажми 'Показать ответ'."
     )
 
@@ -66,11 +68,11 @@ def get_card_answer_message(
     """
     text = (
         f"<b>Сессия обучения</b> ({progress}) <code>{direction}</code>\n\n"
-        f"<b>Вопрос:</b>\n{html.escape(question)}\n\n"
-        f"<b>Ответ:</b>\n{html.escape(answer)}\n\n"
+        f"<b>Вопрос:</b>\n{_esc(question)}\n\n"
+        f"<b>Ответ:</b>\n{_esc(answer)}\n\n"
     )
     if example:
-        text += f"<b>Пример:</b>\n{html.escape(example)}\n\n"
+        text += f"<b>Пример:</b>\n{_esc(example)}\n\n"
     text += "Насколько хорошо ты знал ответ?"
     return text
 
@@ -108,3 +110,6 @@ BTN_EASY = "Легко"
 BTN_CONTINUE_LEARNING = "Продолжить обучение"
 BTN_VIEW_STATISTICS = "Статистика"
 BTN_MAIN_MENU = "Главное меню"
+
+
+intern_constants(globals())
@@ -1,6 +1,8 @@
 """Photo text recognition messages in Russian."""
 
-import html
+from html import escape as _esc
+
+from bot.utils.helpers import intern_constants
 
 # Processing messages
 MSG_PROCESSING_IMAGE = "Обрабатываю изображение..."
@@ -41,11 +43,11 @@ def format_photo_result(
     Returns:
         Formatted message
     """
-    result = MSG_TEXT_RECOGNIZED.format(text=html.escape(recognized_text))
-    result += MSG_TRANSLATION.format(translation=html.escape(translation))
+    result = MSG_TEXT_RECOGNIZED.format(text=_esc(recognized_text))
+    result += MSG_TRANSLATION.format(translation=_esc(translation))
 
     if prompt_response:
-        result += MSG_PROMPT_RESPONSE.format(response=html.escape(prompt_response))
+        result += MSG_PROMPT_RESPONSE.format(response=_esc(prompt_response))
 
     return result
 
@@ -60,14 +62,15 @@ def split_long_message(text: str, max_length: int = 4000) -> list[str]:
     Returns:
         List of message chunks
     """
-    if len(text) <= max_length:
+    _len = len
+    if _len(text) <= max_length:
         return [text]
 
     chunks = []
     current_chunk = ""
 
     for paragraph in text.split("\n\n"):
-        if len(current_chunk) + len(paragraph) + 2 > max_length:
+        if _len(current_chunk) + _len(paragraph) + 2 > max_length:
             if current_chunk:
                 chunks.append(current_chunk.strip())
             current_chunk = paragraph
@@ -78,3 +81,6 @@ def split_long_message(text: str, max_length: int = 4000) -> list[str]:
         chunks.append(current_chunk.strip())
 
     return chunks
+
+
+intern_constants(globals())
@@ -1,6 +1,8 @@
 """Start and help messages in Russian."""
 
-import html
+from html import escape as _esc
+
+from bot.utils.helpers import intern_constants
 
 
 def get_welcome_message(first_name: str, is_new_user: bool) -> str:
@@ -13,7 +15,7 @@ def get_welcome_message(first_name: str, is_new_user: bool) -> str:
     Returns:
         Welcome message text
     """
-    escaped_name = html.escape(first_name)
+    escaped_name = _esc(first_name)
     if is_new_user:
         return (
             f"<b>Добро пожаловать в бот для изучения греческого, {escaped_name}!</b>\n\n"
@@ -49,3 +51,6 @@ HELP_TEXT = (
     "/start - Запустить бота\n"
     "/help - Показать справку"
 )
+
+
+intern_constants(globals())
@@ -1,5 +1,28 @@
 """Statistics messages in Russian."""
 
+from bot.utils.helpers import intern_constants
+
+ZERO_MINUTES = "0мин"
+
+MSG_STATISTICS = (
+    "<b>Твоя статистика обучения</b>\n\n"
+    "<b>Всего:</b>\n"
+    "- Повторений: {total_reviews}\n"
+    "- Точность: {accuracy:.1f}%\n"
+    "- Время обучения: {total_time}\n"
+    "- Текущая серия: {current_streak} дней\n"
+    "- Дней активности: {total_days_active}\n\n"
+    "<b>Сегодня:</b>\n"
+    "- Повторений: {daily_reviews}\n"
+    "- Точность: {daily_accuracy:.1f}%\n"
+    "- Время обучения: {daily_time}\n\n"
+    "<b>На этой неделе:</b>\n"
+    "- Всего повторений: {weekly_reviews}\n"
+    "- В среднем в день: {weekly_avg_daily:.1f}\n"
+    "- Дней активности: {weekly_days_active}/7\n"
+    "- Время обучения: {weekly_time}"
+)
+
 
 def format_time(seconds: int) -> str:
     """Format seconds into human readable time.
@@ -10,11 +33,11 @@ def format_time(seconds: int) -> str:
     Returns:
         Formatted time string
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    if hours > 0:
-        return f"{hours}ч {minutes}мин"
-    return f"{minutes}мин"
+    if seconds < 60:
+        return ZERO_MINUTES
+    hours, remainder = divmod(seconds, 3600)
+    minutes = remainder // 60
+    return f"{hours}ч {minutes}мин" if hours else f"{minutes}мин"
 
 
 def get_statistics_message(
@@ -50,21 +73,20 @@ def get_statistics_message(
     Returns:
         Formatted statistics message
     """
-    return (
-        "<b>Твоя статистика обучения</b>\n\n"
-        "<b>Всего:</b>\n"
-        f"- Повторений: {total_reviews}\n"
-        f"- Точность: {accuracy:.1f}%\n"
-        f"- Время обучения: {format_time(total_time_seconds)}\n"
-        f"- Текущая серия: {current_streak} дней\n"
-        f"- Дней активности: {total_days_active}\n\n"
-        "<b>Сегодня:</b>\n"
-        f"- Повторений: {daily_reviews}\n"
-        f"- Точность: {daily_accuracy:.1f}%\n"
-        f"- Время обучения: {format_time(daily_time_seconds)}\n\n"
-        "<b>На этой неделе:</b>\n"
-        f"- Всего повторений: {weekly_reviews}\n"
-        f"- В среднем в день: {weekly_avg_daily:.1f}\n"
-        f"- Дней активности: {weekly_days_active}/7\n"
-        f"- Время обучения: {format_time(weekly_time_seconds)}"
+    return MSG_STATISTICS.format(
+        total_reviews=total_reviews,
+        accuracy=accuracy,
+        total_time=format_time(total_time_seconds),
+        current_streak=current_streak,
+        total_days_active=total_days_active,
+        daily_reviews=daily_reviews,
+        daily_accuracy=daily_accuracy,
+        daily_time=format_time(daily_time_seconds),
+        weekly_reviews=weekly_reviews,
+        weekly_avg_daily=weekly_avg_daily,
+        weekly_days_active=weekly_days_active,
+        weekly_time=format_time(weekly_time_seconds),
     )
+
+
+intern_constants(globals())
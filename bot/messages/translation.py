@@ -1,6 +1,8 @@
 """Translation feature messages in Russian."""
 
-import html
+from html import escape as _esc
+
+from bot.utils.helpers import intern_constants
 
 # Processing messages
 MSG_TRANSLATING = "Перевожу..."
@@ -71,11 +73,11 @@ def get_card_exists_message(translation: str, deck_name: str, count: int = 1) ->
     """
     if count == 1:
         return MSG_CARD_EXISTS_SINGLE.format(
-            translation=html.escape(translation),
-            deck_name=html.escape(deck_name),
+            translation=_esc(translation),
+            deck_name=_esc(deck_name),
         )
     return MSG_CARD_EXISTS_MULTIPLE.format(
-        translation=html.escape(translation),
+        translation=_esc(translation),
         count=count,
     )
 
@@ -93,9 +95,9 @@ def get_translation_with_add_option(
     Returns:
         Formatted message
     """
-    msg = MSG_TRANSLATION_WITH_ADD.format(translation=html.escape(translation))
+    msg = MSG_TRANSLATION_WITH_ADD.format(translation=_esc(translation))
     if suggested_deck_name:
-        msg += MSG_SUGGESTED_DECK.format(deck_name=html.escape(suggested_deck_name))
+        msg += MSG_SUGGESTED_DECK.format(deck_name=_esc(suggested_deck_name))
     return msg
 
 
@@ -111,9 +113,9 @@ def get_card_added_message(front: str, back: str, deck_name: str) -> str:
         Formatted message
     """
     return MSG_CARD_ADDED.format(
-        front=html.escape(front),
-        back=html.escape(back),
-        deck_name=html.escape(deck_name),
+        front=_esc(front),
+        back=_esc(back),
+        deck_name=_esc(deck_name),
     )
 
 
@@ -129,9 +131,9 @@ def get_deck_created_message(front: str, back: str, deck_name: str) -> str:
         Formatted message
     """
     return MSG_DECK_CREATED_AND_CARD_ADDED.format(
-        front=html.escape(front),
-        back=html.escape(back),
-        deck_name=html.escape(deck_name),
+        front=_esc(front),
+        back=_esc(back),
+        deck_name=_esc(deck_name),
     )
 
 
@@ -153,14 +155,17 @@ def get_sentence_feedback_message(
         Formatted feedback message
     """
     if is_correct:
-        return MSG_SENTENCE_CORRECT.format(translation=html.escape(translation))
+        return MSG_SENTENCE_CORRECT.format(translation=_esc(translation))
 
     if error_description and corrected_sentence:
         return MSG_SENTENCE_WITH_ERRORS.format(
-            error_description=html.escape(error_description),
-            corrected_sentence=html.escape(corrected_sentence),
-            translation=html.escape(translation),
+            error_description=_esc(error_description),
+            corrected_sentence=_esc(corrected_sentence),
+            translation=_esc(translation),
         )
 
     # Fallback if analysis data is missing
-    return MSG_SENTENCE_TRANSLATION_ONLY.format(translation=html.escape(translation))
+    return MSG_SENTENCE_TRANSLATION_ONLY.format(translation=_esc(translation))
+
+
+intern_constants(globals())
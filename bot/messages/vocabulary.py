@@ -1,6 +1,10 @@
 """Vocabulary extraction feature messages in Russian."""
 
-import html
+import sys
+from html import escape as _esc
+from types import MappingProxyType
+
+from bot.utils.helpers import intern_constants
 
 # Button labels
 BTN_LEARN_WORDS = "Изучить слова из фразы"
@@ -70,16 +74,23 @@ MSG_DECK_CREATED = (
     "<b>{front}</b> - {back}"
 )
 
-# Part of speech names
-POS_NAMES = {
-    "noun": "существительное",
-    "verb": "глагол",
-    "adjective": "прилагательное",
-    "adverb": "наречие",
-    "pronoun": "местоимение",
-    "numeral": "числительное",
-    "unknown": "неизвестно",
-}
+# Part of speech names (read-only)
+POS_NAMES = MappingProxyType(
+    {
+        sys.intern(name): sys.intern(label)
+        for name, label in {
+            "noun": "существительное",
+            "verb": "глагол",
+            "adjective": "прилагательное",
+            "adverb": "наречие",
+            "pronoun": "местоимение",
+            "numeral": "числительное",
+            "unknown": "неизвестно",
+        }.items()
+    }
+)
+_POS_NAMES_GET = POS_NAMES.get
+_format_word_selection = MSG_WORD_SELECTION.format_map
 
 
 def get_translation_with_vocabulary(translation: str, new_words_count: int) -> str:
@@ -93,7 +104,7 @@ def get_translation_with_vocabulary(translation: str, new_words_count: int) -> s
         Formatted message
     """
     return MSG_TRANSLATION_WITH_VOCAB.format(
-        translation=html.escape(translation),
+        translation=_esc(translation),
         count=new_words_count,
     )
 
@@ -119,13 +130,15 @@ def get_word_selection_message(
     Returns:
         Formatted message
     """
-    return MSG_WORD_SELECTION.format(
-        current=current_index,
-        total=total_count,
-        lemma=html.escape(lemma),
-        translation=html.escape(translation),
-        original=html.escape(original),
-        pos=POS_NAMES.get(pos, pos),
+    return _format_word_selection(
+        {
+            "current": current_index,
+            "total": total_count,
+            "lemma": _esc(lemma),
+            "translation": _esc(translation),
+            "original": _esc(original),
+            "pos": _POS_NAMES_GET(pos, pos),
+        }
     )
 
 
@@ -140,8 +153,8 @@ def get_deck_selection_for_word(lemma: str, translation: str) -> str:
         Formatted message
     """
     return MSG_DECK_SELECTION_FOR_WORD.format(
-        lemma=html.escape(lemma),
-        translation=html.escape(translation),
+        lemma=_esc(lemma),
+        translation=_esc(translation),
     )
 
 
@@ -157,9 +170,9 @@ def get_word_added_final_message(front: str, back: str, deck_name: str) -> str:
         Formatted message
     """
     return MSG_WORD_ADDED.format(
-        front=html.escape(front),
-        back=html.escape(back),
-        deck=html.escape(deck_name),
+        front=_esc(front),
+        back=_esc(back),
+        deck=_esc(deck_name),
     )
 
 
@@ -187,13 +200,13 @@ def get_word_added_continue_message(
         Formatted message
     """
     return MSG_WORD_ADDED_CONTINUE.format(
-        front=html.escape(added_front),
-        deck=html.escape(deck_name),
+        front=_esc(added_front),
+        deck=_esc(deck_name),
         current=current_index,
         total=total_count,
-        lemma=html.escape(next_lemma),
-        translation=html.escape(next_translation),
-        original=html.escape(next_original),
+        lemma=_esc(next_lemma),
+        translation=_esc(next_translation),
+        original=_esc(next_original),
     )
 
 
@@ -209,7 +222,10 @@ def get_deck_created_message(front: str, back: str, deck_name: str) -> str:
         Formatted message
     """
     return MSG_DECK_CREATED.format(
-        front=html.escape(front),
-        back=html.escape(back),
-        deck_name=html.escape(deck_name),
+        front=_esc(front),
+        back=_esc(back),
+        deck_name=_esc(deck_name),
     )
+
+
+intern_constants(globals())
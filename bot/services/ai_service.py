@@ -1,13 +1,31 @@
 """AI service for OpenAI integration."""
 
-import json
-from dataclasses import dataclass
-
-from openai import APIConnectionError, APIError, APITimeoutError, AsyncOpenAI, RateLimitError
+import asyncio
+import base64
+import copy
+import functools
+import hashlib
+import re
+import unicodedata
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar, cast
+
+import numpy as np
+import orjson
 
 from bot.config.logging_config import get_logger
 from bot.config.settings import settings
+from bot.database.engine import get_session
+from bot.database.repositories.ai_cache_repo import AICacheRepository
+from bot.database.repositories.ai_semantic_cache_repo import AISemanticCacheRepository
 from bot.messages import ai as ai_messages
+from bot.utils.batching import MicroBatcher
+from bot.utils.cache import TTLCache
+from bot.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from bot.utils.rate_limit import AsyncTokenBucket
+from bot.utils.semantic_cache import SemanticCache
 
 
 @dataclass
@@ -22,6 +40,109 @@ class ImageTextResult:
 
 logger = get_logger(__name__)
 
+# The openai SDK pulls in pydantic, httpx and anyio, so it is imported on
+# first AIService construction instead of at module import time.
+AsyncOpenAI: Any = None
+APIConnectionError: Any = None
+APIError: Any = None
+APITimeoutError: Any = None
+InternalServerError: Any = None
+RateLimitError: Any = None
+
+_Method = TypeVar("_Method", bound=Callable[..., Awaitable[Any]])
+_T = TypeVar("_T")
+
+
+def _load_openai() -> None:
+    """Import the OpenAI client and exception classes on first use."""
+    global AsyncOpenAI, APIConnectionError, APIError, APITimeoutError, InternalServerError
+    global RateLimitError
+    if AsyncOpenAI is not None:
+        return
+
+    import openai
+
+    AsyncOpenAI = openai.AsyncOpenAI
+    APIConnectionError = openai.APIConnectionError
+    APIError = openai.APIError
+    APITimeoutError = openai.APITimeoutError
+    InternalServerError = openai.InternalServerError
+    RateLimitError = openai.RateLimitError
+
+
+# Process-wide OpenAI client, shared so that connections are pooled
+_client: Any = None
+
+
+def get_openai_client() -> Any:
+    """Get or create the shared OpenAI client.
+
+    Returns:
+        AsyncOpenAI client backed by a pooled aiohttp transport
+    """
+    global _client
+
+    if _client is None:
+        _load_openai()
+        import httpx
+        import openai
+
+        _client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            timeout=settings.openai_timeout,
+            # The SDK retries 429, 5xx, timeouts and connection errors with
+            # jittered exponential backoff and honours Retry-After
+            max_retries=settings.openai_max_retries,
+            http_client=openai.DefaultAioHttpClient(
+                limits=httpx.Limits(
+                    max_connections=settings.openai_max_connections,
+                    max_keepalive_connections=settings.openai_max_keepalive_connections,
+                ),
+            ),
+        )
+        logger.info("OpenAI client created")
+
+    return _client
+
+
+async def prewarm_openai_client() -> None:
+    """Open a pooled connection to OpenAI ahead of the first user request.
+
+    Sends a cheap model lookup so that the TCP and TLS handshakes are done
+    at startup. Failures are logged and otherwise ignored.
+    """
+    try:
+        await get_openai_client().models.retrieve(settings.openai_model)
+        logger.info("OpenAI connection pool warmed up")
+    except Exception as e:
+        logger.warning("Failed to warm up OpenAI connection: %s", e)
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI client and its connection pool."""
+    global _client, _service
+
+    _service = None
+    if _client is not None:
+        await _client.close()
+        _client = None
+        logger.info("OpenAI client closed")
+
+
+async def purge_expired_ai_cache() -> int:
+    """Delete expired entries from the persistent AI caches.
+
+    Returns:
+        Number of entries deleted
+    """
+    async with get_session() as session:
+        deleted = await AICacheRepository(session).delete_expired()
+        deleted += await AISemanticCacheRepository(session).delete_expired()
+
+    logger.info("Purged %s expired AI cache entries", deleted)
+    return deleted
+
+
 # Prompts for message categorization
 CATEGORIZATION_SYSTEM_PROMPT = """Ты - классификатор сообщений для бота изучения греческого языка.
 Твоя задача - определить намерение пользователя и извлечь необходимые данные.
@@ -44,26 +165,36 @@ CATEGORIZATION_SYSTEM_PROMPT = """Ты - классификатор сообще
 - Если пользователь написал несколько слов без вопроса о языке - это text_translation
 - Если пользователь задает вопрос о правилах языка - это language_question
 
-Отвечай СТРОГО в формате JSON без дополнительного текста."""
-
-CATEGORIZATION_USER_PROMPT = """Проанализируй сообщение пользователя и определи его намерение.
-
-Сообщение: {message}
-
-Ответь в формате JSON:
-{{
+ФОРМАТ ОТВЕТА (JSON):
+{
     "category": "word_translation" | "text_translation" | "language_question" | "unknown",
     "confidence": 0.0-1.0,
     "extracted_content": "слово или текст для перевода / вопрос пользователя",
     "source_language": "greek" | "russian" | null,
     "topic": "grammar" | "vocabulary" | "pronunciation" | "usage" | null
-}}
+}
+
+ПРИМЕРЫ:
+- "спити" -> {"category": "word_translation", "confidence": 0.95, "extracted_content": "спити", "source_language": "greek", "topic": null}
+- "как переводится дом" -> {"category": "word_translation", "confidence": 0.95, "extracted_content": "дом", "source_language": "russian", "topic": null}
+- "переведи 'я иду домой'" -> {"category": "text_translation", "confidence": 0.90, "extracted_content": "я иду домой", "source_language": "russian", "topic": null}
+- "когда использовать о а когда и" -> {"category": "language_question", "confidence": 0.90, "extracted_content": "когда использовать о а когда и", "source_language": null, "topic": "grammar"}
+
+Отвечай СТРОГО в формате JSON без дополнительного текста."""
+
+CATEGORIZATION_USER_PROMPT = """Проанализируй сообщение пользователя и определи его намерение.
 
-Примеры:
-- "спити" -> {{"category": "word_translation", "confidence": 0.95, "extracted_content": "спити", "source_language": "greek", "topic": null}}
-- "как переводится дом" -> {{"category": "word_translation", "confidence": 0.95, "extracted_content": "дом", "source_language": "russian", "topic": null}}
-- "переведи 'я иду домой'" -> {{"category": "text_translation", "confidence": 0.90, "extracted_content": "я иду домой", "source_language": "russian", "topic": null}}
-- "когда использовать о а когда и" -> {{"category": "language_question", "confidence": 0.90, "extracted_content": "когда использовать о а когда и", "source_language": null, "topic": "grammar"}}"""
+Сообщение: {message}"""
+
+CATEGORIZATION_BATCH_USER_PROMPT = """Проанализируй каждое сообщение из нумерованного списка \
+и определи намерение пользователя.
+
+Сообщения:
+{items}
+
+Ответь JSON-объектом {{"results": [...]}}, где results - список ответов в указанном выше \
+формате, по одному на каждое сообщение, в том же порядке. В каждый ответ добавь поле \
+"number" с номером сообщения из списка."""
 
 WORD_EXTRACTION_SYSTEM_PROMPT = """Ты - лингвистический анализатор греческого языка.
 Твоя задача - извлекать из фразы ТОЛЬКО значимые слова (content words) и приводить их к словарной форме.
@@ -130,23 +261,23 @@ SENTENCE_ANALYSIS_SYSTEM_PROMPT = """Ты - эксперт по греческо
 - Всегда давай перевод на целевой язык
 - Для греческих существительных указывай артикль
 
-Отвечай СТРОГО в формате JSON."""
-
-SENTENCE_ANALYSIS_USER_PROMPT = """Проанализируй предложение на {source_lang} и переведи на {target_lang}.
-
-Предложение: {sentence}
-
-Ответь в формате JSON:
-{{
+ФОРМАТ ОТВЕТА (JSON):
+{
     "is_correct": true/false,
     "error_description": "краткое описание ошибки на русском" | null,
     "corrected_sentence": "исправленное предложение" | null,
-    "translation": "перевод на {target_lang}"
-}}
+    "translation": "перевод на целевой язык"
+}
+
+ПРИМЕРЫ:
+- Правильное: {"is_correct": true, "error_description": null, "corrected_sentence": null, "translation": "перевод"}
+- С ошибкой: {"is_correct": false, "error_description": "Ошибка в согласовании прилагательного.", "corrected_sentence": "исправленный вариант", "translation": "перевод исправленного"}
+
+Отвечай СТРОГО в формате JSON."""
+
+SENTENCE_ANALYSIS_USER_PROMPT = """Проанализируй предложение на {source_lang} и переведи на {target_lang}.
 
-Примеры:
-- Правильное: {{"is_correct": true, "error_description": null, "corrected_sentence": null, "translation": "перевод"}}
-- С ошибкой: {{"is_correct": false, "error_description": "Ошибка в согласовании прилагательного.", "corrected_sentence": "исправленный вариант", "translation": "перевод исправленного"}}"""
+Предложение: {sentence}"""
 
 # Prompt for photo text recognition
 PHOTO_TEXT_SYSTEM_PROMPT = """Ты - ассистент для изучения греческого языка.
@@ -173,23 +304,662 @@ PHOTO_TEXT_SYSTEM_PROMPT = """Ты - ассистент для изучения
 }
 
 ВАЖНО:
-- Если греческого текста нет, установи has_greek_text: false
+- Если греческого текста нет, верни только {"has_greek_text": false} без других полей
 - Для существительных указывай артикли при переводе
 - Если пользователь просит проверить домашнее задание, дай подробный feedback об ошибках
 - Если просят объяснить грамматику, дай подробное объяснение
 - Если просят выполнить упражнение, выполни его и объясни решение"""
 
+PHOTO_TEXT_USER_PROMPT = "Запрос пользователя: {user_prompt}"
+
+PHOTO_TEXT_DEFAULT_USER_PROMPT = "Распознай греческий текст на изображении и переведи на русский."
+
+# System prompts for free-form requests
+ASSISTANT_SYSTEM_PROMPT = (
+    "Ты - полезный ассистент для изучения греческого языка. "
+    "Помогай пользователям учить греческий: отвечай на вопросы, объясняй грамматику, "
+    "делай переводы. Отвечай на русском языке, будь кратким и познавательным. "
+    "Для греческих существительных всегда указывай артикль (ο, η, το) для обозначения рода."
+)
+
+TRANSLATION_SYSTEM_PROMPT = (
+    "Ты - греческо-русский переводчик. Давай точные переводы. "
+    "Для греческих существительных всегда указывай определённый артикль "
+    "для обозначения рода."
+)
+
+GRAMMAR_SYSTEM_PROMPT = (
+    "Ты - эксперт по греческой грамматике. Объясняй греческую грамматику "
+    "понятно и доступно для изучающих язык. Отвечай на русском языке."
+)
+
+CARD_SYSTEM_PROMPT = (
+    "Ты - эксперт по греческому языку, помогающий русскоязычным "
+    "изучать греческий. Всегда давай точные переводы и убедись, что "
+    "греческие существительные включают артикль (ο, η, το) для указания "
+    "грамматического рода. Отвечай строго в формате JSON."
+)
+
+EXAMPLE_SYSTEM_PROMPT = (
+    "Ты - преподаватель греческого языка, создающий примеры предложений. "
+    "Отвечай на русском языке."
+)
+
+DECK_SUGGESTION_SYSTEM_PROMPT = (
+    "Ты помогаешь сортировать слова по тематическим колодам. "
+    "Отвечай только названием колоды или NONE."
+)
+
+BATCH_TRANSLATION_SYSTEM_PROMPT = (
+    "Ты - греческо-русский переводчик. Переводи каждое слово из нумерованного списка. "
+    "Для греческих существительных указывай артикль (ο/η/το). "
+    "Отвечай строго в формате 'N: перевод', по одной строке на слово, без пояснений."
+)
+
+BATCH_TRANSLATION_USER_PROMPT = "Переведи слова с {from_lang} на {to_lang}:\n\n{items}"
+
+DECK_NAME_SYSTEM_PROMPT = "Ты генерируешь короткие названия категорий. Отвечай только названием."
+
+# Message prefixes shared by every request of a kind. Module-level objects
+# keep the prompt prefix byte-identical between requests so that OpenAI can
+# serve it from its prompt cache. System prompts are never formatted: all
+# request-specific text, including output examples that depend on it, goes
+# into the trailing user message. Never add timestamps, IDs or other per-request
+# values to a prefix; _log_usage reports how many prompt tokens were cached.
+_ASSISTANT_PREFIX = ({"role": "system", "content": ASSISTANT_SYSTEM_PROMPT},)
+_TRANSLATION_PREFIX = ({"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},)
+_GRAMMAR_PREFIX = ({"role": "system", "content": GRAMMAR_SYSTEM_PROMPT},)
+_CARD_PREFIX = ({"role": "system", "content": CARD_SYSTEM_PROMPT},)
+_EXAMPLE_PREFIX = ({"role": "system", "content": EXAMPLE_SYSTEM_PROMPT},)
+_DECK_SUGGESTION_PREFIX = ({"role": "system", "content": DECK_SUGGESTION_SYSTEM_PROMPT},)
+_BATCH_TRANSLATION_PREFIX = ({"role": "system", "content": BATCH_TRANSLATION_SYSTEM_PROMPT},)
+_DECK_NAME_PREFIX = ({"role": "system", "content": DECK_NAME_SYSTEM_PROMPT},)
+_CATEGORIZATION_PREFIX = ({"role": "system", "content": CATEGORIZATION_SYSTEM_PROMPT},)
+_WORD_EXTRACTION_PREFIX = ({"role": "system", "content": WORD_EXTRACTION_SYSTEM_PROMPT},)
+_SENTENCE_ANALYSIS_PREFIX = ({"role": "system", "content": SENTENCE_ANALYSIS_SYSTEM_PROMPT},)
+_PHOTO_TEXT_PREFIX = ({"role": "system", "content": PHOTO_TEXT_SYSTEM_PROMPT},)
+
+
+GRAMMAR_USER_PROMPT = """Объясни грамматику этого греческого текста простым языком:
+
+{text}
+
+Включи:
+1. Разбор слов
+2. Грамматические конструкции
+3. Ключевые грамматические правила"""
+
+TRANSLATION_USER_PROMPT = (
+    "Переведи следующее слово/фразу с {from_lang} на {to_lang}. "
+    "Для греческих существительных укажи артикль (ο/η/το).\n"
+    "Дай перевод и краткое пояснение при необходимости:\n\n{word}"
+)
+
+CARD_USER_PROMPT = (
+    "Создай карточку для изучения греческого слова: {word}\n\n"
+    "Предоставь:\n"
+    "1. Греческое слово С АРТИКЛЕМ (ο/η/το для существительных)\n"
+    "2. Русский перевод\n"
+    "3. Пример предложения на греческом с русским переводом\n\n"
+    "ВАЖНО: Для существительных ОБЯЗАТЕЛЬНО укажи греческий артикль "
+    "(ο для мужского рода, η для женского, το для среднего).\n"
+    "Если во вводе нет артикля, добавь правильный.\n\n"
+    "Ответь в формате JSON:\n"
+    '{{"front": "греческое слово с артиклем если существительное", '
+    '"back": "русский перевод", '
+    '"example": "пример на греческом - русский перевод"}}'
+)
+
+CARD_FROM_RUSSIAN_USER_PROMPT = (
+    "Создай карточку для изучения греческого слова по русскому слову: {word}\n\n"
+    "Предоставь:\n"
+    "1. Греческий перевод С АРТИКЛЕМ (ο/η/το для существительных)\n"
+    "2. Исходное русское слово\n"
+    "3. Пример предложения на греческом с русским переводом\n\n"
+    "ВАЖНО: Для существительных ОБЯЗАТЕЛЬНО укажи греческий артикль "
+    "(ο для мужского рода, η для женского, το для среднего).\n\n"
+    "Ответь в формате JSON:\n"
+    '{{"front": "греческое слово с артиклем если существительное", '
+    '"back": "русское слово", '
+    '"example": "пример на греческом - русский перевод"}}'
+)
+
+EXAMPLE_USER_PROMPT = (
+    "Создай простое примерное предложение на греческом, используя слово: {word}\n"
+    "Предоставь греческое предложение и его русский перевод."
+)
+
+DECK_SUGGESTION_USER_PROMPT = (
+    "Слово: {word} ({translation})\n\n"
+    "Колоды пользователя: {deck_names}\n\n"
+    "Какая колода лучше всего подходит для этого слова по смыслу/категории?\n"
+    "Ответь ТОЛЬКО названием колоды из списка или NONE если ни одна не подходит."
+)
+
+DECK_NAME_USER_PROMPT = (
+    "Слово: {word} ({translation})\n\n"
+    "Придумай короткое название колоды на русском для категории этого слова.\n"
+    "Например: Еда, Транспорт, Семья, Одежда, Дом, Работа.\n"
+    "Ответь ТОЛЬКО названием (1-3 слова), без пояснений."
+)
+
+
+# Russian language names in the grammatical cases the prompts need
+_LANG_NOMINATIVE = {"greek": "греческий", "russian": "русский"}
+_LANG_GENITIVE = {"greek": "греческого", "russian": "русского"}
+_LANG_PREPOSITIONAL = {"greek": "греческом", "russian": "русском"}
+
+# Translation direction for a detected source language
+_OPPOSITE_LANGUAGE = {"greek": "russian", "russian": "greek"}
+
+# Output token budget for a generated flashcard. A JSON card with one example
+# sentence takes roughly 100-150 tokens of Greek and Cyrillic text.
+CARD_MAX_TOKENS = 300
+
+# Maximum number of speculative card generations running at once
+CARD_PREFETCH_LIMIT = 8
+
+# Flashcards are returned as a {"front", "back", "example"} JSON object
+_CARD_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Batch API job states after which no results will arrive
+_BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled"})
+
+# Default number of concurrent requests made by translate_many
+TRANSLATION_CONCURRENCY = 10
+
+# Messages arriving within this window are categorized with one request
+CATEGORIZATION_BATCH_SIZE = 8
+CATEGORIZATION_BATCH_WAIT = 0.15
+CATEGORIZATION_MAX_TOKENS = 200
+
+# Output token budgets that grow with the input. A sentence analysis repeats
+# the sentence up to twice (correction and translation) at roughly two
+# characters per token; a word extraction entry takes about 60 tokens.
+SENTENCE_ANALYSIS_BASE_TOKENS = 150
+SENTENCE_ANALYSIS_MAX_TOKENS = 500
+WORD_EXTRACTION_BASE_TOKENS = 100
+WORD_EXTRACTION_TOKENS_PER_WORD = 60
+WORD_EXTRACTION_MAX_TOKENS = 1000
+
+# Semantic cache lookups arriving within this window share one embeddings request
+EMBEDDING_BATCH_SIZE = 16
+EMBEDDING_BATCH_WAIT = 0.025
+
+# Maximum number of words translated by a single batch request
+TRANSLATION_BATCH_SIZE = 20
+
+# Output token budget per word of a batch translation
+_BATCH_TOKENS_PER_WORD = 30
+
+# "N: translation" lines of a batch translation response
+_NUMBERED_LINE_RE = re.compile(r"^\s*(\d+)\s*[.:)]\s*(.+?)\s*$", re.MULTILINE)
+
+# Words of a deck name, word or translation for local deck matching
+_WORD_RE = re.compile(r"\w+")
+
+# Rough prompt size estimate used for client-side throttling; Greek and
+# Cyrillic text averages fewer characters per token than English
+_CHARS_PER_TOKEN = 2
+
+# Per-message overhead of the chat format and flat estimate for one image
+_MESSAGE_TOKEN_OVERHEAD = 4
+_IMAGE_TOKENS = 1105
+
+# User-facing texts returned in place of a result when a request fails
+_AI_ERROR_MESSAGES = frozenset(
+    {
+        ai_messages.MSG_AI_RATE_LIMIT,
+        ai_messages.MSG_AI_TIMEOUT,
+        ai_messages.MSG_AI_CONNECTION_ERROR,
+        ai_messages.MSG_AI_SERVICE_ERROR,
+        ai_messages.MSG_AI_UNEXPECTED_ERROR,
+    }
+)
+
+
+def _describe_error(error: Exception, unexpected: str = ai_messages.MSG_AI_UNEXPECTED_ERROR) -> str:
+    """Log a failed OpenAI request and pick the matching user-facing message.
+
+    Must be called from an ``except`` block so unexpected errors keep their traceback.
+
+    Args:
+        error: Raised exception
+        unexpected: Message for errors not raised by the OpenAI SDK
+
+    Returns:
+        User-facing error message
+    """
+    if isinstance(error, CircuitOpenError):
+        logger.warning("OpenAI circuit open, request skipped")
+        return ai_messages.MSG_AI_SERVICE_ERROR
+    if isinstance(error, RateLimitError):
+        logger.warning("OpenAI rate limit exceeded")
+        return ai_messages.MSG_AI_RATE_LIMIT
+    if isinstance(error, APITimeoutError):
+        logger.error("OpenAI request timeout")
+        return ai_messages.MSG_AI_TIMEOUT
+    if isinstance(error, APIConnectionError):
+        logger.error("Failed to connect to OpenAI")
+        return ai_messages.MSG_AI_CONNECTION_ERROR
+    if isinstance(error, APIError):
+        logger.error("OpenAI API error: %s", error)
+        return ai_messages.MSG_AI_SERVICE_ERROR
+    logger.exception("Unexpected error")
+    return unexpected
+
+
+def _openai_guarded(
+    on_error: Callable[..., Any] | None = None,
+    unexpected: str = ai_messages.MSG_AI_UNEXPECTED_ERROR,
+) -> Callable[[_Method], _Method]:
+    """Make an AIService method return a fallback instead of raising.
+
+    Args:
+        on_error: Builds the fallback from the error message and the call
+            arguments; the error message itself is returned by default
+        unexpected: Message for errors not raised by the OpenAI SDK
+
+    Returns:
+        Method decorator
+    """
+
+    def decorator(method: _Method) -> _Method:
+        @functools.wraps(method)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await method(self, *args, **kwargs)
+            except Exception as e:
+                message = _describe_error(e, unexpected)
+                return message if on_error is None else on_error(message, *args, **kwargs)
+
+        return cast(_Method, wrapper)
+
+    return decorator
+
+
+def _word_extraction_request(phrase: str, source_language: str) -> dict[str, Any]:
+    """Build the chat completion parameters for word extraction.
+
+    Args:
+        phrase: Phrase to extract words from
+        source_language: 'greek' or 'russian'
+
+    Returns:
+        Messages and sampling parameters, without model and user
+    """
+    prompt = WORD_EXTRACTION_USER_PROMPT.format(
+        language=_LANG_NOMINATIVE.get(source_language, source_language),
+        phrase=phrase,
+    )
+    return {
+        "messages": _build_messages(_WORD_EXTRACTION_PREFIX, prompt),
+        "max_tokens": min(
+            WORD_EXTRACTION_BASE_TOKENS + WORD_EXTRACTION_TOKENS_PER_WORD * len(phrase.split()),
+            WORD_EXTRACTION_MAX_TOKENS,
+        ),
+        "temperature": 0,
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _is_outage(error: BaseException) -> bool:
+    """Tell whether an OpenAI error means the service is unreachable or failing.
+
+    Args:
+        error: Raised exception
+
+    Returns:
+        True for timeouts, connection errors and 5xx responses
+    """
+    return isinstance(error, APIConnectionError | InternalServerError)
+
+
+def _estimate_tokens(messages: list[dict[str, Any]], max_tokens: int) -> int:
+    """Estimate the rate-limit cost of a completion request.
+
+    Args:
+        messages: Request messages
+        max_tokens: Output token budget
+
+    Returns:
+        Estimated prompt plus output tokens
+    """
+    tokens = max_tokens
+    for message in messages:
+        tokens += _MESSAGE_TOKEN_OVERHEAD
+        content = message["content"]
+        if isinstance(content, str):
+            tokens += len(content) // _CHARS_PER_TOKEN
+            continue
+        for part in content:
+            if part["type"] == "text":
+                tokens += len(part["text"]) // _CHARS_PER_TOKEN
+            else:
+                tokens += _IMAGE_TOKENS
+    return tokens
+
+
+def _cache_key(*parts: str) -> bytes:
+    """Build a compact cache key from request arguments.
+
+    Text is NFC-normalized, stripped and case-folded so that trivially
+    different spellings of the same word share an entry.
+
+    Args:
+        *parts: Request arguments
+
+    Returns:
+        16-byte digest
+    """
+    normalized = "|".join(unicodedata.normalize("NFC", part).strip().casefold() for part in parts)
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
+def _grammar_cache_key(text: str) -> bytes:
+    """Build the response cache key of a grammar explanation.
+
+    Grammar depends on every article and ending, so only the same text with
+    different spacing or letter case shares an explanation.
+
+    Args:
+        text: Greek text to explain
+
+    Returns:
+        Cache key
+    """
+    return _cache_key("grammar", " ".join(text.split()))
+
+
+def _fold(text: str) -> str:
+    """Normalize text for a containment check.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        NFC-normalized, case-folded text with single spaces
+    """
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def _is_extracted_from(result: dict, message: str) -> bool:
+    """Check that a categorization result's extracted content is from a message.
+
+    Args:
+        result: Categorization result
+        message: Message the result was returned for
+
+    Returns:
+        True if the result has no extracted content or it occurs in the message
+    """
+    extracted = result.get("extracted_content")
+    if extracted is None:
+        return True
+    return isinstance(extracted, str) and _fold(extracted) in _fold(message)
+
+
+def _exact(data: str | bytes) -> str:
+    """Digest data for a cache key part that must not be case-folded.
+
+    Args:
+        data: Case-sensitive text or raw bytes, such as image data
+
+    Returns:
+        Hex digest of the data
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _image_data_url(image: bytes | str) -> str:
+    """Build a JPEG data URL for the vision API.
+
+    Args:
+        image: Raw image bytes, or image data already base64-encoded
+
+    Returns:
+        Data URL with base64 image data
+    """
+    if isinstance(image, bytes):
+        image = base64.b64encode(image).decode("ascii")
+    return f"data:image/jpeg;base64,{image}"
+
+
+def _log_usage(usage: Any) -> None:
+    """Log token usage of a completion, including prompt cache hits.
+
+    Args:
+        usage: Usage block of a chat completion response
+    """
+    if usage is None:
+        return
+
+    details = usage.prompt_tokens_details
+    logger.debug(
+        "OpenAI usage: prompt=%s cached=%s completion=%s",
+        usage.prompt_tokens,
+        details.cached_tokens if details is not None else 0,
+        usage.completion_tokens,
+    )
+
+
+def _build_messages(prefix: tuple[dict[str, str], ...], content: Any) -> list[dict[str, Any]]:
+    """Build a request message list from a shared prefix and a user turn.
+
+    Args:
+        prefix: Module-level system message prefix
+        content: User message content (text or multimodal parts)
+
+    Returns:
+        Message list for the chat completions API
+    """
+    return [*prefix, {"role": "user", "content": content}]
+
+
+def _build_card_prompt(word: str, source_language: str) -> str:
+    """Build the user prompt for flashcard generation.
+
+    Args:
+        word: Word to create card from
+        source_language: 'greek' or 'russian'
+
+    Returns:
+        Prompt text
+    """
+    if source_language == "russian":
+        return CARD_FROM_RUSSIAN_USER_PROMPT.format(word=word)
+    return CARD_USER_PROMPT.format(word=word)
+
+
+def _parse_card(content: str, word: str) -> dict[str, str]:
+    """Parse a JSON flashcard response.
+
+    Args:
+        content: Model response text
+        word: Original word, used as front when none was returned
+
+    Returns:
+        Dictionary with 'front', 'back' and 'example' fields
+    """
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        logger.warning("Failed to parse card response for %s", word)
+        data = None
+
+    fields = (
+        {key: value.strip() for key, value in data.items() if isinstance(value, str)}
+        if isinstance(data, dict)
+        else {}
+    )
+    return {
+        "front": fields.get("front") or word,
+        "back": fields.get("back", ""),
+        "example": fields.get("example", ""),
+    }
+
+
+def _match_deck_by_name(word: str, translation: str, deck_names: list[str]) -> str | None:
+    """Pick a deck whose name literally appears in the word or its translation.
+
+    Args:
+        word: Greek word
+        translation: Russian translation
+        deck_names: User's deck names
+
+    Returns:
+        The only deck whose name words all occur in the word or translation,
+        or None if no deck or several decks match
+    """
+    text_words = set(_WORD_RE.findall(f"{word} {translation}".lower()))
+    matches = [
+        name
+        for name in deck_names
+        if (name_words := set(_WORD_RE.findall(name.lower()))) and name_words <= text_words
+    ]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _unchecked_analysis(translation: str) -> dict:
+    """Build a sentence analysis result that reports no errors.
+
+    Args:
+        translation: Translation or user-facing error message to show
+
+    Returns:
+        Sentence analysis dictionary
+    """
+    return {
+        "is_correct": True,
+        "error_description": None,
+        "corrected_sentence": None,
+        "translation": translation,
+    }
+
+
+def _build_question_messages(
+    message: str,
+    context: str | None,
+    conversation_history: list[dict[str, str]] | None,
+) -> list[dict[str, Any]]:
+    """Build the message list for an assistant question.
+
+    Args:
+        message: User's question
+        context: Optional extra system context
+        conversation_history: Previous conversation turns
+
+    Returns:
+        Message list for the chat completions API
+    """
+    messages: list[dict[str, Any]] = list(_ASSISTANT_PREFIX)
+
+    if context:
+        messages.append({"role": "system", "content": f"Контекст: {context}"})
+
+    if conversation_history:
+        messages.extend(conversation_history)
+
+    messages.append({"role": "user", "content": message})
+    return messages
+
 
 class AIService:
     """Service for AI-powered features using OpenAI API."""
 
+    # Caches and in-flight requests are shared by all instances because
+    # services create a fresh AIService per request.
+    _inflight: dict[bytes, asyncio.Future[Any]] = {}
+    _translation_cache: TTLCache[bytes, str] = TTLCache(
+        settings.ai_cache_max_size, settings.ai_cache_ttl_seconds
+    )
+    _card_cache: TTLCache[bytes, dict[str, str]] = TTLCache(
+        settings.ai_cache_max_size, settings.ai_cache_ttl_seconds
+    )
+    _response_cache: TTLCache[bytes, Any] = TTLCache(
+        settings.ai_cache_max_size, settings.ai_cache_ttl_seconds
+    )
+    _card_prefetches: dict[bytes, asyncio.Task[dict[str, str]]] = {}
+    # Answers to open-ended prompts, matched by embedding similarity
+    _semantic_caches: dict[str, SemanticCache[str]] = {}
+    _embedding_batcher: MicroBatcher[str, list[float]] | None = None
+    _categorization_batcher: MicroBatcher[str, dict] | None = None
+
+    # One circuit per model, so an outage of one model does not block others
+    _circuits: dict[str, CircuitBreaker] = {}
+
+    # Requests wait here instead of running into OpenAI 429 responses
+    _request_limiter = AsyncTokenBucket(settings.openai_requests_per_minute)
+    _token_limiter = AsyncTokenBucket(settings.openai_tokens_per_minute)
+
     def __init__(self):
         """Initialize AI service."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=settings.openai_timeout)
+        _load_openai()
+        self.client = get_openai_client()
         self.model = settings.openai_model
+        self.fast_model = settings.openai_model_fast
+        self.vision_model = settings.openai_vision_model
         self.max_tokens = settings.openai_max_tokens
         self.temperature = settings.openai_temperature
+        self.user = settings.openai_user
+
+    async def _complete(self, messages: list[dict[str, Any]], **params: Any) -> str | None:
+        """Send a chat completion request and return the message content.
+
+        Every request goes through here so that the model default, the
+        ``user`` identifier and throttling are applied consistently.
+
+        Args:
+            messages: Request messages
+            **params: Extra completion parameters (max_tokens, temperature, ...)
+
+        Returns:
+            Content of the first choice
+        """
+        params.setdefault("model", self.model)
+        async with self._circuit(params["model"]):
+            await self._throttle(messages, params)
+            response = await self.client.chat.completions.create(
+                messages=messages, user=self.user, **params
+            )
+        _log_usage(response.usage)
+        return response.choices[0].message.content
+
+    @classmethod
+    def _circuit(cls, model: str) -> CircuitBreaker:
+        """Get the circuit breaker guarding requests to a model.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Circuit breaker shared by all instances
+        """
+        circuit = cls._circuits.get(model)
+        if circuit is None:
+            circuit = CircuitBreaker(
+                settings.openai_circuit_fail_max,
+                settings.openai_circuit_reset_seconds,
+                is_failure=_is_outage,
+            )
+            cls._circuits[model] = circuit
+        return circuit
+
+    async def _throttle(self, messages: list[dict[str, Any]], params: dict[str, Any]) -> None:
+        """Wait until the request fits the per-minute request and token limits.
+
+        Args:
+            messages: Request messages
+            params: Completion parameters
+        """
+        await self._request_limiter.acquire()
+        await self._token_limiter.acquire(
+            _estimate_tokens(messages, params.get("max_tokens", self.max_tokens))
+        )
 
+    @_openai_guarded()
     async def ask_question(
         self,
         message: str,
@@ -206,58 +976,84 @@ class AIService:
         Returns:
             AI's response
         """
-        try:
-            messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "Ты - полезный ассистент для изучения греческого языка. "
-                        "Помогай пользователям учить греческий: отвечай на вопросы, объясняй грамматику, "
-                        "делай переводы. Отвечай на русском языке, будь кратким и познавательным. "
-                        "Для греческих существительных всегда указывай артикль (ο, η, το) для обозначения рода."
-                    ),
-                }
-            ]
+        embedding = None
+        if not context and not conversation_history:
+            embedding, cached = await self._semantic_lookup("question", message)
+            if cached is not None:
+                return cached
+
+        content = await self._complete(
+            _build_question_messages(message, context, conversation_history),
+            max_tokens=settings.openai_max_tokens_ask,
+            temperature=self.temperature,
+        )
+
+        if content and embedding is not None:
+            await self._semantic_store("question", embedding, content)
+        return content or "Не удалось сгенерировать ответ."
 
-            if context:
-                messages.append({"role": "system", "content": f"Контекст: {context}"})
+    async def translate_word(
+        self, word: str, from_lang: str = "greek", to_lang: str = "russian"
+    ) -> str:
+        """Translate a word or phrase between Greek and Russian.
 
-            if conversation_history:
-                messages.extend(conversation_history)
+        Successful translations are cached, and concurrent calls with the same
+        arguments share a single API request. A word is returned unchanged
+        when both languages are the same.
 
-            messages.append({"role": "user", "content": message})
+        Args:
+            word: Word or phrase to translate
+            from_lang: Source language ('greek' or 'russian')
+            to_lang: Target language ('greek' or 'russian')
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
+        Returns:
+            Translation with optional context
+        """
+        if from_lang.lower() == to_lang.lower():
+            return word
 
-            return response.choices[0].message.content or "Не удалось сгенерировать ответ."
-
-        except RateLimitError:
-            logger.warning("OpenAI rate limit exceeded")
-            return ai_messages.MSG_AI_RATE_LIMIT
-        except APITimeoutError:
-            logger.error("OpenAI request timeout")
-            return ai_messages.MSG_AI_TIMEOUT
-        except APIConnectionError:
-            logger.error("Failed to connect to OpenAI")
-            return ai_messages.MSG_AI_CONNECTION_ERROR
-        except APIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            return ai_messages.MSG_AI_SERVICE_ERROR
-        except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
-            return ai_messages.MSG_AI_UNEXPECTED_ERROR
+        key = _cache_key("translation", from_lang, to_lang, word)
+        cached = self._translation_cache.get(key)
+        if cached is not None:
+            return cached
 
-    async def translate_word(
-        self, word: str, from_lang: str = "greek", to_lang: str = "russian"
-    ) -> str:
-        """Translate a word or phrase between Greek and Russian.
+        return await self._single_flight(
+            key, lambda: self._fetch_translation(key, word, from_lang, to_lang)
+        )
+
+    async def _single_flight(self, key: bytes, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Run fetch once for all concurrent callers with the same key.
+
+        Args:
+            key: Request key
+            fetch: Produces the shared result; cancelling one caller does not cancel it
+
+        Returns:
+            Result of the shared fetch
+        """
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            # The fetch runs in its own task, so that a caller being cancelled,
+            # the first one included, does not cancel it for the others
+            inflight = asyncio.ensure_future(fetch())
+            self._inflight[key] = inflight
+
+            def finish(task: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+                if not task.cancelled():
+                    # Callers re-raise it; don't warn if all of them are gone
+                    task.exception()
+
+            inflight.add_done_callback(finish)
+
+        return await asyncio.shield(inflight)
+
+    async def _fetch_translation(self, key: bytes, word: str, from_lang: str, to_lang: str) -> str:
+        """Get a translation from the persistent cache or OpenAI and cache it.
 
         Args:
+            key: Translation cache key
             word: Word or phrase to translate
             from_lang: Source language ('greek' or 'russian')
             to_lang: Target language ('greek' or 'russian')
@@ -265,51 +1061,146 @@ class AIService:
         Returns:
             Translation with optional context
         """
-        try:
-            lang_names = {"greek": "греческого", "russian": "русского"}
-            to_lang_names = {"greek": "греческий", "russian": "русский"}
-
-            prompt = (
-                f"Переведи следующее слово/фразу с {lang_names.get(from_lang, from_lang)} "
-                f"на {to_lang_names.get(to_lang, to_lang)}. "
-                f"Для греческих существительных укажи артикль (ο/η/το).\n"
-                f"Дай перевод и краткое пояснение при необходимости:\n\n{word}"
+        result = await self._load_persistent(key)
+        if result is not None:
+            self._translation_cache.set(key, result)
+            return result
+
+        result = await self._translate_word(word, from_lang, to_lang)
+        if result not in _AI_ERROR_MESSAGES:
+            self._translation_cache.set(key, result)
+            await self._store_persistent(key, result)
+        return result
+
+    async def translate_many(
+        self,
+        words: list[str],
+        from_lang: str = "greek",
+        to_lang: str = "russian",
+        concurrency: int = TRANSLATION_CONCURRENCY,
+    ) -> list[str]:
+        """Translate several words concurrently with full per-word translations.
+
+        Cached words are answered without waiting for a request slot.
+
+        Args:
+            words: Words or phrases to translate
+            from_lang: Source language ('greek' or 'russian')
+            to_lang: Target language ('greek' or 'russian')
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Translations in the same order as words
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def translate(word: str) -> str:
+            cached = self._translation_cache.get(
+                _cache_key("translation", from_lang, to_lang, word)
             )
+            if cached is not None:
+                return cached
+            async with semaphore:
+                return await self.translate_word(word, from_lang, to_lang)
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Ты - греческо-русский переводчик. Давай точные переводы. "
-                            "Для греческих существительных всегда указывай определённый артикль "
-                            "для обозначения рода."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.3,
+        return list(await asyncio.gather(*(translate(word) for word in words)))
+
+    @_openai_guarded()
+    async def _translate_word(self, word: str, from_lang: str, to_lang: str) -> str:
+        """Request a translation from OpenAI.
+
+        Args:
+            word: Word or phrase to translate
+            from_lang: Source language ('greek' or 'russian')
+            to_lang: Target language ('greek' or 'russian')
+
+        Returns:
+            Translation with optional context
+        """
+
+        prompt = TRANSLATION_USER_PROMPT.format(
+            from_lang=_LANG_GENITIVE.get(from_lang, from_lang),
+            to_lang=_LANG_NOMINATIVE.get(to_lang, to_lang),
+            word=word,
+        )
+
+        content = await self._complete(
+            _build_messages(_TRANSLATION_PREFIX, prompt),
+            model=self.fast_model,
+            max_tokens=settings.openai_max_tokens_translate,
+            temperature=0,
+        )
+
+        return content or "Перевод недоступен."
+
+    async def translate_words_batch(
+        self, words: list[str], from_lang: str = "greek", to_lang: str = "russian"
+    ) -> list[str]:
+        """Translate several words with one API request per batch.
+
+        Words are packed into numbered prompts of up to TRANSLATION_BATCH_SIZE
+        items, so the system prompt is sent once per batch rather than once
+        per word. Items missing from a response fall back to translate_word.
+
+        Args:
+            words: Words to translate
+            from_lang: Source language ('greek' or 'russian')
+            to_lang: Target language ('greek' or 'russian')
+
+        Returns:
+            Short translations in the same order as words
+        """
+        if from_lang.lower() == to_lang.lower():
+            return list(words)
+
+        batches = [
+            words[start : start + TRANSLATION_BATCH_SIZE]
+            for start in range(0, len(words), TRANSLATION_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._translate_batch(batch, from_lang, to_lang) for batch in batches)
+        )
+        return [translation for batch in results for translation in batch]
+
+    @_openai_guarded(on_error=lambda message, words, *_: [message] * len(words))
+    async def _translate_batch(self, words: list[str], from_lang: str, to_lang: str) -> list[str]:
+        """Translate one batch of words in a single request.
+
+        Args:
+            words: Words to translate, at most TRANSLATION_BATCH_SIZE
+            from_lang: Source language ('greek' or 'russian')
+            to_lang: Target language ('greek' or 'russian')
+
+        Returns:
+            Translations in the same order as words
+        """
+
+        prompt = BATCH_TRANSLATION_USER_PROMPT.format(
+            from_lang=_LANG_GENITIVE.get(from_lang, from_lang),
+            to_lang=_LANG_NOMINATIVE.get(to_lang, to_lang),
+            items="\n".join(f"{number}. {word}" for number, word in enumerate(words, 1)),
+        )
+
+        content = await self._complete(
+            _build_messages(_BATCH_TRANSLATION_PREFIX, prompt),
+            model=self.fast_model,
+            max_tokens=_BATCH_TOKENS_PER_WORD * len(words),
+            temperature=0,
+        )
+
+        parsed = {int(number): text for number, text in _NUMBERED_LINE_RE.findall(content or "")}
+        translations = [parsed.get(number, "") for number in range(1, len(words) + 1)]
+
+        missing = [index for index, translation in enumerate(translations) if not translation]
+        if missing:
+            logger.warning("Batch translation missed %d of %d words", len(missing), len(words))
+            fallbacks = await asyncio.gather(
+                *(self.translate_word(words[index], from_lang, to_lang) for index in missing)
             )
+            for index, translation in zip(missing, fallbacks, strict=True):
+                translations[index] = translation
 
-            return response.choices[0].message.content or "Перевод недоступен."
-
-        except RateLimitError:
-            logger.warning("OpenAI rate limit exceeded")
-            return ai_messages.MSG_AI_RATE_LIMIT
-        except APITimeoutError:
-            logger.error("OpenAI request timeout")
-            return ai_messages.MSG_AI_TIMEOUT
-        except APIConnectionError:
-            logger.error("Failed to connect to OpenAI")
-            return ai_messages.MSG_AI_CONNECTION_ERROR
-        except APIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            return ai_messages.MSG_AI_SERVICE_ERROR
-        except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
-            return ai_messages.MSG_AI_UNEXPECTED_ERROR
+        return translations
 
     async def analyze_and_translate_sentence(
         self,
@@ -329,79 +1220,59 @@ class AIService:
             - corrected_sentence: str | None
             - translation: str
         """
-        target_language = "russian" if source_language == "greek" else "greek"
-        lang_names = {
-            "greek": "греческом",
-            "russian": "русском",
-        }
-        target_lang_names = {
-            "greek": "греческий",
-            "russian": "русский",
-        }
+        target_language = _OPPOSITE_LANGUAGE.get(source_language, "greek")
+
+        result = await self._analyze_sentence(sentence, source_language, target_language)
+        if result is not None:
+            return result
+
+        # The API answered but not with valid JSON: fall back to simple translation
+        translation = await self.translate_word(sentence, source_language, target_language)
+        return _unchecked_analysis(translation)
+
+    @_openai_guarded(on_error=lambda message, *_args, **_kwargs: _unchecked_analysis(message))
+    async def _analyze_sentence(
+        self, sentence: str, source_language: str, target_language: str
+    ) -> dict | None:
+        """Request the error analysis and translation of a sentence.
+
+        Args:
+            sentence: Sentence to analyze
+            source_language: 'greek' or 'russian'
+            target_language: 'greek' or 'russian'
+
+        Returns:
+            Analysis dictionary, carrying the error message as the translation
+            if the request failed, or None if the response was not valid JSON
+        """
+        prompt = SENTENCE_ANALYSIS_USER_PROMPT.format(
+            source_lang=_LANG_PREPOSITIONAL.get(source_language, source_language),
+            target_lang=_LANG_NOMINATIVE.get(target_language, target_language),
+            sentence=sentence,
+        )
+        content = await self._complete(
+            _build_messages(_SENTENCE_ANALYSIS_PREFIX, prompt),
+            max_tokens=min(
+                SENTENCE_ANALYSIS_BASE_TOKENS + len(sentence), SENTENCE_ANALYSIS_MAX_TOKENS
+            ),
+            temperature=0,
+            response_format={"type": "json_object"},
+        )
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": SENTENCE_ANALYSIS_SYSTEM_PROMPT,
-                    },
-                    {
-                        "role": "user",
-                        "content": SENTENCE_ANALYSIS_USER_PROMPT.format(
-                            source_lang=lang_names.get(source_language, source_language),
-                            target_lang=target_lang_names.get(target_language, target_language),
-                            sentence=sentence,
-                        ),
-                    },
-                ],
-                max_tokens=500,
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
+            result = orjson.loads(content or "{}")
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse sentence analysis response: %s", e)
+            return None
 
-            content = response.choices[0].message.content or "{}"
-            result = json.loads(content)
-
-            return {
-                "is_correct": result.get("is_correct", True),
-                "error_description": result.get("error_description"),
-                "corrected_sentence": result.get("corrected_sentence"),
-                "translation": result.get("translation", ""),
-            }
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse sentence analysis response: {e}")
-            # Fall back to simple translation
-            translation = await self.translate_word(sentence, source_language, target_language)
-            return {
-                "is_correct": True,
-                "error_description": None,
-                "corrected_sentence": None,
-                "translation": translation,
-            }
-        except (RateLimitError, APITimeoutError, APIConnectionError, APIError) as e:
-            logger.error(f"Sentence analysis API error: {e}")
-            # Fall back to simple translation
-            translation = await self.translate_word(sentence, source_language, target_language)
-            return {
-                "is_correct": True,
-                "error_description": None,
-                "corrected_sentence": None,
-                "translation": translation,
-            }
-        except Exception as e:
-            logger.exception(f"Sentence analysis failed: {e}")
-            # Fall back to simple translation
-            translation = await self.translate_word(sentence, source_language, target_language)
-            return {
-                "is_correct": True,
-                "error_description": None,
-                "corrected_sentence": None,
-                "translation": translation,
-            }
+        return {
+            "is_correct": result.get("is_correct", True),
+            "error_description": result.get("error_description"),
+            "corrected_sentence": result.get("corrected_sentence"),
+            "translation": result.get("translation", ""),
+        }
 
+    @_openai_guarded()
     async def explain_grammar(self, text: str) -> str:
         """Explain the grammar of a Greek sentence or phrase.
 
@@ -411,54 +1282,134 @@ class AIService:
         Returns:
             Grammar explanation in Russian
         """
-        try:
-            prompt = (
-                f"Объясни грамматику этого греческого текста простым языком:\n\n{text}\n\n"
-                f"Включи:\n"
-                f"1. Разбор слов\n"
-                f"2. Грамматические конструкции\n"
-                f"3. Ключевые грамматические правила"
-            )
+        key = _grammar_cache_key(text)
+        cached = await self._load_response(key)
+        if cached is not None:
+            return cached
+
+        content = await self._complete(
+            _build_messages(_GRAMMAR_PREFIX, GRAMMAR_USER_PROMPT.format(text=text)),
+            max_tokens=settings.openai_max_tokens_grammar,
+            temperature=0.5,
+        )
+
+        if content:
+            await self._store_response(key, content)
+        return content or "Объяснение грамматики недоступно."
+
+    def stream_question(
+        self,
+        message: str,
+        context: str | None = None,
+        conversation_history: list[dict[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream the assistant's answer to a question as it is generated.
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Ты - эксперт по греческой грамматике. Объясняй греческую грамматику "
-                            "понятно и доступно для изучающих язык. Отвечай на русском языке."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=self.max_tokens,
-                temperature=0.5,
-            )
+        Args:
+            message: User's question
+            context: Optional context for the conversation (legacy support)
+            conversation_history: List of previous messages [{"role": "user/assistant", "content": "..."}]
+
+        Returns:
+            Async iterator over response text fragments
+        """
+        return self._stream_guarded(
+            _build_question_messages(message, context, conversation_history),
+            "Не удалось сгенерировать ответ.",
+            semantic=None if context or conversation_history else ("question", message),
+            max_tokens=settings.openai_max_tokens_ask,
+            temperature=self.temperature,
+        )
+
+    def stream_grammar(self, text: str) -> AsyncIterator[str]:
+        """Stream a grammar explanation as it is generated.
+
+        Args:
+            text: Greek text to explain
+
+        Returns:
+            Async iterator over explanation text fragments
+        """
+        return self._stream_guarded(
+            _build_messages(_GRAMMAR_PREFIX, GRAMMAR_USER_PROMPT.format(text=text)),
+            "Объяснение грамматики недоступно.",
+            cache_key=_grammar_cache_key(text),
+            max_tokens=settings.openai_max_tokens_grammar,
+            temperature=0.5,
+        )
+
+    async def _stream_guarded(
+        self,
+        messages: list[dict[str, Any]],
+        empty: str,
+        semantic: tuple[str, str] | None = None,
+        cache_key: bytes | None = None,
+        **params: Any,
+    ) -> AsyncIterator[str]:
+        """Stream completion text, yielding a user-facing message on failure.
+
+        Args:
+            messages: Request messages
+            empty: Text to yield if the model returns nothing
+            semantic: Semantic cache namespace and prompt to look up and
+                store the answer under, if the answer may be reused
+            cache_key: Exact response cache key to look up and store the
+                answer under, if the answer may be reused
+            **params: Extra completion parameters (max_tokens, temperature, ...)
+
+        Yields:
+            Response text fragments
+        """
+        try:
+            embedding = None
+            if semantic is not None:
+                embedding, cached = await self._semantic_lookup(*semantic)
+                if cached is not None:
+                    yield cached
+                    return
+            if cache_key is not None:
+                cached = await self._load_response(cache_key)
+                if cached is not None:
+                    yield cached
+                    return
+
+            params.setdefault("model", self.model)
+            async with self._circuit(params["model"]):
+                await self._throttle(messages, params)
+                stream = await self.client.chat.completions.create(
+                    messages=messages,
+                    user=self.user,
+                    stream=True,
+                    # Usage, including prompt cache hits, arrives in a final chunk
+                    stream_options={"include_usage": True},
+                    **params,
+                )
+            parts: list[str] = []
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield chunk.choices[0].delta.content
+                if chunk.usage is not None:
+                    _log_usage(chunk.usage)
+
+            if not parts:
+                yield empty
+            elif semantic is not None and embedding is not None:
+                await self._semantic_store(semantic[0], embedding, "".join(parts))
+            elif cache_key is not None:
+                await self._store_response(cache_key, "".join(parts))
 
-            return response.choices[0].message.content or "Объяснение грамматики недоступно."
-
-        except RateLimitError:
-            logger.warning("OpenAI rate limit exceeded")
-            return ai_messages.MSG_AI_RATE_LIMIT
-        except APITimeoutError:
-            logger.error("OpenAI request timeout")
-            return ai_messages.MSG_AI_TIMEOUT
-        except APIConnectionError:
-            logger.error("Failed to connect to OpenAI")
-            return ai_messages.MSG_AI_CONNECTION_ERROR
-        except APIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            return ai_messages.MSG_AI_SERVICE_ERROR
         except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
-            return ai_messages.MSG_AI_UNEXPECTED_ERROR
+            yield _describe_error(e)
 
     async def generate_card_from_word(
         self, word: str, source_language: str = "greek"
     ) -> dict[str, str]:
         """Generate a flashcard from a word in Greek or Russian.
 
+        Successfully generated cards are cached, and concurrent calls for the
+        same card, including a pending prefetch, share a single API request.
+
         Args:
             word: Word to create card from
             source_language: 'greek' or 'russian'
@@ -466,92 +1417,515 @@ class AIService:
         Returns:
             Dictionary with 'front' (Greek with article), 'back' (Russian), 'example' fields
         """
+        key = _cache_key("card", source_language, word)
+        cached = self._card_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        card = await self._single_flight(key, lambda: self._fetch_card(key, word, source_language))
+        return dict(card)
+
+    def prefetch_card(self, word: str, source_language: str = "greek") -> None:
+        """Start generating a flashcard in the background.
+
+        Used when the user is likely to ask for the card next, so that the
+        request is already under way or cached by then. Prefetches beyond
+        CARD_PREFETCH_LIMIT are skipped rather than queued.
+
+        Args:
+            word: Word to create card from
+            source_language: 'greek' or 'russian'
+        """
+        key = _cache_key("card", source_language, word)
+        if (
+            key in self._card_prefetches
+            or len(self._card_prefetches) >= CARD_PREFETCH_LIMIT
+            or self._card_cache.get(key) is not None
+        ):
+            return
+
+        task = asyncio.create_task(self.generate_card_from_word(word, source_language))
+        self._card_prefetches[key] = task
+        task.add_done_callback(lambda _: self._card_prefetches.pop(key, None))
+
+    async def _fetch_card(self, key: bytes, word: str, source_language: str) -> dict[str, str]:
+        """Generate a flashcard and cache it if generation succeeded.
+
+        Args:
+            key: Card cache key
+            word: Word to create card from
+            source_language: 'greek' or 'russian'
+
+        Returns:
+            Generated card
+        """
+        stored = await self._load_persistent(key)
+        if stored is not None:
+            self._card_cache.set(key, dict(stored))
+            return stored
+
+        card = await self._generate_card_from_word(word, source_language)
+        if card["back"] and card["back"] not in _AI_ERROR_MESSAGES:
+            self._card_cache.set(key, dict(card))
+            await self._store_persistent(key, card)
+        return card
+
+    async def _load_response(self, key: bytes) -> str | None:
+        """Get a cached text response from memory or the persistent cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response or None if not cached
+        """
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        stored = await self._load_persistent(key)
+        if stored is not None:
+            self._response_cache.set(key, stored)
+        return stored
+
+    async def _store_response(self, key: bytes, response: str) -> None:
+        """Cache a text response in memory and in the persistent cache.
+
+        Args:
+            key: Cache key
+            response: Response text
+        """
+        self._response_cache.set(key, response)
+        await self._store_persistent(key, response)
+
+    async def _load_persistent(self, key: bytes) -> Any:
+        """Read a response from the persistent cache.
+
+        Database failures are logged and treated as a miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded response or None if not cached
+        """
+        if not settings.ai_persistent_cache_enabled:
+            return None
+
         try:
-            if source_language == "russian":
-                prompt = (
-                    f"Создай карточку для изучения греческого слова по русскому слову: {word}\n\n"
-                    f"Предоставь:\n"
-                    f"1. Греческий перевод С АРТИКЛЕМ (ο/η/το для существительных)\n"
-                    f"2. Исходное русское слово\n"
-                    f"3. Пример предложения на греческом с русским переводом\n\n"
-                    f"ВАЖНО: Для существительных ОБЯЗАТЕЛЬНО укажи греческий артикль "
-                    f"(ο для мужского рода, η для женского, το для среднего).\n\n"
-                    f"Формат ответа:\n"
-                    f"FRONT: [греческое слово с артиклем если существительное]\n"
-                    f"BACK: [русское слово]\n"
-                    f"EXAMPLE: [пример на греческом] - [русский перевод]"
-                )
-            else:
-                prompt = (
-                    f"Создай карточку для изучения греческого слова: {word}\n\n"
-                    f"Предоставь:\n"
-                    f"1. Греческое слово С АРТИКЛЕМ (ο/η/το для существительных)\n"
-                    f"2. Русский перевод\n"
-                    f"3. Пример предложения на греческом с русским переводом\n\n"
-                    f"ВАЖНО: Для существительных ОБЯЗАТЕЛЬНО укажи греческий артикль "
-                    f"(ο для мужского рода, η для женского, το для среднего).\n"
-                    f"Если во вводе нет артикля, добавь правильный.\n\n"
-                    f"Формат ответа:\n"
-                    f"FRONT: [греческое слово с артиклем если существительное]\n"
-                    f"BACK: [русский перевод]\n"
-                    f"EXAMPLE: [пример на греческом] - [русский перевод]"
+            async with get_session() as session:
+                value = await AICacheRepository(session).get_value(key)
+        except Exception as e:
+            logger.warning("Failed to read persistent AI cache: %s", e)
+            return None
+
+        return None if value is None else orjson.loads(value)
+
+    async def _store_persistent(self, key: bytes, value: Any) -> None:
+        """Write a response to the persistent cache.
+
+        Database failures are logged and otherwise ignored.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response
+        """
+        if not settings.ai_persistent_cache_enabled:
+            return
+
+        try:
+            async with get_session() as session:
+                await AICacheRepository(session).set_values(
+                    {key: orjson.dumps(value).decode()},
+                    timedelta(days=settings.ai_persistent_cache_ttl_days),
                 )
+        except Exception as e:
+            logger.warning("Failed to write persistent AI cache: %s", e)
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Ты - эксперт по греческому языку, помогающий русскоязычным "
-                            "изучать греческий. Всегда давай точные переводы и убедись, что "
-                            "греческие существительные включают артикль (ο, η, το) для указания "
-                            "грамматического рода. Отвечай строго в запрошенном формате."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.7,
+    async def _embed(self, text: str) -> list[float]:
+        """Embed a prompt for the semantic cache.
+
+        Concurrent calls are batched into a single embeddings request.
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            Embedding vector
+        """
+        if AIService._embedding_batcher is None:
+            AIService._embedding_batcher = MicroBatcher(
+                self._embed_batch, EMBEDDING_BATCH_SIZE, EMBEDDING_BATCH_WAIT
+            )
+        return await AIService._embedding_batcher.submit(text)
+
+    @classmethod
+    async def _embed_batch(cls, texts: list[str]) -> list[list[float]]:
+        """Embed several prompts with one API request.
+
+        Args:
+            texts: Prompt texts
+
+        Returns:
+            Embedding vectors in input order
+        """
+        async with cls._circuit(settings.openai_embedding_model):
+            await cls._request_limiter.acquire()
+            response = await get_openai_client().embeddings.create(
+                model=settings.openai_embedding_model, input=texts, user=settings.openai_user
             )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def _semantic_lookup(
+        self, namespace: str, text: str
+    ) -> tuple[list[float] | None, str | None]:
+        """Look up the answer to a near-duplicate prompt.
+
+        Embedding failures are logged and treated as a miss.
+
+        Args:
+            namespace: Semantic cache namespace
+            text: Prompt text
+
+        Returns:
+            Prompt embedding (None if the cache is unavailable) and the cached
+            answer (None on a miss)
+        """
+        if not settings.ai_semantic_cache_enabled:
+            return None, None
 
-            content = response.choices[0].message.content or ""
-
-            # Parse the response
-            front = ""
-            back = ""
-            example = ""
-
-            for line in content.split("\n"):
-                if line.startswith("FRONT:"):
-                    front = line.replace("FRONT:", "").strip()
-                elif line.startswith("BACK:"):
-                    back = line.replace("BACK:", "").strip()
-                elif line.startswith("EXAMPLE:"):
-                    example = line.replace("EXAMPLE:", "").strip()
-
-            return {"front": front or word, "back": back or "", "example": example or ""}
-
-        except RateLimitError:
-            logger.warning("OpenAI rate limit exceeded")
-            return {
-                "front": word,
-                "back": ai_messages.MSG_AI_RATE_LIMIT,
-                "example": "",
-            }
-        except APITimeoutError:
-            logger.error("OpenAI request timeout")
-            return {"front": word, "back": ai_messages.MSG_AI_TIMEOUT, "example": ""}
-        except APIConnectionError:
-            logger.error("Failed to connect to OpenAI")
-            return {"front": word, "back": ai_messages.MSG_AI_CONNECTION_ERROR, "example": ""}
-        except APIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            return {"front": word, "back": ai_messages.MSG_AI_SERVICE_ERROR, "example": ""}
+        try:
+            embedding = await self._embed(text)
         except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
-            return {"front": word, "back": "", "example": ""}
+            logger.warning("Failed to embed prompt for semantic cache: %s", e)
+            return None, None
+
+        cache = await self._semantic_cache(namespace)
+        return embedding, cache.get(embedding)
+
+    async def _semantic_store(self, namespace: str, embedding: list[float], answer: str) -> None:
+        """Store an answer in the semantic cache and the database.
+
+        Database failures are logged and otherwise ignored.
+
+        Args:
+            namespace: Semantic cache namespace
+            embedding: Prompt embedding
+            answer: Answer to reuse for similar prompts
+        """
+        cache = await self._semantic_cache(namespace)
+        cache.set(embedding, answer)
+
+        if not settings.ai_persistent_cache_enabled:
+            return
 
+        try:
+            async with get_session() as session:
+                await AISemanticCacheRepository(session).add_entry(
+                    namespace,
+                    np.asarray(embedding, dtype=np.float32).tobytes(),
+                    answer,
+                    timedelta(seconds=settings.ai_semantic_cache_ttl_seconds),
+                )
+        except Exception as e:
+            logger.warning("Failed to write persistent semantic cache: %s", e)
+
+    async def _semantic_cache(self, namespace: str) -> SemanticCache[str]:
+        """Get the semantic cache of a namespace.
+
+        On first use the cache is filled from the database so that answers
+        survive restarts.
+
+        Args:
+            namespace: Semantic cache namespace
+
+        Returns:
+            Semantic cache
+        """
+        cache = self._semantic_caches.get(namespace)
+        if cache is not None:
+            return cache
+
+        cache = SemanticCache(
+            settings.ai_semantic_cache_max_size,
+            settings.ai_semantic_cache_ttl_seconds,
+            settings.ai_semantic_cache_threshold,
+        )
+        self._semantic_caches[namespace] = cache
+        if not settings.ai_persistent_cache_enabled:
+            return cache
+
+        try:
+            async with get_session() as session:
+                entries = await AISemanticCacheRepository(session).get_entries(
+                    namespace, settings.ai_semantic_cache_max_size
+                )
+        except Exception as e:
+            logger.warning("Failed to read persistent semantic cache: %s", e)
+            return cache
+
+        now = datetime.now(UTC)
+        for entry in entries:
+            # SQLite returns naive datetimes
+            expires_at = entry.expires_at.replace(tzinfo=entry.expires_at.tzinfo or UTC)
+            cache.set(
+                np.frombuffer(entry.embedding, dtype=np.float32),
+                entry.response,
+                ttl=(expires_at - now).total_seconds(),
+            )
+        return cache
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop all cached responses, cancel pending prefetches and close circuits."""
+        cls._translation_cache.clear()
+        cls._card_cache.clear()
+        cls._response_cache.clear()
+        cls._semantic_caches.clear()
+        for task in cls._card_prefetches.values():
+            task.cancel()
+        cls._card_prefetches.clear()
+        cls._circuits.clear()
+
+    @_openai_guarded(
+        on_error=lambda message, word, *_: {"front": word, "back": message, "example": ""},
+        unexpected="",
+    )
+    async def _generate_card_from_word(self, word: str, source_language: str) -> dict[str, str]:
+        """Request flashcard content from OpenAI.
+
+        Args:
+            word: Word to create card from
+            source_language: 'greek' or 'russian'
+
+        Returns:
+            Dictionary with 'front' (Greek with article), 'back' (Russian), 'example' fields
+        """
+        content = await self._complete(
+            _build_messages(_CARD_PREFIX, _build_card_prompt(word, source_language)),
+            max_tokens=CARD_MAX_TOKENS,
+            temperature=0.7,
+            response_format=_CARD_RESPONSE_FORMAT,
+        )
+
+        return _parse_card(content or "", word)
+
+    async def submit_card_batch(self, words: list[str], source_language: str = "greek") -> str:
+        """Submit flashcard generation for many words to the OpenAI Batch API.
+
+        Batch jobs cost half the synchronous price and do not consume the
+        synchronous rate limits, but may take up to 24 hours. Intended for
+        non-interactive work such as deck imports.
+
+        Args:
+            words: Words to create cards from
+            source_language: 'greek' or 'russian'
+
+        Returns:
+            Batch ID to pass to collect_card_batch
+        """
+        batch_id = await self._submit_batch(
+            "cards",
+            [
+                {
+                    "model": self.model,
+                    "messages": _build_messages(
+                        _CARD_PREFIX, _build_card_prompt(word, source_language)
+                    ),
+                    "max_tokens": CARD_MAX_TOKENS,
+                    "temperature": 0.7,
+                    "response_format": _CARD_RESPONSE_FORMAT,
+                    "user": self.user,
+                }
+                for word in words
+            ],
+        )
+        logger.info("Submitted card batch %s with %d words", batch_id, len(words))
+        return batch_id
+
+    async def collect_card_batch(
+        self,
+        batch_id: str,
+        words: list[str],
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0,
+    ) -> list[dict[str, str]]:
+        """Wait for a card batch to finish and parse its results.
+
+        Polls with exponential backoff between poll_interval and
+        max_poll_interval seconds.
+
+        Args:
+            batch_id: ID returned by submit_card_batch
+            words: Words passed to submit_card_batch, in the same order
+            poll_interval: Initial delay between status checks in seconds
+            max_poll_interval: Upper bound for the delay in seconds
+
+        Returns:
+            Cards in the same order as words; failed items have an empty back
+        """
+        contents = await self._collect_batch(batch_id, len(words), poll_interval, max_poll_interval)
+        return [
+            (
+                _parse_card(content, word)
+                if content is not None
+                else {"front": word, "back": "", "example": ""}
+            )
+            for word, content in zip(words, contents, strict=True)
+        ]
+
+    async def submit_word_extraction_batch(self, phrases: list[str], source_language: str) -> str:
+        """Submit word extraction for many phrases to the OpenAI Batch API.
+
+        The bulk counterpart of extract_and_lemmatize_words for
+        non-interactive work such as importing many texts at once.
+
+        Args:
+            phrases: Phrases to extract words from
+            source_language: 'greek' or 'russian'
+
+        Returns:
+            Batch ID to pass to collect_word_extraction_batch
+        """
+        batch_id = await self._submit_batch(
+            "words",
+            [
+                {
+                    "model": self.model,
+                    "user": self.user,
+                    **_word_extraction_request(phrase, source_language),
+                }
+                for phrase in phrases
+            ],
+        )
+        logger.info("Submitted word extraction batch %s with %d phrases", batch_id, len(phrases))
+        return batch_id
+
+    async def collect_word_extraction_batch(
+        self,
+        batch_id: str,
+        phrases: list[str],
+        source_language: str,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0,
+    ) -> list[list[dict]]:
+        """Wait for a word extraction batch to finish and parse its results.
+
+        Successful results are also cached, so later calls to
+        extract_and_lemmatize_words for the same phrases are free.
+
+        Args:
+            batch_id: ID returned by submit_word_extraction_batch
+            phrases: Phrases passed to submit_word_extraction_batch, in the same order
+            source_language: 'greek' or 'russian'
+            poll_interval: Initial delay between status checks in seconds
+            max_poll_interval: Upper bound for the delay in seconds
+
+        Returns:
+            Word lists in the same order as phrases; failed items are empty
+        """
+        contents = await self._collect_batch(
+            batch_id, len(phrases), poll_interval, max_poll_interval
+        )
+        results: list[list[dict]] = []
+        for phrase, content in zip(phrases, contents, strict=True):
+            try:
+                words = orjson.loads(content).get("words", []) if content is not None else None
+            except ValueError:
+                logger.warning("Unparsable word extraction batch item: %s", content)
+                words = None
+
+            if words is None:
+                results.append([])
+                continue
+            key = _cache_key("words", source_language, " ".join(phrase.split()))
+            self._response_cache.set(key, words)
+            results.append(copy.deepcopy(words))
+        return results
+
+    async def _submit_batch(self, name: str, bodies: list[dict]) -> str:
+        """Upload chat completion requests and start a batch job.
+
+        Args:
+            name: Name of the uploaded JSONL file, without extension
+            bodies: Request bodies; their indexes become the custom IDs
+
+        Returns:
+            Batch ID
+        """
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }
+            )
+            for index, body in enumerate(bodies)
+        ]
+
+        batch_file = await self.client.files.create(
+            file=(f"{name}.jsonl", b"\n".join(lines)), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def _collect_batch(
+        self, batch_id: str, count: int, poll_interval: float, max_poll_interval: float
+    ) -> list[str | None]:
+        """Wait for a batch job to finish and download its responses.
+
+        Args:
+            batch_id: Batch ID
+            count: Number of requests in the batch
+            poll_interval: Initial delay between status checks in seconds
+            max_poll_interval: Upper bound for the delay in seconds
+
+        Returns:
+            Response contents by request index; None for failed requests
+        """
+        contents: list[str | None] = [None] * count
+
+        delay = poll_interval
+        batch = await self.client.batches.retrieve(batch_id)
+        while batch.status != "completed":
+            if batch.status in _BATCH_FAILED_STATUSES:
+                logger.error("Batch %s ended with status %s", batch_id, batch.status)
+                return contents
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = await self.client.batches.retrieve(batch_id)
+
+        if not batch.output_file_id:
+            logger.error("Batch %s completed without output", batch_id)
+            return contents
+
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            item = orjson.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(
+                    "Batch %s item %s failed: %s",
+                    batch_id,
+                    item.get("custom_id"),
+                    item.get("error"),
+                )
+                continue
+            contents[int(item["custom_id"])] = (
+                response["body"]["choices"][0]["message"]["content"] or ""
+            )
+
+        return contents
+
+    @_openai_guarded(unexpected="")
     async def generate_example_sentence(self, word: str) -> str:
         """Generate an example sentence using a Greek word.
 
@@ -561,45 +1935,23 @@ class AIService:
         Returns:
             Example sentence with Russian translation
         """
-        try:
-            prompt = (
-                f"Создай простое примерное предложение на греческом, используя слово: {word}\n"
-                f"Предоставь греческое предложение и его русский перевод."
-            )
+        key = _cache_key("example", word)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Ты - преподаватель греческого языка, создающий примеры предложений. "
-                            "Отвечай на русском языке."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=300,
-                temperature=0.7,
-            )
+        prompt = EXAMPLE_USER_PROMPT.format(word=word)
 
-            return response.choices[0].message.content or ""
-
-        except RateLimitError:
-            logger.warning("OpenAI rate limit exceeded")
-            return ai_messages.MSG_AI_RATE_LIMIT
-        except APITimeoutError:
-            logger.error("OpenAI request timeout")
-            return ai_messages.MSG_AI_TIMEOUT
-        except APIConnectionError:
-            logger.error("Failed to connect to OpenAI")
-            return ai_messages.MSG_AI_CONNECTION_ERROR
-        except APIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            return ai_messages.MSG_AI_SERVICE_ERROR
-        except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
-            return ""
+        content = await self._complete(
+            _build_messages(_EXAMPLE_PREFIX, prompt),
+            model=self.fast_model,
+            max_tokens=300,
+            temperature=0.7,
+        )
+
+        if content:
+            self._response_cache.set(key, content)
+        return content or ""
 
     async def suggest_deck_for_word(
         self,
@@ -620,45 +1972,36 @@ class AIService:
         if not deck_names:
             return None
 
+        local_match = _match_deck_by_name(word, translation, deck_names)
+        if local_match is not None:
+            return local_match
+
+        # An empty string records that no deck fits
+        key = _cache_key("deck", word, translation, _exact("\n".join(sorted(deck_names))))
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached or None
+
         try:
-            prompt = (
-                f"Слово: {word} ({translation})\n\n"
-                f"Колоды пользователя: {', '.join(deck_names)}\n\n"
-                f"Какая колода лучше всего подходит для этого слова по смыслу/категории?\n"
-                f"Ответь ТОЛЬКО названием колоды из списка или NONE если ни одна не подходит."
+            prompt = DECK_SUGGESTION_USER_PROMPT.format(
+                word=word, translation=translation, deck_names=", ".join(deck_names)
             )
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Ты помогаешь сортировать слова по тематическим колодам. "
-                            "Отвечай только названием колоды или NONE."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            content = await self._complete(
+                _build_messages(_DECK_SUGGESTION_PREFIX, prompt),
                 max_tokens=50,
-                temperature=0.3,
+                temperature=0,
             )
 
-            result = response.choices[0].message.content or ""
-            result = result.strip()
-
-            if result.upper() == "NONE":
-                return None
+            result = (content or "").strip().lower()
 
-            # Find matching deck (case-insensitive)
-            for name in deck_names:
-                if name.lower() == result.lower():
-                    return name
-
-            return None
+            # Find matching deck (case-insensitive); "NONE" matches nothing
+            suggestion = next((name for name in deck_names if name.lower() == result), None)
+            self._response_cache.set(key, suggestion or "")
+            return suggestion
 
         except Exception as e:
-            logger.warning(f"Failed to suggest deck: {e}")
+            logger.warning("Failed to suggest deck: %s", e)
             return None
 
     async def generate_deck_name(self, word: str, translation: str) -> str:
@@ -671,37 +2014,37 @@ class AIService:
         Returns:
             Suggested deck name in Russian
         """
+        key = _cache_key("deck_name", word, translation)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            prompt = (
-                f"Слово: {word} ({translation})\n\n"
-                f"Придумай короткое название колоды на русском для категории этого слова.\n"
-                f"Например: Еда, Транспорт, Семья, Одежда, Дом, Работа.\n"
-                f"Ответь ТОЛЬКО названием (1-3 слова), без пояснений."
-            )
+            prompt = DECK_NAME_USER_PROMPT.format(word=word, translation=translation)
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Ты генерируешь короткие названия категорий. Отвечай только названием.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+            content = await self._complete(
+                _build_messages(_DECK_NAME_PREFIX, prompt),
                 max_tokens=30,
                 temperature=0.5,
             )
 
-            result = response.choices[0].message.content or "Разное"
-            return result.strip()[:50]
+            if not content:
+                return "Разное"
+
+            name = content.strip()[:50]
+            self._response_cache.set(key, name)
+            return name
 
         except Exception as e:
-            logger.warning(f"Failed to generate deck name: {e}")
+            logger.warning("Failed to generate deck name: %s", e)
             return "Разное"
 
     async def categorize_message(self, message: str) -> dict:
         """Categorize a user message to determine intent.
 
+        Messages from concurrent callers that arrive within a short window
+        are categorized together with one request.
+
         Args:
             message: User's message text
 
@@ -711,34 +2054,87 @@ class AIService:
         Raises:
             Exception: If API call fails or response cannot be parsed
         """
+        key = _cache_key("category", message)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        stored = await self._load_persistent(key)
+        if stored is not None:
+            self._response_cache.set(key, copy.deepcopy(stored))
+            return stored
+
+        if AIService._categorization_batcher is None:
+            AIService._categorization_batcher = MicroBatcher(
+                lambda messages: get_ai_service().categorize_messages_batch(messages),
+                CATEGORIZATION_BATCH_SIZE,
+                CATEGORIZATION_BATCH_WAIT,
+            )
+        result = await AIService._categorization_batcher.submit(message)
+
+        if result:
+            self._response_cache.set(key, copy.deepcopy(result))
+            await self._store_persistent(key, result)
+        return result
+
+    async def categorize_messages_batch(self, messages: list[str]) -> list[dict]:
+        """Categorize several user messages with one API request.
+
+        Args:
+            messages: User message texts
+
+        Returns:
+            Categorization results in input order
+
+        Raises:
+            Exception: If API call fails or response cannot be parsed
+        """
+        if len(messages) == 1:
+            prompt = CATEGORIZATION_USER_PROMPT.format(message=messages[0])
+        else:
+            items = "\n".join(
+                f"{number}. {orjson.dumps(message).decode()}"
+                for number, message in enumerate(messages, 1)
+            )
+            prompt = CATEGORIZATION_BATCH_USER_PROMPT.format(items=items)
+
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": CATEGORIZATION_SYSTEM_PROMPT,
-                    },
-                    {
-                        "role": "user",
-                        "content": CATEGORIZATION_USER_PROMPT.format(message=message),
-                    },
-                ],
-                max_tokens=200,
-                temperature=0.2,
+            content = await self._complete(
+                _build_messages(_CATEGORIZATION_PREFIX, prompt),
+                max_tokens=CATEGORIZATION_MAX_TOKENS * len(messages),
+                temperature=0,
                 response_format={"type": "json_object"},
             )
 
-            content = response.choices[0].message.content or "{}"
-            return json.loads(content)
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI categorization response: {e}")
+            data = orjson.loads(content or "{}")
+            if len(messages) == 1:
+                return [data if isinstance(data, dict) else {}]
+
+            results = data.get("results") if isinstance(data, dict) else None
+            if not isinstance(results, list) or len(results) != len(messages):
+                raise ValueError(f"Expected {len(messages)} categorization results")
+            for number, result in enumerate(results, 1):
+                # Results are mapped back to their senders by position, so a
+                # reordered or merged list must not be used at all
+                if not isinstance(result, dict) or str(result.pop("number", None)) != str(number):
+                    raise ValueError("Categorization results are not numbered in order")
+
+        except ValueError as e:
+            logger.error("Failed to parse AI categorization response: %s", e)
             raise
         except (RateLimitError, APITimeoutError, APIConnectionError, APIError) as e:
-            logger.error(f"AI categorization API error: {e}")
+            logger.error("AI categorization API error: %s", e)
             raise
 
+        # Content taken from another message of the batch would reach the wrong
+        # user, so such a message is categorized again on its own
+        for index, (message, result) in enumerate(zip(messages, results, strict=True)):
+            if not _is_extracted_from(result, message):
+                logger.warning("Categorization result %s does not match its message", index + 1)
+                results[index] = (await self.categorize_messages_batch([message]))[0]
+        return results
+
+    @_openai_guarded(on_error=lambda *_args, **_kwargs: [])
     async def extract_and_lemmatize_words(
         self,
         phrase: str,
@@ -757,45 +2153,42 @@ class AIService:
             - lemma_with_article: for nouns, includes article
             - translation: Russian translation (if Greek) or Greek (if Russian)
             - pos: part of speech
+            Empty list if the request or parsing failed
         """
-        try:
-            lang_names = {"greek": "греческий", "russian": "русский"}
-            prompt = WORD_EXTRACTION_USER_PROMPT.format(
-                language=lang_names.get(source_language, source_language),
-                phrase=phrase,
+        # Copies of a phrase that differ only in spacing or case share an entry
+        key = _cache_key("words", source_language, " ".join(phrase.split()))
+        cached: list[dict] | None = self._response_cache.get(key)
+        if cached is None:
+            cached = await self._single_flight(
+                key, lambda: self._fetch_words(key, phrase, source_language)
             )
+        return copy.deepcopy(cached)
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": WORD_EXTRACTION_SYSTEM_PROMPT,
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=1000,
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
+    async def _fetch_words(self, key: bytes, phrase: str, source_language: str) -> list[dict]:
+        """Request word extraction and cache the result.
 
-            content = response.choices[0].message.content or "{}"
-            result = json.loads(content)
-            return result.get("words", [])
+        Args:
+            key: Cache key
+            phrase: Phrase to extract words from
+            source_language: 'greek' or 'russian'
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse word extraction response: {e}")
-            return []
-        except (RateLimitError, APITimeoutError, APIConnectionError, APIError) as e:
-            logger.error(f"Word extraction API error: {e}")
-            return []
-        except Exception as e:
-            logger.exception(f"Word extraction failed: {e}")
-            return []
+        Returns:
+            List of word dictionaries
+        """
+        content = await self._complete(**_word_extraction_request(phrase, source_language))
+
+        words = orjson.loads(content or "{}").get("words", [])
+        self._response_cache.set(key, words)
+        return words
 
+    @_openai_guarded(
+        on_error=lambda message, *_args, **_kwargs: ImageTextResult(
+            recognized_text="", translation=message, has_greek_text=False
+        )
+    )
     async def process_image_text(
         self,
-        image_base64: str,
+        image: bytes | str,
         user_prompt: str | None = None,
     ) -> ImageTextResult:
         """Process image containing Greek text.
@@ -804,91 +2197,113 @@ class AIService:
         and optionally process it according to user's prompt.
 
         Args:
-            image_base64: Base64-encoded image data
+            image: Raw image bytes, or base64-encoded image data
             user_prompt: Optional user instruction (e.g., "check homework")
 
         Returns:
             ImageTextResult with recognized text and processing results
         """
-        try:
-            # Type hint needed because messages can have string or list content
-            messages: list[dict] = [
-                {
-                    "role": "system",
-                    "content": PHOTO_TEXT_SYSTEM_PROMPT,
-                }
-            ]
+        key = _cache_key("image", _exact(image), user_prompt or "")
+        cached: ImageTextResult | None = self._response_cache.get(key)
+        if cached is None:
+            cached = await self._single_flight(
+                key, lambda: self._fetch_image_text(key, image, user_prompt)
+            )
+        return replace(cached)
 
-            # Build user message with image
-            user_content: list[dict] = [
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{image_base64}",
-                        "detail": "high",
-                    },
+    async def _fetch_image_text(
+        self, key: bytes, image: bytes | str, user_prompt: str | None
+    ) -> ImageTextResult:
+        """Request image text recognition and cache a result with Greek text.
+
+        Args:
+            key: Cache key
+            image: Raw image bytes, or base64-encoded image data
+            user_prompt: Optional user instruction
+
+        Returns:
+            ImageTextResult with recognized text and processing results
+        """
+        # Build user message with image
+        user_content: list[dict] = [
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": _image_data_url(image),
+                    "detail": "high",
                 },
-            ]
+            },
+        ]
+
+        text = (
+            PHOTO_TEXT_USER_PROMPT.format(user_prompt=user_prompt)
+            if user_prompt
+            else PHOTO_TEXT_DEFAULT_USER_PROMPT
+        )
+        user_content.append({"type": "text", "text": text})
+
+        content = await self._complete(
+            _build_messages(_PHOTO_TEXT_PREFIX, user_content),
+            model=self.vision_model,
+            max_tokens=self.max_tokens,
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+
+        result = orjson.loads(content or "{}")
+
+        image_text = ImageTextResult(
+            recognized_text=result.get("recognized_text", ""),
+            translation=result.get("translation", ""),
+            additional_response=result.get("response"),
+            has_greek_text=result.get("has_greek_text", False),
+        )
+        # A photo with no text found may just be blurry or cropped; let a resend retry it
+        if image_text.has_greek_text:
+            self._response_cache.set(key, image_text)
+        return image_text
+
+    async def process_images_text(
+        self,
+        images: list[bytes | str],
+        user_prompt: str | None = None,
+        concurrency: int | None = None,
+    ) -> list[ImageTextResult]:
+        """Process several images containing Greek text concurrently.
 
-            text = (
-                f"Запрос пользователя: {user_prompt}"
-                if user_prompt
-                else "Распознай греческий текст на изображении и переведи на русский."
-            )
-            user_content.append({"type": "text", "text": text})
+        Failed images get the same fallback result as process_image_text.
 
-            messages.append({"role": "user", "content": user_content})
+        Args:
+            images: Raw image bytes, or base64-encoded image data
+            user_prompt: Optional user instruction applied to every image
+            concurrency: Maximum number of requests in flight at once,
+                defaults to settings.openai_vision_concurrency
 
-            response = await self.client.chat.completions.create(
-                model=settings.openai_vision_model,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
+        Returns:
+            Results in the same order as images
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.openai_vision_concurrency)
 
-            content = response.choices[0].message.content or "{}"
-            result = json.loads(content)
+        async def process(image: bytes | str) -> ImageTextResult:
+            async with semaphore:
+                return await self.process_image_text(image, user_prompt)
 
-            return ImageTextResult(
-                recognized_text=result.get("recognized_text", ""),
-                translation=result.get("translation", ""),
-                additional_response=result.get("response"),
-                has_greek_text=result.get("has_greek_text", False),
-            )
+        return list(await asyncio.gather(*(process(image) for image in images)))
 
-        except RateLimitError:
-            logger.warning("OpenAI rate limit exceeded for vision request")
-            return ImageTextResult(
-                recognized_text="",
-                translation=ai_messages.MSG_AI_RATE_LIMIT,
-                has_greek_text=False,
-            )
-        except APITimeoutError:
-            logger.error("OpenAI vision request timeout")
-            return ImageTextResult(
-                recognized_text="",
-                translation=ai_messages.MSG_AI_TIMEOUT,
-                has_greek_text=False,
-            )
-        except APIConnectionError:
-            logger.error("Failed to connect to OpenAI for vision")
-            return ImageTextResult(
-                recognized_text="",
-                translation=ai_messages.MSG_AI_CONNECTION_ERROR,
-                has_greek_text=False,
-            )
-        except APIError as e:
-            logger.error(f"OpenAI Vision API error: {e}")
-            return ImageTextResult(
-                recognized_text="",
-                translation=ai_messages.MSG_AI_SERVICE_ERROR,
-                has_greek_text=False,
-            )
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse vision response: {e}")
-            return ImageTextResult(
-                recognized_text="",
-                translation=ai_messages.MSG_AI_UNEXPECTED_ERROR,
-                has_greek_text=False,
-            )
+
+# Process-wide AI service, holding the shared client
+_service: AIService | None = None
+
+
+def get_ai_service() -> AIService:
+    """Get or create the shared AI service.
+
+    Returns:
+        AIService instance reused by all handlers and services
+    """
+    global _service
+
+    if _service is None:
+        _service = AIService()
+
+    return _service
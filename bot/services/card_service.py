@@ -7,7 +7,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.core.spaced_repetition import get_initial_srs_values
 from bot.database.models.card import Card
 from bot.database.repositories.card_repo import CardRepository
-from bot.database.repositories.deck_repo import DeckRepository
 
 
 class CardService:
@@ -74,18 +73,7 @@ class CardService:
         Returns:
             Card if found and owned by user, None otherwise
         """
-        card = await self.repo.get_by_id(card_id)
-        if not card:
-            return None
-
-        # Verify ownership via deck
-        deck_repo = DeckRepository(self.repo.session)
-        deck = await deck_repo.get_by_id(card.deck_id)
-
-        if not deck or deck.user_id != user_id:
-            return None
-
-        return card
+        return await self.repo.get_user_card(card_id, user_id)
 
     async def get_deck_cards(
         self, deck_id: int, limit: int | None = None, offset: int = 0
@@ -174,17 +162,23 @@ class CardService:
         Returns:
             Updated card instance
         """
-        update_data: dict[str, str | None] = {}
-        if front is not None:
-            update_data["front"] = front
-        if back is not None:
-            update_data["back"] = back
+        update_data: dict[str, str | None] = {
+            field: value
+            for field, value in (
+                ("front", front),
+                ("back", back),
+                ("example", example),
+                ("notes", notes),
+            )
+            if value is not None
+        }
         if clear_example:
             update_data["example"] = None
-        elif example is not None:
-            update_data["example"] = example
-        if notes is not None:
-            update_data["notes"] = notes
+
+        # Unchanged fields are dropped so that a no-op edit skips the flush
+        update_data = {
+            field: value for field, value in update_data.items() if value != getattr(card, field)
+        }
 
         if update_data:
             return await self.repo.update(card, **update_data)
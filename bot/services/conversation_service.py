@@ -1,19 +1,54 @@
 """Conversation service for managing AI chat history."""
 
+import math
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from bot.config.logging_config import get_logger
 from bot.config.settings import settings
 from bot.database.models.conversation import ConversationMessage, MessageRole
 from bot.database.models.user import User
 from bot.database.repositories.conversation_repo import ConversationRepository
+from bot.utils.cache import TTLCache
 
 logger = get_logger(__name__)
 
+# Conversations whose recent history is kept in memory, and for how long
+HISTORY_CACHE_SIZE = 1024
+HISTORY_CACHE_TTL = 600.0
+
+# Session.info key of history cache updates waiting for the commit
+_PENDING_CACHE_UPDATES = "conversation_history_updates"
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_cache_updates(session: Session) -> None:
+    """Apply history cache updates once their transaction is committed."""
+    for update in session.info.pop(_PENDING_CACHE_UPDATES, []):
+        update()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_cache_updates(session: Session) -> None:
+    """Drop history cache updates of a rolled back transaction."""
+    session.info.pop(_PENDING_CACHE_UPDATES, None)
+
 
 class ConversationService:
     """Service for managing conversation history."""
 
+    # (user_id, conversation_id) -> (message count, newest messages). Shared
+    # by all instances, since a service is created per update. Updated in
+    # place when messages are added, so a chat turn needs no history query.
+    # Updates wait for the commit, so rolled back messages never get cached.
+    _history_cache: TTLCache[tuple[int, str], tuple[int, list[dict[str, str]]]] = TTLCache(
+        maxsize=HISTORY_CACHE_SIZE, ttl=HISTORY_CACHE_TTL
+    )
+
     def __init__(self, session: AsyncSession):
         """Initialize conversation service.
 
@@ -45,13 +80,15 @@ class ConversationService:
             f"Adding user message for user_id={user.id}, "
             f"conversation_id={conversation_id}, type={message_type}"
         )
-        return await self.repo.add_message(
+        message = await self.repo.add_message(
             user_id=user.id,
             role=MessageRole.USER,
             content=content,
             conversation_id=conversation_id,
             message_type=message_type,
         )
+        self._append_to_history(user.id, conversation_id, [message])
+        return message
 
     async def add_assistant_message(
         self,
@@ -76,7 +113,7 @@ class ConversationService:
         logger.debug(
             f"Adding assistant message for user_id={user.id}, " f"conversation_id={conversation_id}"
         )
-        return await self.repo.add_message(
+        message = await self.repo.add_message(
             user_id=user.id,
             role=MessageRole.ASSISTANT,
             content=content,
@@ -84,6 +121,74 @@ class ConversationService:
             message_type=message_type,
             token_count=token_count,
         )
+        self._append_to_history(user.id, conversation_id, [message])
+        return message
+
+    async def add_turn(
+        self,
+        user: User,
+        user_content: str,
+        assistant_content: str,
+        conversation_id: str = "default",
+        message_type: str | None = None,
+        user_sent_at: datetime | None = None,
+    ) -> None:
+        """Add a user message and the assistant's reply in one database write.
+
+        Args:
+            user: User model instance
+            user_content: User message content
+            assistant_content: Assistant reply content
+            conversation_id: Conversation identifier
+            message_type: Type of interaction
+            user_sent_at: When the user sent the message (defaults to now)
+        """
+        logger.debug(
+            f"Adding conversation turn for user_id={user.id}, "
+            f"conversation_id={conversation_id}, type={message_type}"
+        )
+        replied_at = datetime.now(UTC)
+        messages = await self.repo.add_messages(
+            user_id=user.id,
+            messages=[
+                (MessageRole.USER, user_content, min(user_sent_at or replied_at, replied_at)),
+                (MessageRole.ASSISTANT, assistant_content, replied_at),
+            ],
+            conversation_id=conversation_id,
+            message_type=message_type,
+        )
+        self._append_to_history(user.id, conversation_id, messages)
+
+    def _after_commit(self, update: Callable[[], None]) -> None:
+        """Run a history cache update once the session's transaction commits.
+
+        Args:
+            update: Cache update to run
+        """
+        self.session.sync_session.info.setdefault(_PENDING_CACHE_UPDATES, []).append(update)
+
+    def _append_to_history(
+        self, user_id: int, conversation_id: str, messages: list[ConversationMessage]
+    ) -> None:
+        """Add new messages to the cached history, if the conversation is cached.
+
+        Args:
+            user_id: User's database ID
+            conversation_id: Conversation identifier
+            messages: Messages just added, oldest first
+        """
+        key = (user_id, conversation_id)
+        entries = [{"role": message.role, "content": message.content} for message in messages]
+
+        def append() -> None:
+            cached = self._history_cache.get(key)
+            if cached is None:
+                return
+            total, recent = cached
+            recent = [*recent, *entries][-settings.conversation_history_limit :]
+            self._history_cache.set(key, (total + len(entries), recent))
+
+        self._after_commit(append)
 
     async def get_context_messages(
         self,
@@ -93,23 +198,47 @@ class ConversationService:
     ) -> list[dict[str, str]]:
         """Get recent messages formatted for OpenAI API.
 
+        The window start advances in steps of half the limit instead of on
+        every message, so consecutive requests resend an identical history
+        prefix that OpenAI can serve from its prompt cache. The window holds
+        between half the limit and the full limit of messages. Once read,
+        the history is kept in memory and extended as messages are added.
+
         Args:
             user: User model instance
             conversation_id: Conversation identifier
-            limit: Number of messages (uses setting if not provided)
+            limit: Maximum number of messages (uses setting if not provided)
 
         Returns:
             List of message dicts with 'role' and 'content' keys
         """
         message_limit = limit or settings.conversation_history_limit
+        step = max(message_limit // 2, 1)
 
-        messages = await self.repo.get_recent_messages(
-            user_id=user.id,
-            conversation_id=conversation_id,
-            limit=message_limit,
-        )
+        key = (user.id, conversation_id)
+        cached = self._history_cache.get(key)
+        if cached is not None:
+            total, recent = cached
+        else:
+            total = await self.repo.count_messages(user_id=user.id, conversation_id=conversation_id)
+            recent = []
+
+        # Smallest step-aligned start that keeps the window within the limit
+        start = max(math.ceil((total - message_limit) / step) * step, 0)
+        if total <= start:
+            return []
 
-        return [{"role": msg.role, "content": msg.content} for msg in messages]
+        if len(recent) < total - start:
+            rows = await self.repo.get_recent_message_contents(
+                user_id=user.id,
+                conversation_id=conversation_id,
+                limit=total - start,
+            )
+            recent = [{"role": role, "content": content} for role, content in rows]
+            loaded = (total, recent)
+            self._after_commit(lambda: self._history_cache.set(key, loaded))
+
+        return recent[len(recent) - (total - start) :]
 
     async def clear_conversation(
         self,
@@ -128,6 +257,8 @@ class ConversationService:
         logger.info(
             f"Clearing conversation for user_id={user.id}, " f"conversation_id={conversation_id}"
         )
+        key = (user.id, conversation_id)
+        self._after_commit(lambda: self._history_cache.set(key, (0, [])))
         return await self.repo.clear_conversation(
             user_id=user.id,
             conversation_id=conversation_id,
@@ -167,5 +298,12 @@ class ConversationService:
         """
         retention_days = days or settings.conversation_retention_days
         deleted = await self.repo.delete_old_messages(days=retention_days)
+        if deleted:
+            self._after_commit(self.clear_cache)
         logger.info(f"Cleaned up {deleted} old conversation messages")
         return deleted
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached conversation history."""
+        cls._history_cache.clear()
@@ -92,11 +92,12 @@ class DeckService:
         Returns:
             Updated deck instance
         """
-        update_data = {}
-        if name is not None:
-            update_data["name"] = name
-        if description is not None:
-            update_data["description"] = description
+        # Unchanged fields are dropped so that a no-op edit skips the flush
+        update_data = {
+            field: value
+            for field, value in (("name", name), ("description", description))
+            if value is not None and value != getattr(deck, field)
+        }
 
         if update_data:
             return await self.repo.update(deck, **update_data)
@@ -1,17 +1,18 @@
 """Exercise service for grammar practice sessions."""
 
-import json
 import random
 from dataclasses import dataclass
 from enum import Enum
 
-from openai import APIConnectionError, APIError, APITimeoutError, AsyncOpenAI, RateLimitError
+import orjson
+from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.config.logging_config import get_logger
 from bot.config.settings import settings
 from bot.database.repositories.card_repo import CardRepository
 from bot.database.repositories.deck_repo import DeckRepository
+from bot.services.ai_service import get_openai_client
 
 logger = get_logger(__name__)
 
@@ -66,10 +67,7 @@ class ExerciseService:
         self.session = session
         self.card_repo = CardRepository(session)
         self.deck_repo = DeckRepository(session)
-        self.client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            timeout=settings.openai_timeout,
-        )
+        self.client = get_openai_client()
         self.model = settings.openai_model
 
     async def get_user_words_for_exercise(
@@ -357,7 +355,7 @@ Respond in JSON format:
             )
 
             content = response.choices[0].message.content or "{}"
-            data = json.loads(content)
+            data = orjson.loads(content)
 
             return {
                 "word": data.get("word", "γραφω"),
@@ -460,7 +458,7 @@ Respond in JSON:
             )
 
             content = response.choices[0].message.content or "{}"
-            data = json.loads(content)
+            data = orjson.loads(content)
             expected_answer = data.get("correct_form", word)
         except (RateLimitError, APITimeoutError, APIConnectionError, APIError) as e:
             logger.error(f"Tense task generation API error: {e}")
@@ -533,7 +531,7 @@ Respond in JSON:
             )
 
             content = response.choices[0].message.content or "{}"
-            data = json.loads(content)
+            data = orjson.loads(content)
             expected_answer = data.get("correct_form", word)
         except (RateLimitError, APITimeoutError, APIConnectionError, APIError) as e:
             logger.error(f"Conjugation task generation API error: {e}")
@@ -607,7 +605,7 @@ Respond in JSON:
             )
 
             content = response.choices[0].message.content or "{}"
-            data = json.loads(content)
+            data = orjson.loads(content)
             expected_answer = data.get("correct_form", word)
         except (RateLimitError, APITimeoutError, APIConnectionError, APIError) as e:
             logger.error(f"Case task generation API error: {e}")
@@ -678,7 +676,7 @@ Respond in JSON:
             )
 
             content = response.choices[0].message.content or "{}"
-            data = json.loads(content)
+            data = orjson.loads(content)
 
             return AnswerResult(
                 is_correct=data.get("is_correct", False),
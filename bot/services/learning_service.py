@@ -1,13 +1,11 @@
 """Learning service for managing study sessions and card reviews."""
 
-import asyncio
 from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.config.logging_config import get_logger
 from bot.core.card_scheduler import (
-    get_next_card_for_learning,
     mix_new_and_review_cards,
     prioritize_cards,
 )
@@ -75,12 +73,11 @@ class LearningService:
         Returns:
             List of cards for the session
         """
-        # Get new and due cards
-        new_cards = await self.card_repo.get_new_cards(deck_id, limit=max_new_cards)
-        due_cards = await self.card_repo.get_due_cards(deck_id, limit=max_cards)
-
-        # Prioritize due cards
-        due_cards = prioritize_cards(due_cards)
+        # Get new and due cards in one round trip; due cards come back most
+        # overdue first, which is already their priority order
+        new_cards, due_cards = await self.card_repo.get_session_cards(
+            deck_id, new_limit=max_new_cards, due_limit=max_cards
+        )
 
         # Mix new and review cards
         session_cards = mix_new_and_review_cards(
@@ -101,10 +98,7 @@ class LearningService:
         Returns:
             Next card or None if no cards available
         """
-        # Get all cards in deck
-        all_cards = await self.card_repo.get_deck_cards(deck_id)
-
-        return get_next_card_for_learning(all_cards)
+        return await self.card_repo.get_next_card(deck_id)
 
     async def process_card_review(
         self,
@@ -162,11 +156,9 @@ class LearningService:
         if quality >= 3:  # Remembered or Easy
             card.correct_reviews += 1
 
-        await self.session.flush()
-        await self.session.refresh(card)
-
-        # Create review record
-        await self.review_repo.create(
+        # Create review record, written in the same flush as the card update.
+        # All changed card columns are set client-side, so no refresh is needed.
+        self.review_repo.add_review(
             card_id=card_id,
             user_id=user_id,
             quality=quality,
@@ -175,6 +167,7 @@ class LearningService:
             ease_factor_before=ease_factor_before,
             interval_before=interval_before,
         )
+        await self.session.flush()
 
         return card
 
@@ -187,14 +180,7 @@ class LearningService:
         Returns:
             Dictionary with deck statistics
         """
-        # Parallelize independent queries
-        all_cards, new_cards, due_cards = await asyncio.gather(
-            self.card_repo.get_deck_cards(deck_id),
-            self.card_repo.count_new_cards(deck_id),
-            self.card_repo.count_due_cards(deck_id),
-        )
-
-        total_cards = len(all_cards)
+        total_cards, new_cards, due_cards = await self.card_repo.count_deck_cards(deck_id)
 
         return {
             "total_cards": total_cards,
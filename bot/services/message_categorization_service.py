@@ -1,5 +1,7 @@
 """Service for AI-powered message categorization."""
 
+import re
+
 from bot.config.logging_config import get_logger
 from bot.core.message_categories import (
     CONFIDENCE_FALLBACK,
@@ -11,18 +13,27 @@ from bot.core.message_categories import (
     TextTranslationIntent,
     WordTranslationIntent,
 )
-from bot.services.ai_service import AIService
+from bot.services.ai_service import get_ai_service
 from bot.utils.language_detector import detect_language
+from bot.utils.translation_detector import detect_translation_request
 
 logger = get_logger(__name__)
 
+# Longest message whose single-word translation pattern match skips the AI
+PATTERN_MATCH_MAX_LENGTH = 32
+
+# Any of these in a lowercased message makes the fallback treat it as a question
+_QUESTION_RE = re.compile(
+    "|".join(map(re.escape, ("?", "как", "почему", "когда", "зачем", "что такое")))
+)
+
 
 class MessageCategorizationService:
     """Service for categorizing user messages using AI."""
 
     def __init__(self):
         """Initialize categorization service."""
-        self.ai_service = AIService()
+        self.ai_service = get_ai_service()
 
     async def categorize_message(self, message: str) -> CategorizationResult:
         """Categorize a user message using AI.
@@ -43,6 +54,12 @@ class MessageCategorizationService:
                 raw_message=message,
             )
 
+        # Short single-word translation requests need no AI
+        if len(message) <= PATTERN_MATCH_MAX_LENGTH:
+            pattern_result = self._try_pattern_match(message, single_word=True)
+            if pattern_result is not None:
+                return pattern_result
+
         # Try AI categorization
         try:
             ai_result = await self.ai_service.categorize_message(message)
@@ -144,26 +161,13 @@ class MessageCategorizationService:
         Returns:
             CategorizationResult based on simple rules
         """
-        from bot.utils.translation_detector import detect_translation_request
-
         # Try existing pattern detection
-        translation_request = detect_translation_request(message)
-        if translation_request:
-            return CategorizationResult(
-                category=MessageCategory.WORD_TRANSLATION,
-                confidence=CONFIDENCE_HIGH,
-                intent=WordTranslationIntent(
-                    word=translation_request.word,
-                    source_language=translation_request.source_language,
-                ),
-                raw_message=message,
-            )
+        pattern_result = self._try_pattern_match(message)
+        if pattern_result is not None:
+            return pattern_result
 
         # Check if it looks like a question
-        question_indicators = ["?", "как", "почему", "когда", "зачем", "что такое"]
-        is_question = any(ind in message.lower() for ind in question_indicators)
-
-        if is_question:
+        if _QUESTION_RE.search(message.lower()):
             return CategorizationResult(
                 category=MessageCategory.LANGUAGE_QUESTION,
                 confidence=CONFIDENCE_LOW,
@@ -182,3 +186,36 @@ class MessageCategorizationService:
             ),
             raw_message=message,
         )
+
+    def _try_pattern_match(
+        self, message: str, single_word: bool = False
+    ) -> CategorizationResult | None:
+        """Categorize a message as a word translation by pattern detection.
+
+        Args:
+            message: User message
+            single_word: Reject matches whose extracted text has several words
+                or reads as a question (a bare "почему?"), which may be a phrase
+                or a language question rather than a word translation
+
+        Returns:
+            Word translation result, or None if no pattern matches
+        """
+        translation_request = detect_translation_request(message)
+        if translation_request is None:
+            return None
+        if single_word and (
+            len(translation_request.word.split()) > 1
+            or _QUESTION_RE.search(translation_request.word.lower())
+        ):
+            return None
+
+        return CategorizationResult(
+            category=MessageCategory.WORD_TRANSLATION,
+            confidence=CONFIDENCE_HIGH,
+            intent=WordTranslationIntent(
+                word=translation_request.word,
+                source_language=translation_request.source_language,
+            ),
+            raw_message=message,
+        )
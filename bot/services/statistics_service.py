@@ -37,14 +37,10 @@ class StatisticsService:
         start_of_day = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=UTC)
         end_of_day = start_of_day + timedelta(days=1)
 
-        reviews = await self.review_repo.get_user_reviews(
+        total_reviews, correct_reviews, total_time, _ = await self.review_repo.get_aggregates(
             user_id=user_id, start_date=start_of_day, end_date=end_of_day
         )
 
-        total_reviews = len(reviews)
-        correct_reviews = sum(1 for r in reviews if r.quality >= 3)
-        total_time = sum(r.time_spent or 0 for r in reviews)
-
         accuracy = (correct_reviews / total_reviews * 100) if total_reviews > 0 else 0
 
         return {
@@ -67,20 +63,12 @@ class StatisticsService:
         end_date = datetime.now(UTC)
         start_date = end_date - timedelta(days=7)
 
-        reviews = await self.review_repo.get_user_reviews(
-            user_id=user_id, start_date=start_date, end_date=end_date
+        total_reviews, correct_reviews, total_time, days_active = (
+            await self.review_repo.get_aggregates(
+                user_id=user_id, start_date=start_date, end_date=end_date
+            )
         )
 
-        total_reviews = len(reviews)
-        correct_reviews = sum(1 for r in reviews if r.quality >= 3)
-        total_time = sum(r.time_spent or 0 for r in reviews)
-
-        # Group by day
-        daily_counts: dict[date, int] = {}
-        for review in reviews:
-            review_date = review.reviewed_at.date()
-            daily_counts[review_date] = daily_counts.get(review_date, 0) + 1
-
         avg_daily_reviews = total_reviews / 7 if total_reviews > 0 else 0
 
         return {
@@ -89,7 +77,7 @@ class StatisticsService:
             "correct_reviews": correct_reviews,
             "average_daily_reviews": round(avg_daily_reviews, 1),
             "total_time_seconds": total_time,
-            "days_active": len(daily_counts),
+            "days_active": days_active,
         }
 
     async def get_user_streak(self, user_id: int) -> int:
@@ -112,35 +100,15 @@ class StatisticsService:
         Returns:
             Dictionary with deck progress statistics
         """
-        all_cards = await self.card_repo.get_deck_cards(deck_id)
-
-        if not all_cards:
-            return {
-                "total_cards": 0,
-                "new_cards": 0,
-                "learning_cards": 0,
-                "mastered_cards": 0,
-                "average_success_rate": 0,
-            }
-
-        new_cards = sum(1 for c in all_cards if c.repetitions == 0)
-        learning_cards = sum(1 for c in all_cards if 0 < c.repetitions < 5)
-        mastered_cards = sum(1 for c in all_cards if c.repetitions >= 5)
-
-        # Calculate average success rate
-        cards_with_reviews = [c for c in all_cards if c.total_reviews > 0]
-        if cards_with_reviews:
-            avg_success_rate = sum(c.success_rate for c in cards_with_reviews) / len(
-                cards_with_reviews
-            )
-        else:
-            avg_success_rate = 0
+        total, new, learning, mastered, avg_success_rate = (
+            await self.card_repo.get_deck_progress_counts(deck_id)
+        )
 
         return {
-            "total_cards": len(all_cards),
-            "new_cards": new_cards,
-            "learning_cards": learning_cards,
-            "mastered_cards": mastered_cards,
+            "total_cards": total,
+            "new_cards": new,
+            "learning_cards": learning,
+            "mastered_cards": mastered,
             "average_success_rate": round(avg_success_rate, 1),
         }
 
@@ -153,23 +121,18 @@ class StatisticsService:
         Returns:
             Dictionary with overall statistics
         """
-        all_reviews = await self.review_repo.get_user_reviews(user_id=user_id)
-
-        total_reviews = len(all_reviews)
-        correct_reviews = sum(1 for r in all_reviews if r.quality >= 3)
-        total_time = sum(r.time_spent or 0 for r in all_reviews)
+        total_reviews, correct_reviews, total_time, days_active = (
+            await self.review_repo.get_aggregates(user_id=user_id)
+        )
         streak = await self.get_user_streak(user_id)
 
         accuracy = (correct_reviews / total_reviews * 100) if total_reviews > 0 else 0
 
-        # Get unique review dates
-        unique_dates = set(r.reviewed_at.date() for r in all_reviews)
-
         return {
             "total_reviews": total_reviews,
             "correct_reviews": correct_reviews,
             "accuracy": round(accuracy, 1),
             "total_time_seconds": total_time,
             "current_streak": streak,
-            "total_days_active": len(unique_dates),
+            "total_days_active": days_active,
         }
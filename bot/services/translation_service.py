@@ -1,6 +1,9 @@
 """Translation service for smart translation with card lookup."""
 
+import asyncio
+from collections.abc import Awaitable
 from dataclasses import dataclass
+from typing import TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,7 +12,9 @@ from bot.database.models.deck import Deck
 from bot.database.models.user import User
 from bot.database.repositories.card_repo import CardRepository
 from bot.database.repositories.deck_repo import DeckRepository
-from bot.services.ai_service import AIService
+from bot.services.ai_service import get_ai_service
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -57,7 +62,7 @@ class TranslationService:
             session: Database session
         """
         self.session = session
-        self.ai_service = AIService()
+        self.ai_service = get_ai_service()
         self.card_repo = CardRepository(session)
         self.deck_repo = DeckRepository(session)
 
@@ -83,27 +88,34 @@ class TranslationService:
         else:
             from_lang, to_lang = "russian", "greek"
 
-        # Get translation from AI
-        translation = await self.ai_service.translate_word(word, from_lang, to_lang)
-
-        # Search for existing cards
-        existing_cards = await self.card_repo.search_user_cards(user.id, word)
-
-        if existing_cards:
-            # Card exists - get the first match and deck
-            card, deck_id = existing_cards[0]
-            deck = await self.deck_repo.get_by_id(deck_id)
+        # Translate while the user's cards and decks are looked up
+        translation_task = asyncio.create_task(
+            self.ai_service.translate_word(word, from_lang, to_lang)
+        )
+        try:
+            existing = await self.card_repo.find_user_card(user.id, word)
+            if not existing:
+                # No existing card - the user will likely add one, so start
+                # generating it while the translation and deck suggestion are made
+                self.ai_service.prefetch_card(word, source_language)
+                decks = await self.deck_repo.get_user_decks(user.id)
+        except BaseException:
+            translation_task.cancel()
+            raise
+        translation = await translation_task
+
+        if existing:
+            # Card exists - the first match comes with its deck and match count
+            card, deck, existing_count = existing
             return TranslationResult(
                 word=word,
                 source_language=source_language,
                 translation=translation,
                 existing_card=card,
                 existing_deck=deck,
-                existing_count=len(existing_cards),
+                existing_count=existing_count,
             )
 
-        # No existing card - suggest a deck
-        decks = await self.deck_repo.get_user_decks(user.id)
         deck_names = [d.name for d in decks]
 
         # Get AI suggestion for best deck
@@ -147,6 +159,27 @@ class TranslationService:
             example=card_dict.get("example", ""),
         )
 
+    async def prepare_card(
+        self, word: str, source_language: str, deck_query: Awaitable[T]
+    ) -> tuple[CardData, T]:
+        """Generate card data while the target deck is loaded or created.
+
+        Args:
+            word: Word to create card from
+            source_language: 'greek' or 'russian'
+            deck_query: Database work for the deck, such as a lookup or creation
+
+        Returns:
+            Tuple of (CardData, result of deck_query)
+        """
+        card_task = asyncio.create_task(self.generate_card_data(word, source_language))
+        try:
+            deck = await deck_query
+        except BaseException:
+            card_task.cancel()
+            raise
+        return await card_task, deck
+
     async def analyze_and_translate_text(
         self,
         sentence: str,
@@ -76,15 +76,16 @@ class UserService:
         Returns:
             Updated user instance
         """
-        update_data = {}
-        if username is not None:
-            update_data["username"] = username
-        if first_name is not None:
-            update_data["first_name"] = first_name
-        if last_name is not None:
-            update_data["last_name"] = last_name
-        if language_code is not None:
-            update_data["language_code"] = language_code
+        update_data = {
+            field: value
+            for field, value in (
+                ("username", username),
+                ("first_name", first_name),
+                ("last_name", last_name),
+                ("language_code", language_code),
+            )
+            if value is not None
+        }
 
         if update_data:
             return await self.repo.update(user, **update_data)
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.config.logging_config import get_logger
 from bot.database.models.user import User
 from bot.database.repositories.card_repo import CardRepository
-from bot.services.ai_service import AIService
+from bot.services.ai_service import get_ai_service
 
 logger = get_logger(__name__)
 
@@ -46,7 +46,7 @@ class VocabularyExtractionService:
             session: Async database session
         """
         self.session = session
-        self.ai_service = AIService()
+        self.ai_service = get_ai_service()
         self.card_repo = CardRepository(session)
 
     async def extract_vocabulary(
@@ -136,13 +136,7 @@ class VocabularyExtractionService:
                 lemmas.append(w.lemma_with_article)
 
         # Bulk search
-        found_cards = await self.card_repo.find_cards_by_lemmas(user_id, lemmas)
-
-        # Create lookup set from found cards
-        found_lemmas: set[str] = set()
-        for card, _ in found_cards:
-            found_lemmas.add(card.front.lower())
-            found_lemmas.add(card.back.lower())
+        found_lemmas = await self.card_repo.find_existing_lemmas(user_id, lemmas)
 
         # Update words (lemmas are already lowercase)
         for word in words:
@@ -10,9 +10,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database.models.user import User
 from bot.messages import ai as ai_msg
-from bot.services.ai_service import AIService
+from bot.services.ai_service import get_ai_service
 from bot.services.conversation_service import ConversationService
 from bot.telegram.keyboards.main_menu import get_main_menu_keyboard
+from bot.telegram.utils.streaming import stream_to_message
 
 router = Router(name="ai_chat")
 
@@ -63,20 +64,16 @@ async def translate_command(
 
     thinking_msg = await message.answer(ai_msg.MSG_TRANSLATING)
 
-    conv_service = ConversationService(session)
-    await conv_service.add_user_message(
-        user=user,
-        content=f"/translate {text_to_translate}",
-        message_type="translate",
-    )
-
-    ai_service = AIService()
+    ai_service = get_ai_service()
     translation = await ai_service.translate_word(text_to_translate)
 
-    await conv_service.add_assistant_message(
+    conv_service = ConversationService(session)
+    await conv_service.add_turn(
         user=user,
-        content=translation,
+        user_content=f"/translate {text_to_translate}",
+        assistant_content=translation,
         message_type="translate",
+        user_sent_at=message.date,
     )
 
     await thinking_msg.delete()
@@ -106,21 +103,18 @@ async def grammar_command(
 
     thinking_msg = await message.answer(ai_msg.MSG_ANALYZING_GRAMMAR)
 
-    conv_service = ConversationService(session)
-    await conv_service.add_user_message(
-        user=user,
-        content=f"/grammar {greek_text}",
-        message_type="grammar",
+    ai_service = get_ai_service()
+    explanation = await stream_to_message(
+        thinking_msg,
+        ai_service.stream_grammar(greek_text),
+        ai_msg.get_grammar_result,
     )
 
-    ai_service = AIService()
-    explanation = await ai_service.explain_grammar(greek_text)
-
-    await conv_service.add_assistant_message(
+    conv_service = ConversationService(session)
+    await conv_service.add_turn(
         user=user,
-        content=explanation,
+        user_content=f"/grammar {greek_text}",
+        assistant_content=explanation,
         message_type="grammar",
+        user_sent_at=message.date,
     )
-
-    await thinking_msg.delete()
-    await message.answer(ai_msg.get_grammar_result(explanation))
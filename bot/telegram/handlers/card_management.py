@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.database.models.user import User
 from bot.messages import cards as card_msg
 from bot.messages import common as common_msg
-from bot.services.ai_service import AIService
+from bot.services.ai_service import get_ai_service
 from bot.services.card_service import CardService
 from bot.services.deck_service import DeckService
 from bot.telegram.keyboards.card_keyboards import (
@@ -203,7 +203,7 @@ async def process_ai_word(message: Message, state: FSMContext, session: AsyncSes
     thinking_msg = await message.answer(card_msg.MSG_AI_GENERATING)
 
     # Generate card with AI using detected language
-    ai_service = AIService()
+    ai_service = get_ai_service()
     card_data = await ai_service.generate_card_from_word(word, source_lang)
 
     await thinking_msg.delete()
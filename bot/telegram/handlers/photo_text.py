@@ -1,8 +1,6 @@
 """Handler for photo messages with Greek text recognition."""
 
-import base64
-import json
-
+import orjson
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import InlineKeyboardMarkup, Message, ReplyKeyboardMarkup
@@ -13,7 +11,7 @@ from bot.config.settings import settings
 from bot.database.models.user import User
 from bot.messages import photo_text as photo_msg
 from bot.messages import vocabulary as vocab_msg
-from bot.services.ai_service import AIService
+from bot.services.ai_service import get_ai_service
 from bot.services.vocabulary_extraction_service import VocabularyExtractionService
 from bot.telegram.keyboards.main_menu import get_main_menu_keyboard
 from bot.telegram.keyboards.vocabulary_keyboards import get_vocabulary_extraction_keyboard
@@ -70,17 +68,14 @@ async def handle_photo(
             )
             return
 
-        # Download photo
+        # Download photo; the AI service encodes it only when building the request
         file_data = await message.bot.download_file(file.file_path)
-
-        # Convert to base64
         image_bytes = file_data.read()
-        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
 
         # Process image with AI
-        ai_service = AIService()
+        ai_service = get_ai_service()
         result = await ai_service.process_image_text(
-            image_base64=image_base64,
+            image=image_bytes,
             user_prompt=user_prompt,
         )
 
@@ -134,7 +129,7 @@ async def handle_photo(
             ]
             await state.update_data(
                 extraction_hash=extraction_hash,
-                extraction_words=json.dumps(words_data, ensure_ascii=False),
+                extraction_words=orjson.dumps(words_data).decode(),
                 source_language="greek",
             )
             keyboard = get_vocabulary_extraction_keyboard(extraction_hash)
@@ -183,13 +183,12 @@ async def create_suggested_deck(
     await callback.answer("Создаю колоду и карточку...")
 
     try:
-        # Create deck
+        # Generate card data while the deck is created
         deck_service = DeckService(session)
-        deck = await deck_service.create_deck(user_id=user.id, name=deck_name)
-
-        # Generate card data
         trans_service = TranslationService(session)
-        card_data = await trans_service.generate_card_data(word, source_language)
+        card_data, deck = await trans_service.prepare_card(
+            word, source_language, deck_service.create_deck(user_id=user.id, name=deck_name)
+        )
 
         # Create card
         card_service = CardService(session)
@@ -270,19 +269,18 @@ async def receive_custom_deck_name(
         return
 
     try:
-        # Check if deck with this name exists
+        # Generate card data while checking if deck with this name exists
         deck_service = DeckService(session)
-        existing_deck = await deck_service.get_deck_by_name(user.id, deck_name)
+        trans_service = TranslationService(session)
+        card_data, existing_deck = await trans_service.prepare_card(
+            word, source_language, deck_service.get_deck_by_name(user.id, deck_name)
+        )
 
         if existing_deck:
             deck = existing_deck
         else:
             deck = await deck_service.create_deck(user_id=user.id, name=deck_name)
 
-        # Generate card data
-        trans_service = TranslationService(session)
-        card_data = await trans_service.generate_card_data(word, source_language)
-
         # Create card
         card_service = CardService(session)
         await card_service.create_card(
@@ -1,7 +1,6 @@
 """Unified message handler with AI-powered categorization."""
 
-import json
-
+import orjson
 from aiogram import F, Router
 from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
@@ -22,7 +21,7 @@ from bot.messages import ai as ai_msg
 from bot.messages import common as common_msg
 from bot.messages import translation as trans_msg
 from bot.messages import vocabulary as vocab_msg
-from bot.services.ai_service import AIService
+from bot.services.ai_service import get_ai_service
 from bot.services.conversation_service import ConversationService
 from bot.services.message_categorization_service import MessageCategorizationService
 from bot.services.translation_service import TranslationService
@@ -30,6 +29,7 @@ from bot.services.vocabulary_extraction_service import VocabularyExtractionServi
 from bot.telegram.keyboards.main_menu import get_main_menu_keyboard
 from bot.telegram.keyboards.translation_keyboards import get_translation_add_keyboard
 from bot.telegram.keyboards.vocabulary_keyboards import get_vocabulary_extraction_keyboard
+from bot.telegram.utils.streaming import stream_to_message
 from bot.utils.helpers import create_callback_hash
 
 logger = get_logger(__name__)
@@ -230,15 +230,12 @@ async def _handle_text_translation(
 
     # Log to conversation history
     conv_service = ConversationService(session)
-    await conv_service.add_user_message(
+    await conv_service.add_turn(
         user=user,
-        content=result.raw_message,
-        message_type="translate",
-    )
-    await conv_service.add_assistant_message(
-        user=user,
-        content=analysis.translation,
+        user_content=result.raw_message,
+        assistant_content=analysis.translation,
         message_type="translate",
+        user_sent_at=message.date,
     )
 
     # Extract vocabulary from the phrase
@@ -266,7 +263,7 @@ async def _handle_text_translation(
         ]
         await state.update_data(
             extraction_hash=extraction_hash,
-            extraction_words=json.dumps(words_data, ensure_ascii=False),
+            extraction_words=orjson.dumps(words_data).decode(),
             source_language=intent.source_language,
         )
 
@@ -312,25 +309,24 @@ async def _handle_language_question(
     conv_service = ConversationService(session)
     history = await conv_service.get_context_messages(user)
 
-    await conv_service.add_user_message(
-        user=user,
-        content=result.raw_message,
-        message_type="ask_question",
+    # The answer is streamed into the placeholder, and edits cannot attach a
+    # reply keyboard, so the main menu is sent with the placeholder itself
+    thinking_msg = await message.answer(
+        ai_msg.MSG_THINKING,
+        reply_markup=get_main_menu_keyboard(),
     )
 
-    ai_service = AIService()
-    response = await ai_service.ask_question(
-        message=question,
-        conversation_history=history,
+    ai_service = get_ai_service()
+    response = await stream_to_message(
+        thinking_msg,
+        ai_service.stream_question(message=question, conversation_history=history),
+        ai_msg.get_ai_response,
     )
 
-    await conv_service.add_assistant_message(
+    await conv_service.add_turn(
         user=user,
-        content=response,
+        user_content=result.raw_message,
+        assistant_content=response,
         message_type="ask_question",
-    )
-
-    await message.answer(
-        ai_msg.get_ai_response(response),
-        reply_markup=get_main_menu_keyboard(),
+        user_sent_at=message.date,
     )
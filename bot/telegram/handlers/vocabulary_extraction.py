@@ -1,7 +1,6 @@
 """Handlers for vocabulary extraction from phrase translations."""
 
-import json
-
+import orjson
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
@@ -10,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bot.config.logging_config import get_logger
 from bot.database.models.user import User
 from bot.messages import vocabulary as vocab_msg
-from bot.services.ai_service import AIService
+from bot.services.ai_service import get_ai_service
 from bot.services.card_service import CardService
 from bot.services.deck_service import DeckService
 from bot.telegram.keyboards.main_menu import get_main_menu_keyboard
@@ -38,8 +37,8 @@ def _deserialize_words(data: str | None) -> list[dict] | None:
     if not data:
         return None
     try:
-        return json.loads(data)
-    except json.JSONDecodeError:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
         return None
 
 
@@ -159,7 +158,7 @@ async def select_word_for_adding(
     suggested_new_name = None
 
     if decks:
-        ai_service = AIService()
+        ai_service = get_ai_service()
         deck_names = [d.name for d in decks]
         suggested_name = await ai_service.suggest_deck_for_word(front, back, deck_names)
         if suggested_name:
@@ -172,7 +171,7 @@ async def select_word_for_adding(
             suggested_new_name = await ai_service.generate_deck_name(front, back)
     else:
         # No decks - suggest a name for new deck
-        ai_service = AIService()
+        ai_service = get_ai_service()
         suggested_new_name = await ai_service.generate_deck_name(front, back)
 
     if not decks:
@@ -0,0 +1,63 @@
+"""Utilities for progressively rendering streamed AI responses."""
+
+import time
+from collections.abc import AsyncIterator, Callable
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import Message
+
+# Minimum number of new characters before the message is edited again
+STREAM_EDIT_MIN_CHARS = 40
+
+# Minimum pause between edits, Telegram throttles frequent edits per chat
+STREAM_EDIT_MIN_INTERVAL = 1.0
+
+
+async def stream_to_message(
+    target: Message,
+    fragments: AsyncIterator[str],
+    render: Callable[[str], str],
+) -> str:
+    """Edit a message in place while a response is being streamed.
+
+    Args:
+        target: Placeholder message to edit
+        fragments: Streamed response text fragments
+        render: Formats the accumulated text for display
+
+    Returns:
+        Full response text
+    """
+    text = ""
+    shown = 0
+    last_edit = time.monotonic()
+
+    async for fragment in fragments:
+        text += fragment
+        now = time.monotonic()
+        if (
+            len(text) - shown >= STREAM_EDIT_MIN_CHARS
+            and now - last_edit >= STREAM_EDIT_MIN_INTERVAL
+        ):
+            await _edit(target, render(text))
+            shown = len(text)
+            last_edit = now
+
+    if len(text) != shown:
+        await _edit(target, render(text))
+
+    return text
+
+
+async def _edit(target: Message, text: str) -> None:
+    """Edit message text, ignoring edits that would not change it.
+
+    Args:
+        target: Message to edit
+        text: New message text
+    """
+    try:
+        await target.edit_text(text)
+    except TelegramBadRequest as e:
+        if "message is not modified" not in str(e):
+            raise
@@ -0,0 +1,95 @@
+"""Request batching utilities."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Groups concurrent single-item calls into one batched call.
+
+    Items submitted within ``max_wait`` seconds of the first pending item
+    are processed together, and a batch is sent early once it holds
+    ``max_size`` items. Intended for use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[list[T]], Awaitable[list[R]]],
+        max_size: int,
+        max_wait: float,
+    ):
+        """Initialize batcher.
+
+        Args:
+            process: Processes a batch, returning one result per item in order
+            max_size: Maximum number of items per batch
+            max_wait: Longest time in seconds an item waits for others
+        """
+        self._process = process
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> R:
+        """Add an item to the next batch and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            Result for the item
+
+        Raises:
+            Exception: Whatever the batch processing raised
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Start processing all pending items as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Keep a reference so the task is not garbage collected mid-flight
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        """Process a batch and hand each result to its caller.
+
+        Args:
+            batch: Items with the futures their callers wait on
+        """
+        try:
+            results = await self._process([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Expected {len(batch)} batch results, got {len(results)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,85 @@
+"""Circuit breaker for calls to an external service."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from types import TracebackType
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Stops calling a failing service for a cooldown period.
+
+    After ``fail_max`` consecutive failures the circuit opens and calls are
+    rejected with CircuitOpenError for ``reset_timeout`` seconds. The first
+    call after that goes through as a probe: success closes the circuit,
+    failure opens it again. Intended for use from a single event loop.
+
+    Usage::
+
+        async with breaker:
+            await call_service()
+    """
+
+    def __init__(
+        self,
+        fail_max: int,
+        reset_timeout: float,
+        is_failure: Callable[[BaseException], bool] = lambda error: True,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            fail_max: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            is_failure: Tells service failures apart from errors that prove
+                the service is reachable, such as rejected requests
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._is_failure = is_failure
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        if self._opened_at is None:
+            return False
+        return self._probing or time.monotonic() - self._opened_at < self.reset_timeout
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        """Let the call through or reject it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if self.is_open:
+            raise CircuitOpenError("Circuit is open")
+        if self._opened_at is not None:
+            self._probing = True
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Record the outcome of the call."""
+        if isinstance(exc, asyncio.CancelledError):
+            # The outcome is unknown; allow another probe
+            self._probing = False
+        elif exc is not None and self._is_failure(exc):
+            self._failures += 1
+            self._probing = False
+            if self._opened_at is not None or self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+        else:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
@@ -1,6 +1,7 @@
 """Helper utilities."""
 
 import hashlib
+import sys
 from datetime import UTC, datetime
 
 
@@ -55,3 +56,17 @@ def create_callback_hash(text: str) -> str:
         8-character MD5 hash
     """
     return hashlib.md5(text.encode()).hexdigest()[:8]
+
+
+def intern_constants(namespace: dict[str, object]) -> None:
+    """Intern module-level string constants in place.
+
+    Message modules call this at import time with ``globals()`` so that
+    identical button labels and message templates share a single object.
+
+    Args:
+        namespace: Module namespace to process
+    """
+    for name, value in list(namespace.items()):
+        if name.isupper() and isinstance(value, str):
+            namespace[name] = sys.intern(value)
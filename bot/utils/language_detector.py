@@ -1,6 +1,7 @@
 """Language detection utilities for Greek and Russian."""
 
 import re
+from functools import lru_cache
 
 # Greek Unicode range: U+0370 to U+03FF (Greek and Coptic)
 # Extended Greek: U+1F00 to U+1FFF (Greek Extended)
@@ -9,7 +10,12 @@ GREEK_PATTERN = re.compile(r"[\u0370-\u03FF\u1F00-\u1FFF]")
 # Cyrillic Unicode range: U+0400 to U+04FF
 CYRILLIC_PATTERN = re.compile(r"[\u0400-\u04FF]")
 
+# Number of recent texts whose detected language is remembered. A message is
+# often checked several times on its way through categorization.
+DETECT_CACHE_SIZE = 2048
 
+
+@lru_cache(maxsize=DETECT_CACHE_SIZE)
 def detect_language(text: str) -> str:
     """Detect whether text is Greek or Russian/Cyrillic.
 
@@ -0,0 +1,48 @@
+"""Client-side rate limiting utilities."""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token bucket that makes callers wait until enough capacity is available.
+
+    The bucket starts full and refills continuously at ``capacity / period``
+    units per second. Waiters are served in arrival order.
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        """Initialize bucket.
+
+        Args:
+            capacity: Maximum units available per period
+            period: Refill period in seconds
+        """
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._level = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the units accumulated since the last update."""
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until the requested units are available and take them.
+
+        Requests larger than the capacity are clamped to it so they can
+        still proceed once the bucket is full.
+
+        Args:
+            amount: Units to take
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._level < amount:
+                await asyncio.sleep((amount - self._level) / self.rate)
+                self._refill()
+            self._level -= amount
@@ -0,0 +1,102 @@
+"""Similarity-based caching utilities."""
+
+import time
+from typing import Generic, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+V = TypeVar("V")
+
+
+def _normalize(embedding: ArrayLike) -> np.ndarray:
+    """Convert an embedding to a unit-length float32 vector.
+
+    Args:
+        embedding: Embedding vector
+
+    Returns:
+        Normalized vector
+    """
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+class SemanticCache(Generic[V]):
+    """Cache whose entries are matched by cosine similarity of embeddings.
+
+    Entries live in one preallocated matrix, so a lookup is a single
+    matrix-vector product. When full, the oldest entry is overwritten.
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, threshold: float):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Entry lifetime in seconds
+            threshold: Minimum cosine similarity for a hit
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self._vectors: np.ndarray | None = None
+        self._expires = np.zeros(maxsize, dtype=np.float64)
+        self._values: list[V | None] = [None] * maxsize
+        self._next = 0
+
+    def get(self, embedding: ArrayLike) -> V | None:
+        """Get the value of the most similar live entry.
+
+        Args:
+            embedding: Embedding of the lookup text
+
+        Returns:
+            Cached value, or None if no entry is similar enough
+        """
+        if self._vectors is None:
+            return None
+
+        query = _normalize(embedding)
+        if query.shape[0] != self._vectors.shape[1]:
+            return None
+
+        scores = self._vectors @ query
+        scores[self._expires <= time.monotonic()] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] <= self.threshold:
+            return None
+        return self._values[best]
+
+    def set(self, embedding: ArrayLike, value: V, ttl: float | None = None) -> None:
+        """Store a value, overwriting the oldest entry if full.
+
+        Args:
+            embedding: Embedding of the text the value answers
+            value: Value to store
+            ttl: Entry lifetime in seconds, defaults to the cache TTL
+        """
+        vector = _normalize(embedding)
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+            # First entry or a different embedding model: start over.
+            self.clear()
+            self._vectors = np.zeros((self.maxsize, vector.shape[0]), dtype=np.float32)
+
+        slot = self._next
+        self._vectors[slot] = vector
+        self._expires[slot] = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._values[slot] = value
+        self._next = (slot + 1) % self.maxsize
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._vectors = None
+        self._expires[:] = 0
+        self._values = [None] * self.maxsize
+        self._next = 0
+
+    def __len__(self) -> int:
+        """Get the number of live entries."""
+        return int(np.count_nonzero(self._expires > time.monotonic()))
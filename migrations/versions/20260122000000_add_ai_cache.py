@@ -0,0 +1,34 @@
+"""Add ai_cache table
+
+Revision ID: 20260122000000
+Revises: 20260121120000
+Create Date: 2026-01-22 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260122000000"
+down_revision: str | None = "20260121120000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_cache",
+        sa.Column("key", sa.LargeBinary(length=16), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index("ix_ai_cache_expires_at", "ai_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_cache_expires_at", table_name="ai_cache")
+    op.drop_table("ai_cache")
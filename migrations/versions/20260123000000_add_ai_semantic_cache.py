@@ -0,0 +1,38 @@
+"""Add ai_semantic_cache table
+
+Revision ID: 20260123000000
+Revises: 20260122000000
+Create Date: 2026-01-23 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260123000000"
+down_revision: str | None = "20260122000000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_semantic_cache",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("namespace", sa.String(length=32), nullable=False),
+        sa.Column("embedding", sa.LargeBinary(), nullable=False),
+        sa.Column("response", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_ai_semantic_cache_namespace", "ai_semantic_cache", ["namespace"])
+    op.create_index("ix_ai_semantic_cache_expires_at", "ai_semantic_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ai_semantic_cache_expires_at", table_name="ai_semantic_cache")
+    op.drop_index("ix_ai_semantic_cache_namespace", table_name="ai_semantic_cache")
+    op.drop_table("ai_semantic_cache")
@@ -7,6 +7,8 @@ os.environ.setdefault("TELEGRAM_BOT_TOKEN", "test_token_123")
 os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
 os.environ.setdefault("OPENAI_API_KEY", "test_openai_key_123")
 os.environ.setdefault("DEBUG", "True")
+os.environ.setdefault("AI_PERSISTENT_CACHE_ENABLED", "False")
+os.environ.setdefault("AI_SEMANTIC_CACHE_ENABLED", "False")
 
 import asyncio
 from collections.abc import AsyncGenerator
@@ -17,6 +19,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from bot.database.base import Base
+from bot.services.ai_service import AIService
+from bot.services.conversation_service import ConversationService
 
 
 @pytest.fixture(scope="session")
@@ -27,6 +31,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_ai_caches():
+    """Start every test with empty AI response and conversation caches."""
+    AIService.clear_caches()
+    ConversationService.clear_cache()
+    yield
+    AIService.clear_caches()
+    ConversationService.clear_cache()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session.
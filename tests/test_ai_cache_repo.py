@@ -0,0 +1,75 @@
+"""Tests for AI response cache repositories."""
+
+from datetime import timedelta
+
+import pytest
+
+from bot.database.repositories.ai_cache_repo import AICacheRepository
+from bot.database.repositories.ai_semantic_cache_repo import AISemanticCacheRepository
+
+
+class TestAICacheRepository:
+    """Tests for AICacheRepository."""
+
+    @pytest.mark.asyncio
+    async def test_set_and_get_value(self, db_session):
+        """Test that a stored value can be read back."""
+        repo = AICacheRepository(db_session)
+        await repo.set_values({b"k" * 16: '"дом"'}, timedelta(days=1))
+
+        assert await repo.get_value(b"k" * 16) == '"дом"'
+
+    @pytest.mark.asyncio
+    async def test_missing_key_returns_none(self, db_session):
+        """Test that unknown keys return None."""
+        repo = AICacheRepository(db_session)
+
+        assert await repo.get_value(b"m" * 16) is None
+
+    @pytest.mark.asyncio
+    async def test_set_replaces_existing_value(self, db_session):
+        """Test that storing a key again overwrites the value."""
+        repo = AICacheRepository(db_session)
+        await repo.set_values({b"k" * 16: '"old"'}, timedelta(days=1))
+        await repo.set_values({b"k" * 16: '"new"'}, timedelta(days=1))
+
+        assert await repo.get_value(b"k" * 16) == '"new"'
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_ignored_and_deleted(self, db_session):
+        """Test that expired entries are not returned and are cleaned up."""
+        repo = AICacheRepository(db_session)
+        await repo.set_values({b"e" * 16: '"old"'}, timedelta(seconds=-1))
+        await repo.set_values({b"f" * 16: '"fresh"'}, timedelta(days=1))
+
+        assert await repo.get_value(b"e" * 16) is None
+        assert await repo.delete_expired() == 1
+        assert await repo.get_value(b"f" * 16) == '"fresh"'
+
+
+class TestAISemanticCacheRepository:
+    """Tests for AISemanticCacheRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_entries_filters_namespace_and_expiry(self, db_session):
+        """Test that only live entries of the namespace are returned, oldest first."""
+        repo = AISemanticCacheRepository(db_session)
+        await repo.add_entry("grammar", b"\x00" * 8, "old", timedelta(days=1))
+        await repo.add_entry("grammar", b"\x01" * 8, "new", timedelta(days=1))
+        await repo.add_entry("grammar", b"\x02" * 8, "expired", timedelta(seconds=-1))
+        await repo.add_entry("question", b"\x03" * 8, "other", timedelta(days=1))
+
+        entries = await repo.get_entries("grammar", limit=10)
+
+        assert [entry.response for entry in entries] == ["old", "new"]
+
+    @pytest.mark.asyncio
+    async def test_get_entries_keeps_newest_within_limit(self, db_session):
+        """Test that the limit drops the oldest entries."""
+        repo = AISemanticCacheRepository(db_session)
+        for response in ("a", "b", "c"):
+            await repo.add_entry("grammar", b"\x00" * 8, response, timedelta(days=1))
+
+        entries = await repo.get_entries("grammar", limit=2)
+
+        assert [entry.response for entry in entries] == ["b", "c"]
@@ -0,0 +1,1403 @@
+"""Tests for AIService request handling."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from bot.config.settings import settings
+from bot.database.repositories.ai_cache_repo import AICacheRepository
+from bot.database.repositories.ai_semantic_cache_repo import AISemanticCacheRepository
+from bot.messages import ai as ai_messages
+from bot.services.ai_service import (
+    TRANSLATION_BATCH_SIZE,
+    AIService,
+    _parse_card,
+    close_openai_client,
+    get_ai_service,
+    get_openai_client,
+    prewarm_openai_client,
+    purge_expired_ai_cache,
+)
+
+_CARD_JSON = '{"front": "το σπίτι", "back": "дом", "example": "-"}'
+
+
+def _make_response(content: str) -> MagicMock:
+    """Build a mock chat completion response."""
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    return response
+
+
+class TestTranslateWordSingleFlight:
+    """Tests for coalescing of concurrent identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_share_one_request(self):
+        """Test that duplicate in-flight translations make a single API call."""
+        ai_service = AIService()
+
+        async def slow_create(**kwargs):
+            await asyncio.sleep(0.01)
+            return _make_response("το σπίτι - дом")
+
+        mock_create = AsyncMock(side_effect=slow_create)
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            results = await asyncio.gather(
+                ai_service.translate_word("дом", "russian", "greek"),
+                AIService().translate_word("дом", "russian", "greek"),
+            )
+
+        assert results == ["το σπίτι - дом", "το σπίτι - дом"]
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_words_are_not_coalesced(self):
+        """Test that distinct translations each make their own API call."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("перевод"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await asyncio.gather(
+                ai_service.translate_word("σπίτι"),
+                ai_service.translate_word("νερό"),
+            )
+
+        assert mock_create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_card_requests_share_one_request(self):
+        """Test that duplicate in-flight cards make a single API call."""
+        ai_service = AIService()
+
+        async def slow_create(**kwargs):
+            await asyncio.sleep(0.01)
+            return _make_response(_CARD_JSON)
+
+        mock_create = AsyncMock(side_effect=slow_create)
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first, second = await asyncio.gather(
+                ai_service.generate_card_from_word("σπίτι"),
+                AIService().generate_card_from_word("σπίτι"),
+            )
+
+        assert first == second
+        assert first is not second
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised_to_every_caller(self):
+        """Test that callers joining a failed request receive its exception."""
+        ai_service = AIService()
+
+        async def failing_fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            ai_service._single_flight(b"key", failing_fetch),
+            ai_service._single_flight(b"key", failing_fetch),
+            return_exceptions=True,
+        )
+
+        assert [type(result) for result in results] == [ValueError, ValueError]
+        assert not AIService._inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_joiners(self):
+        """Test that a joined caller still gets the result if the first caller is cancelled."""
+        ai_service = AIService()
+        calls = 0
+
+        async def slow_fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        leader = asyncio.create_task(ai_service._single_flight(b"key", slow_fetch))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(ai_service._single_flight(b"key", slow_fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await joiner == "result"
+        assert leader.cancelled()
+        assert calls == 1
+        assert not AIService._inflight
+
+
+class TestSameLanguageTranslation:
+    """Tests for translation requests whose languages match."""
+
+    @pytest.mark.asyncio
+    async def test_same_language_returns_input_without_request(self):
+        """Test that translating into the source language skips the API."""
+        ai_service = AIService()
+        mock_create = AsyncMock()
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            word = await ai_service.translate_word("σπίτι", "Greek", "greek")
+            words = await ai_service.translate_words_batch(["σπίτι", "νερό"], "greek", "greek")
+
+        assert word == "σπίτι"
+        assert words == ["σπίτι", "νερό"]
+        mock_create.assert_not_awaited()
+
+
+class TestTranslateWordsBatch:
+    """Tests for batched word translation."""
+
+    @pytest.mark.asyncio
+    async def test_translates_batch_in_one_request(self):
+        """Test that numbered answers are mapped back to the input order."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("1: дом\n2. вода\n3) книга"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.translate_words_batch(["σπίτι", "νερό", "βιβλίο"])
+
+        assert result == ["дом", "вода", "книга"]
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_items_fall_back_to_single_translation(self):
+        """Test that words absent from the batch answer are translated one by one."""
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            side_effect=[_make_response("1: дом"), _make_response("вода - жидкость")]
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.translate_words_batch(["σπίτι", "νερό"])
+
+        assert result == ["дом", "вода - жидкость"]
+
+    @pytest.mark.asyncio
+    async def test_large_input_is_split_into_batches(self):
+        """Test that inputs above the batch size use several requests."""
+        ai_service = AIService()
+        answer = "\n".join(f"{n}: слово" for n in range(1, TRANSLATION_BATCH_SIZE + 1))
+        mock_create = AsyncMock(return_value=_make_response(answer))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.translate_words_batch(["λέξη"] * (TRANSLATION_BATCH_SIZE + 1))
+
+        assert len(result) == TRANSLATION_BATCH_SIZE + 1
+        assert mock_create.await_count == 2
+
+
+class TestTranslateMany:
+    """Tests for concurrent translation of several words."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_requests(self):
+        """Test that no more than `concurrency` requests run at once."""
+        ai_service = AIService()
+        active = 0
+        peak = 0
+
+        async def fake_create(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _make_response(kwargs["messages"][-1]["content"][-4:])
+
+        words = [f"λέξη{number}" for number in range(6)]
+        with patch.object(
+            ai_service.client.chat.completions, "create", new=AsyncMock(side_effect=fake_create)
+        ):
+            results = await ai_service.translate_many(words, concurrency=2)
+
+        assert results == [word[-4:] for word in words]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_words_skip_requests(self):
+        """Test that already translated words are not requested again."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("дом"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.translate_word("σπίτι")
+            results = await ai_service.translate_many(["σπίτι", "σπίτι"])
+
+        assert results == ["дом", "дом"]
+        assert mock_create.await_count == 1
+
+
+class TestParseCard:
+    """Tests for flashcard response parsing."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (
+                '{"front": "το σπίτι", "back": "дом", '
+                '"example": "Το σπίτι είναι μεγάλο - Дом большой"}',
+                {
+                    "front": "το σπίτι",
+                    "back": "дом",
+                    "example": "Το σπίτι είναι μεγάλο - Дом большой",
+                },
+            ),
+            (
+                '{"front": " το νερό ", "back": "вода", "example": null}',
+                {"front": "το νερό", "back": "вода", "example": ""},
+            ),
+            ("no card here", {"front": "σπίτι", "back": "", "example": ""}),
+            ('["дом"]', {"front": "σπίτι", "back": "", "example": ""}),
+        ],
+    )
+    def test_parse_card(self, content: str, expected: dict[str, str]):
+        """Test that card fields are extracted and the word is the fallback front."""
+        assert _parse_card(content, "σπίτι") == expected
+
+
+class TestCardBatch:
+    """Tests for Batch API card generation."""
+
+    @pytest.mark.asyncio
+    async def test_submit_uploads_one_request_per_word(self):
+        """Test that the uploaded JSONL holds a request line per word."""
+        ai_service = AIService()
+        files_create = AsyncMock(return_value=MagicMock(id="file-1"))
+        batches_create = AsyncMock(return_value=MagicMock(id="batch-1"))
+
+        with (
+            patch.object(ai_service.client.files, "create", new=files_create),
+            patch.object(ai_service.client.batches, "create", new=batches_create),
+        ):
+            batch_id = await ai_service.submit_card_batch(["σπίτι", "νερό"])
+
+        _, payload = files_create.await_args.kwargs["file"]
+        lines = [orjson.loads(line) for line in payload.splitlines()]
+        assert batch_id == "batch-1"
+        assert [line["custom_id"] for line in lines] == ["0", "1"]
+        assert batches_create.await_args.kwargs["input_file_id"] == "file-1"
+
+    @pytest.mark.asyncio
+    async def test_collect_parses_completed_batch(self):
+        """Test that results are parsed and mapped back to word order."""
+        ai_service = AIService()
+        output = "\n".join(
+            orjson.dumps(
+                {
+                    "custom_id": custom_id,
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"content": content}}]},
+                    },
+                }
+            ).decode()
+            for custom_id, content in [
+                ("1", '{"front": "το νερό", "back": "вода", "example": "-"}'),
+                ("0", '{"front": "το σπίτι", "back": "дом", "example": "-"}'),
+            ]
+        )
+        retrieve = AsyncMock(
+            side_effect=[
+                MagicMock(status="in_progress"),
+                MagicMock(status="completed", output_file_id="file-2"),
+            ]
+        )
+
+        with (
+            patch.object(ai_service.client.batches, "retrieve", new=retrieve),
+            patch.object(
+                ai_service.client.files,
+                "content",
+                new=AsyncMock(return_value=MagicMock(text=output)),
+            ),
+            patch("bot.services.ai_service.asyncio.sleep", new=AsyncMock()),
+        ):
+            cards = await ai_service.collect_card_batch("batch-1", ["σπίτι", "νερό"])
+
+        assert [card["back"] for card in cards] == ["дом", "вода"]
+
+    @pytest.mark.asyncio
+    async def test_collect_returns_empty_cards_for_failed_batch(self):
+        """Test that a failed batch yields cards without a back side."""
+        ai_service = AIService()
+        retrieve = AsyncMock(return_value=MagicMock(status="failed"))
+
+        with patch.object(ai_service.client.batches, "retrieve", new=retrieve):
+            cards = await ai_service.collect_card_batch("batch-1", ["σπίτι"])
+
+        assert cards == [{"front": "σπίτι", "back": "", "example": ""}]
+
+
+class TestImageInput:
+    """Tests for the image formats accepted by process_image_text."""
+
+    @pytest.mark.asyncio
+    async def test_raw_bytes_are_sent_base64_encoded(self):
+        """Test that raw bytes and pre-encoded data produce the same request."""
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            return_value=_make_response(
+                '{"recognized_text": "σπίτι", "translation": "дом", "has_greek_text": true}'
+            )
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.process_image_text(b"hello")
+            AIService.clear_caches()
+            await ai_service.process_image_text("aGVsbG8=")
+
+        urls = [
+            call.kwargs["messages"][-1]["content"][0]["image_url"]["url"]
+            for call in mock_create.await_args_list
+        ]
+        assert urls == ["data:image/jpeg;base64,aGVsbG8="] * 2
+
+
+class TestWordExtractionBatch:
+    """Tests for Batch API word extraction."""
+
+    @pytest.mark.asyncio
+    async def test_submit_uploads_one_request_per_phrase(self):
+        """Test that each phrase becomes a word extraction request line."""
+        ai_service = AIService()
+        files_create = AsyncMock(return_value=MagicMock(id="file-1"))
+        batches_create = AsyncMock(return_value=MagicMock(id="batch-1"))
+
+        with (
+            patch.object(ai_service.client.files, "create", new=files_create),
+            patch.object(ai_service.client.batches, "create", new=batches_create),
+        ):
+            batch_id = await ai_service.submit_word_extraction_batch(
+                ["το σπίτι", "το νερό"], "greek"
+            )
+
+        name, payload = files_create.await_args.kwargs["file"]
+        lines = [orjson.loads(line) for line in payload.splitlines()]
+        assert batch_id == "batch-1"
+        assert name == "words.jsonl"
+        assert [line["custom_id"] for line in lines] == ["0", "1"]
+        assert "το νερό" in lines[1]["body"]["messages"][-1]["content"]
+        assert lines[1]["body"]["response_format"] == {"type": "json_object"}
+
+    @pytest.mark.asyncio
+    async def test_collect_maps_results_and_fills_cache(self):
+        """Test that results follow phrase order and later single calls hit the cache."""
+        ai_service = AIService()
+        words = [{"original": "σπίτι", "lemma": "σπίτι"}]
+        output = "\n".join(
+            orjson.dumps(item).decode()
+            for item in [
+                {"custom_id": "1", "response": {"status_code": 500}, "error": "boom"},
+                {
+                    "custom_id": "0",
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "choices": [
+                                {"message": {"content": orjson.dumps({"words": words}).decode()}}
+                            ]
+                        },
+                    },
+                },
+            ]
+        )
+        retrieve = AsyncMock(return_value=MagicMock(status="completed", output_file_id="file-2"))
+        mock_create = AsyncMock()
+
+        with (
+            patch.object(ai_service.client.batches, "retrieve", new=retrieve),
+            patch.object(
+                ai_service.client.files,
+                "content",
+                new=AsyncMock(return_value=MagicMock(text=output)),
+            ),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            results = await ai_service.collect_word_extraction_batch(
+                "batch-1", ["το σπίτι", "το νερό"], "greek"
+            )
+            cached = await ai_service.extract_and_lemmatize_words("το  σπίτι", "greek")
+
+        assert results == [words, []]
+        assert cached == words
+        mock_create.assert_not_awaited()
+
+
+class TestResponseCaching:
+    """Tests for caching of AI responses."""
+
+    @pytest.mark.asyncio
+    async def test_translation_is_served_from_cache(self):
+        """Test that repeated translations of the same word hit the API once."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("дом"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first = await ai_service.translate_word("σπίτι")
+            second = await ai_service.translate_word("  Σπίτι ")
+
+        assert first == second == "дом"
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_error_responses_are_not_cached(self):
+        """Test that failed translations are retried on the next call."""
+        from openai import APITimeoutError
+
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            side_effect=[APITimeoutError(request=MagicMock()), _make_response("дом")]
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first = await ai_service.translate_word("σπίτι")
+            second = await ai_service.translate_word("σπίτι")
+
+        assert first == ai_messages.MSG_AI_TIMEOUT
+        assert second == "дом"
+
+    @pytest.mark.asyncio
+    async def test_deck_suggestion_is_cached_per_deck_list(self):
+        """Test that a suggestion, including no match, is reused until the decks change."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("NONE"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first = await ai_service.suggest_deck_for_word("σπίτι", "дом", ["Еда", "Глаголы"])
+            second = await ai_service.suggest_deck_for_word("σπίτι", "дом", ["Глаголы", "Еда"])
+            await ai_service.suggest_deck_for_word("σπίτι", "дом", ["Еда", "Глаголы", "Быт"])
+
+        assert first is second is None
+        assert mock_create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_card_is_a_copy(self):
+        """Test that mutating a returned card does not alter the cached one."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response(_CARD_JSON))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            card = await ai_service.generate_card_from_word("σπίτι")
+            card["back"] = "changed"
+            cached = await ai_service.generate_card_from_word("σπίτι")
+
+        assert cached["back"] == "дом"
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_example_sentence_is_served_from_cache(self):
+        """Test that repeated example requests for a word hit the API once."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("Το σπίτι είναι μεγάλο."))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first = await ai_service.generate_example_sentence("σπίτι")
+            second = await ai_service.generate_example_sentence("σπίτι")
+
+        assert first == second == "Το σπίτι είναι μεγάλο."
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_deck_name_fallback_is_not_cached(self):
+        """Test that a failed deck name request is retried on the next call."""
+        ai_service = AIService()
+        mock_create = AsyncMock(side_effect=[RuntimeError("boom"), _make_response("Дом")])
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first = await ai_service.generate_deck_name("σπίτι", "дом")
+            second = await ai_service.generate_deck_name("σπίτι", "дом")
+            third = await ai_service.generate_deck_name("σπίτι", "дом")
+
+        assert first == "Разное"
+        assert second == third == "Дом"
+        assert mock_create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_categorization_is_a_copy(self):
+        """Test that mutating a categorization result does not alter the cached one."""
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            return_value=_make_response('{"category": "translate", "confidence": 0.9}')
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.categorize_message("σπίτι")
+            result["category"] = "changed"
+            cached = await ai_service.categorize_message("σπίτι")
+
+        assert cached["category"] == "translate"
+        assert mock_create.await_count == 1
+
+
+class TestExtractionAndVisionCaching:
+    """Tests for caching of word extraction and image text recognition."""
+
+    @pytest.mark.asyncio
+    async def test_identical_phrase_is_extracted_once(self):
+        """Test that concurrent and repeated extractions share one request."""
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            return_value=_make_response('{"words": [{"original": "Σπίτι", "lemma": "σπίτι"}]}')
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first, second = await asyncio.gather(
+                ai_service.extract_and_lemmatize_words("Σπίτι", "greek"),
+                ai_service.extract_and_lemmatize_words("Σπίτι", "greek"),
+            )
+            first[0]["lemma"] = "changed"
+            third = await ai_service.extract_and_lemmatize_words("Σπίτι", "greek")
+
+        assert second == third == [{"original": "Σπίτι", "lemma": "σπίτι"}]
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_spacing_and_case_variants_share_entry(self):
+        """Test that near-identical copies of a phrase are extracted once."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response('{"words": []}'))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.extract_and_lemmatize_words("Το σπίτι μου", "greek")
+            await ai_service.extract_and_lemmatize_words("  το  σπίτι\nμου ", "greek")
+            await ai_service.extract_and_lemmatize_words("το σπίτι σου", "greek")
+
+        assert mock_create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_same_image_and_prompt_is_recognized_once(self):
+        """Test that a repeated image with the same instruction hits the cache."""
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            return_value=_make_response(
+                '{"has_greek_text": true, "recognized_text": "ΣΤΑΣΗ", "translation": "Остановка"}'
+            )
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first = await ai_service.process_image_text("aGVsbG8=")
+            second = await ai_service.process_image_text("aGVsbG8=")
+            await ai_service.process_image_text("aGVsbG8=", user_prompt="объясни грамматику")
+
+        assert first == second
+        assert first is not second
+        assert mock_create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_recognition_is_not_cached(self):
+        """Test that an API failure is retried on the next call."""
+        from openai import APITimeoutError
+
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            side_effect=[
+                APITimeoutError(request=MagicMock()),
+                _make_response('{"has_greek_text": false}'),
+            ]
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first = await ai_service.process_image_text("aGVsbG8=")
+            second = await ai_service.process_image_text("aGVsbG8=")
+
+        assert first.translation == ai_messages.MSG_AI_TIMEOUT
+        assert second.translation == ""
+        assert mock_create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_image_without_greek_text_is_not_cached(self):
+        """Test that a photo recognized as having no Greek text is sent again on resend."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response('{"has_greek_text": false}'))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.process_image_text("aGVsbG8=")
+            await ai_service.process_image_text("aGVsbG8=")
+
+        assert mock_create.await_count == 2
+
+
+class TestImageFanOut:
+    """Tests for concurrent processing of several images."""
+
+    @pytest.mark.asyncio
+    async def test_images_are_processed_concurrently_in_order(self):
+        """Test that requests overlap up to the limit and results keep image order."""
+        ai_service = AIService()
+        in_flight = peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            image_url = kwargs["messages"][-1]["content"][0]["image_url"]["url"]
+            text = image_url.rsplit(",", 1)[1]
+            return _make_response(
+                orjson.dumps(
+                    {"recognized_text": text, "translation": "", "has_greek_text": True}
+                ).decode()
+            )
+
+        with patch.object(
+            ai_service.client.chat.completions, "create", new=AsyncMock(side_effect=create)
+        ):
+            results = await ai_service.process_images_text(["YQ==", "Yg==", "Yw=="], concurrency=2)
+
+        assert [result.recognized_text for result in results] == ["YQ==", "Yg==", "Yw=="]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_image_gets_fallback_result(self):
+        """Test that one failing image does not fail the others."""
+        from openai import APITimeoutError
+
+        ai_service = AIService()
+        ok = _make_response(
+            '{"recognized_text": "σπίτι", "translation": "дом", "has_greek_text": true}'
+        )
+        mock_create = AsyncMock(side_effect=[ok, APITimeoutError(request=MagicMock())])
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            results = await ai_service.process_images_text(["YQ==", "Yg=="], concurrency=1)
+
+        assert results[0].recognized_text == "σπίτι"
+        assert results[1].translation == ai_messages.MSG_AI_TIMEOUT
+
+
+class TestCardPrefetch:
+    """Tests for speculative flashcard generation."""
+
+    @pytest.mark.asyncio
+    async def test_generate_awaits_pending_prefetch(self):
+        """Test that a card requested during its prefetch is generated once."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response(_CARD_JSON))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            ai_service.prefetch_card("σπίτι")
+            card = await ai_service.generate_card_from_word("σπίτι")
+
+        assert card["back"] == "дом"
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_fills_cache(self):
+        """Test that a finished prefetch serves the later request from cache."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response(_CARD_JSON))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            ai_service.prefetch_card("σπίτι")
+            await asyncio.gather(*AIService._card_prefetches.values())
+            ai_service.prefetch_card("σπίτι")
+            await ai_service.generate_card_from_word("σπίτι")
+
+        assert mock_create.await_count == 1
+        assert not AIService._card_prefetches
+
+
+class TestErrorFallbacks:
+    """Tests for the fallback values returned when a request fails."""
+
+    @pytest.mark.asyncio
+    async def test_card_fallback_keeps_word_and_reports_error(self):
+        """Test that an API failure yields a card carrying the error message."""
+        from openai import APIConnectionError
+
+        ai_service = AIService()
+        mock_create = AsyncMock(side_effect=APIConnectionError(request=MagicMock()))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            card = await ai_service.generate_card_from_word("σπίτι")
+
+        assert card == {
+            "front": "σπίτι",
+            "back": ai_messages.MSG_AI_CONNECTION_ERROR,
+            "example": "",
+        }
+
+    @pytest.mark.asyncio
+    async def test_word_extraction_failure_returns_empty_list(self):
+        """Test that a failed or unparsable extraction yields no words."""
+        from openai import APITimeoutError
+
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            side_effect=[APITimeoutError(request=MagicMock()), _make_response("not json")]
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            timed_out = await ai_service.extract_and_lemmatize_words("το σπίτι", "greek")
+            unparsable = await ai_service.extract_and_lemmatize_words("το σπίτι", "greek")
+
+        assert timed_out == unparsable == []
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_uses_method_default(self):
+        """Test that non-API failures return the method's own fallback."""
+        ai_service = AIService()
+        mock_create = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            example = await ai_service.generate_example_sentence("σπίτι")
+            answer = await ai_service.ask_question("Привет")
+
+        assert example == ""
+        assert answer == ai_messages.MSG_AI_UNEXPECTED_ERROR
+
+    @pytest.mark.asyncio
+    async def test_image_fallback_is_image_result(self):
+        """Test that a failed vision request returns an empty recognition result."""
+        from openai import APITimeoutError
+
+        ai_service = AIService()
+        mock_create = AsyncMock(side_effect=APITimeoutError(request=MagicMock()))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.process_image_text("aGVsbG8=")
+
+        assert result.translation == ai_messages.MSG_AI_TIMEOUT
+        assert result.has_greek_text is False
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_repeated_outages(self):
+        """Test that requests stop reaching OpenAI after consecutive connection errors."""
+        from openai import APIConnectionError
+
+        ai_service = AIService()
+        mock_create = AsyncMock(side_effect=APIConnectionError(request=MagicMock()))
+
+        with (
+            patch.object(settings, "openai_circuit_fail_max", 2),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            for _ in range(2):
+                await ai_service.ask_question("Привет")
+            answer = await ai_service.ask_question("Привет")
+
+        assert answer == ai_messages.MSG_AI_SERVICE_ERROR
+        assert mock_create.await_count == 2
+
+
+class TestPersistentCache:
+    """Tests for the database-backed response cache."""
+
+    @pytest.fixture
+    def persistent_cache(self, db_session):
+        """Route the persistent cache to the test database session."""
+
+        @asynccontextmanager
+        async def session_scope():
+            yield db_session
+
+        with (
+            patch.object(settings, "ai_persistent_cache_enabled", True),
+            patch("bot.services.ai_service.get_session", new=session_scope),
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_translation_survives_memory_cache_reset(self, persistent_cache):
+        """Test that a translation is served from the database after a restart."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("дом"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.translate_word("σπίτι")
+            AIService.clear_caches()
+            result = await ai_service.translate_word("σπίτι")
+
+        assert result == "дом"
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_card_survives_memory_cache_reset(self, persistent_cache):
+        """Test that a generated card is served from the database after a restart."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response(_CARD_JSON))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first = await ai_service.generate_card_from_word("σπίτι")
+            AIService.clear_caches()
+            second = await ai_service.generate_card_from_word("σπίτι")
+
+        assert first == second
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_categorization_survives_memory_cache_reset(self, persistent_cache):
+        """Test that a categorization is served from the database after a restart."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response('{"category": "word_translation"}'))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.categorize_message("спити")
+            AIService.clear_caches()
+            result = await ai_service.categorize_message("спити")
+
+        assert result == {"category": "word_translation"}
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_purge_removes_expired_entries(self, db_session):
+        """Test that the cleanup job deletes expired rows from both cache tables."""
+
+        @asynccontextmanager
+        async def session_scope():
+            yield db_session
+
+        await AICacheRepository(db_session).set_values(
+            {b"e" * 16: '"old"', b"f" * 16: '"older"'}, timedelta(seconds=-1)
+        )
+        await AISemanticCacheRepository(db_session).add_entry(
+            "grammar", b"\x00" * 8, "old", timedelta(seconds=-1)
+        )
+
+        with patch("bot.services.ai_service.get_session", new=session_scope):
+            deleted = await purge_expired_ai_cache()
+
+        assert deleted == 3
+
+
+class TestSharedPromptPrefix:
+    """Tests for the shared completion request builder."""
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_system_prefix_and_user(self):
+        """Test that repeated requests send an identical prefix and user id."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("Объяснение"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.explain_grammar("Καλημέρα")
+            await ai_service.explain_grammar("Καλησπέρα")
+
+        first, second = (call.kwargs for call in mock_create.await_args_list)
+        assert first["messages"][0] is second["messages"][0]
+        assert first["user"] == second["user"] == ai_service.user
+
+    @pytest.mark.asyncio
+    async def test_static_instructions_precede_user_content(self):
+        """Test that the output format and examples live in the system prompt."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response('{"category": "unknown"}'))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.categorize_message("спити")
+
+        system, user = mock_create.await_args.kwargs["messages"]
+        assert "ПРИМЕРЫ" in system["content"]
+        assert "ПРИМЕРЫ" not in user["content"]
+        assert user["content"].endswith("спити")
+
+
+class TestModelRouting:
+    """Tests for choosing the model per task."""
+
+    @pytest.mark.asyncio
+    async def test_simple_tasks_use_fast_model(self):
+        """Test that translations use the fast model and grammar the main one."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("дом"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.translate_word("σπίτι")
+            await ai_service.explain_grammar("Καλημέρα")
+
+        translation_call, grammar_call = mock_create.await_args_list
+        assert translation_call.kwargs["model"] == ai_service.fast_model
+        assert grammar_call.kwargs["model"] == ai_service.model
+
+    @pytest.mark.asyncio
+    async def test_classification_tasks_are_deterministic(self):
+        """Test that translation and categorization requests use temperature 0."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response('{"category": "unknown"}'))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.translate_word("σπίτι")
+            await ai_service.categorize_message("σπίτι")
+
+        assert [call.kwargs["temperature"] for call in mock_create.await_args_list] == [0, 0]
+
+    @pytest.mark.asyncio
+    async def test_output_caps_scale_with_input(self):
+        """Test that sentence analysis and word extraction budgets follow input size."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("{}"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            await ai_service.analyze_and_translate_sentence("Θέλω σπίτι", "greek")
+            await ai_service.extract_and_lemmatize_words("θέλω να πάω σπίτι", "greek")
+            await ai_service.extract_and_lemmatize_words("λέξη " * 100, "greek")
+
+        caps = [call.kwargs["max_tokens"] for call in mock_create.await_args_list]
+        assert caps == [150 + len("Θέλω σπίτι"), 100 + 60 * 4, 1000]
+
+
+class TestThrottling:
+    """Tests for client-side request throttling."""
+
+    @pytest.mark.asyncio
+    async def test_requests_acquire_both_limiters(self):
+        """Test that each request takes one request slot and its estimated tokens."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("дом"))
+        request_acquire = AsyncMock()
+        token_acquire = AsyncMock()
+
+        with (
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+            patch.object(ai_service._request_limiter, "acquire", new=request_acquire),
+            patch.object(ai_service._token_limiter, "acquire", new=token_acquire),
+        ):
+            await ai_service.translate_word("σπίτι")
+
+        request_acquire.assert_awaited_once_with()
+        (estimate,) = token_acquire.await_args.args
+        assert estimate > mock_create.await_args.kwargs["max_tokens"]
+
+
+class _FakeStream:
+    """Async iterator standing in for an OpenAI completion stream."""
+
+    def __init__(self, fragments: list[str]):
+        chunks = [
+            MagicMock(choices=[MagicMock(delta=MagicMock(content=fragment))], usage=None)
+            for fragment in fragments
+        ]
+        # The usage chunk requested through stream_options has no choices
+        chunks.append(MagicMock(choices=[], usage=MagicMock(prompt_tokens=10)))
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class TestStreaming:
+    """Tests for streamed question answering."""
+
+    @pytest.mark.asyncio
+    async def test_stream_question_yields_fragments(self):
+        """Test that response fragments are yielded as they arrive."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_FakeStream(["Καλημέρα ", "- ", "доброе утро"]))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            fragments = [fragment async for fragment in ai_service.stream_question("Привет")]
+
+        assert fragments == ["Καλημέρα ", "- ", "доброе утро"]
+        assert mock_create.await_args.kwargs["stream"] is True
+        assert mock_create.await_args.kwargs["stream_options"] == {"include_usage": True}
+
+    @pytest.mark.asyncio
+    async def test_stream_grammar_yields_error_message_on_api_error(self):
+        """Test that API failures are reported as a user-facing message."""
+        from openai import APIConnectionError
+
+        ai_service = AIService()
+        mock_create = AsyncMock(side_effect=APIConnectionError(request=MagicMock()))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            fragments = [fragment async for fragment in ai_service.stream_grammar("Καλημέρα")]
+
+        assert fragments == [ai_messages.MSG_AI_CONNECTION_ERROR]
+
+
+class TestSharedClient:
+    """Tests for the process-wide OpenAI client."""
+
+    def test_instances_share_one_client(self):
+        """Test that AIService instances reuse the same OpenAI client."""
+        assert AIService().client is AIService().client
+
+    def test_client_retries_transient_failures(self):
+        """Test that the shared client uses the configured retry budget."""
+        assert get_openai_client().max_retries == settings.openai_max_retries
+
+    def test_service_is_shared(self):
+        """Test that get_ai_service returns one instance until the client is closed."""
+        assert get_ai_service() is get_ai_service()
+
+    @pytest.mark.asyncio
+    async def test_close_resets_service(self):
+        """Test that closing the client also drops the shared service."""
+        service = get_ai_service()
+
+        await close_openai_client()
+
+        assert get_ai_service() is not service
+        assert get_ai_service().client is get_openai_client()
+
+    @pytest.mark.asyncio
+    async def test_close_resets_client(self):
+        """Test that closing the client makes the next call build a new one."""
+        client = get_openai_client()
+
+        await close_openai_client()
+
+        assert get_openai_client() is not client
+
+    @pytest.mark.asyncio
+    async def test_prewarm_ignores_failures(self):
+        """Test that a failed warm-up request does not raise."""
+        from openai import APIConnectionError
+
+        client = get_openai_client()
+        retrieve = AsyncMock(side_effect=APIConnectionError(request=MagicMock()))
+
+        with patch.object(client.models, "retrieve", new=retrieve):
+            await prewarm_openai_client()
+
+        retrieve.assert_awaited_once()
+
+
+def _make_embedding(*vector: float) -> MagicMock:
+    """Build a mock embeddings response."""
+    response = MagicMock()
+    response.data = [MagicMock(embedding=list(vector), index=0)]
+    return response
+
+
+class TestSemanticCache:
+    """Tests for reuse of answers to near-duplicate prompts."""
+
+    @pytest.fixture(autouse=True)
+    def semantic_cache_enabled(self):
+        """Enable the semantic cache for these tests."""
+        with patch.object(settings, "ai_semantic_cache_enabled", True):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_similar_question_is_served_from_cache(self):
+        """Test that a paraphrased question reuses the previous answer."""
+        ai_service = AIService()
+        mock_embed = AsyncMock(
+            side_effect=[_make_embedding(1.0, 0.0, 0.0), _make_embedding(0.99, 0.05, 0.0)]
+        )
+        mock_create = AsyncMock(return_value=_make_response("Аорист образуется..."))
+
+        with (
+            patch.object(ai_service.client.embeddings, "create", new=mock_embed),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            first = await ai_service.ask_question("как образуется аорист?")
+            second = await ai_service.ask_question("как образуется аорист в греческом?")
+
+        assert first == second == "Аорист образуется..."
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_question_misses(self):
+        """Test that dissimilar prompts are answered separately."""
+        ai_service = AIService()
+        mock_embed = AsyncMock(
+            side_effect=[_make_embedding(1.0, 0.0, 0.0), _make_embedding(0.0, 1.0, 0.0)]
+        )
+        mock_create = AsyncMock(side_effect=[_make_response("Первое."), _make_response("Второе.")])
+
+        with (
+            patch.object(ai_service.client.embeddings, "create", new=mock_embed),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            first = await ai_service.ask_question("что такое аорист?")
+            second = await ai_service.ask_question("как читается ντ?")
+
+        assert (first, second) == ("Первое.", "Второе.")
+        assert mock_create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_grammar_is_not_matched_by_similarity(self):
+        """Test that grammar of a sentence differing in one article is not reused."""
+        ai_service = AIService()
+        mock_embed = AsyncMock(return_value=_make_embedding(1.0, 0.0))
+        mock_create = AsyncMock(side_effect=[_make_response("Первое."), _make_response("Второе.")])
+
+        with (
+            patch.object(ai_service.client.embeddings, "create", new=mock_embed),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            first = await ai_service.explain_grammar("βλέπω τον σκύλο")
+            second = await ai_service.explain_grammar("βλέπω το σκύλο")
+            again = await ai_service.explain_grammar("  Βλέπω τον   σκύλο ")
+
+        assert (first, second, again) == ("Первое.", "Второе.", "Первое.")
+        assert mock_create.await_count == 2
+        mock_embed.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_question_with_history_bypasses_cache(self):
+        """Test that context-dependent questions are not embedded or cached."""
+        ai_service = AIService()
+        mock_embed = AsyncMock()
+        mock_create = AsyncMock(return_value=_make_response("Ответ"))
+        history = [{"role": "user", "content": "привет"}]
+
+        with (
+            patch.object(ai_service.client.embeddings, "create", new=mock_embed),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            await ai_service.ask_question("а это?", conversation_history=history)
+
+        mock_embed.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_falls_back_to_completion(self):
+        """Test that an embedding error does not fail the question."""
+        ai_service = AIService()
+        mock_embed = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_create = AsyncMock(return_value=_make_response("Ответ"))
+
+        with (
+            patch.object(ai_service.client.embeddings, "create", new=mock_embed),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            result = await ai_service.ask_question("вопрос")
+
+        assert result == "Ответ"
+
+    @pytest.mark.asyncio
+    async def test_streamed_answer_is_cached(self):
+        """Test that a streamed grammar explanation is reused for the same text."""
+        ai_service = AIService()
+        mock_embed = AsyncMock(return_value=_make_embedding(0.0, 1.0))
+        mock_create = AsyncMock(return_value=_FakeStream(["Это ", "артикль."]))
+
+        with (
+            patch.object(ai_service.client.embeddings, "create", new=mock_embed),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            first = [part async for part in ai_service.stream_grammar("το σπίτι")]
+            second = [part async for part in ai_service.stream_grammar("το σπίτι")]
+
+        assert "".join(first) == "".join(second) == "Это артикль."
+        assert mock_create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_embeddings_request(self):
+        """Test that simultaneous prompts are embedded in a single batch."""
+        ai_service = AIService()
+
+        async def embed(**kwargs):
+            count = len(kwargs["input"])
+            response = MagicMock()
+            # Return out of order to check that results follow the input order
+            response.data = [
+                MagicMock(embedding=[float(i == index) for i in range(count)], index=index)
+                for index in reversed(range(count))
+            ]
+            return response
+
+        mock_embed = AsyncMock(side_effect=embed)
+        mock_create = AsyncMock(return_value=_make_response("Ответ"))
+
+        with (
+            patch.object(ai_service.client.embeddings, "create", new=mock_embed),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            await asyncio.gather(
+                ai_service.ask_question("что значит σπίτι?"),
+                ai_service.ask_question("как читается ντ?"),
+                ai_service.ask_question("что такое аорист?"),
+            )
+
+        assert mock_embed.await_count == 1
+        assert mock_embed.await_args.kwargs["input"] == [
+            "что значит σπίτι?",
+            "как читается ντ?",
+            "что такое аорист?",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_answer_survives_memory_cache_reset(self, db_session):
+        """Test that semantically cached answers are reloaded from the database."""
+
+        @asynccontextmanager
+        async def session_scope():
+            yield db_session
+
+        ai_service = AIService()
+        mock_embed = AsyncMock(return_value=_make_embedding(0.6, 0.8))
+        mock_create = AsyncMock(return_value=_make_response("Ответ"))
+
+        with (
+            patch.object(settings, "ai_persistent_cache_enabled", True),
+            patch("bot.services.ai_service.get_session", new=session_scope),
+            patch.object(ai_service.client.embeddings, "create", new=mock_embed),
+            patch.object(ai_service.client.chat.completions, "create", new=mock_create),
+        ):
+            await ai_service.ask_question("что значит σπίτι?")
+            AIService.clear_caches()
+            result = await ai_service.ask_question("что значит σπίτι?")
+
+        assert result == "Ответ"
+        assert mock_create.await_count == 1
+
+
+class TestCategorizationBatching:
+    """Tests for micro-batching of message categorization."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_messages_share_one_request(self):
+        """Test that simultaneous categorizations are answered by one batched call."""
+        ai_service = AIService()
+        content = orjson.dumps(
+            {
+                "results": [
+                    {
+                        "number": 1,
+                        "category": "word_translation",
+                        "extracted_content": "спити",
+                    },
+                    {
+                        "number": 2,
+                        "category": "language_question",
+                        "extracted_content": "что такое аорист",
+                    },
+                ]
+            }
+        ).decode()
+        mock_create = AsyncMock(return_value=_make_response(content))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first, second = await asyncio.gather(
+                ai_service.categorize_message("спити"),
+                ai_service.categorize_message("что такое аорист"),
+            )
+
+        assert first == {"category": "word_translation", "extracted_content": "спити"}
+        assert second["category"] == "language_question"
+        assert mock_create.await_count == 1
+        user_content = mock_create.await_args.kwargs["messages"][-1]["content"]
+        assert '1. "спити"' in user_content
+        assert '2. "что такое аорист"' in user_content
+
+    @pytest.mark.asyncio
+    async def test_single_message_uses_plain_prompt(self):
+        """Test that a lone message is sent without the batch framing."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response('{"category": "unknown"}'))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.categorize_message("спити")
+
+        assert result == {"category": "unknown"}
+        assert "results" not in mock_create.await_args.kwargs["messages"][-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_result_count_mismatch_raises(self):
+        """Test that an incomplete batch response fails every caller."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response('{"results": [{}]}'))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            results = await asyncio.gather(
+                ai_service.categorize_message("один"),
+                ai_service.categorize_message("два"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_reordered_results_raise(self):
+        """Test that results numbered out of order are not assigned to any caller."""
+        ai_service = AIService()
+        content = orjson.dumps(
+            {
+                "results": [
+                    {"number": 2, "category": "word_translation", "extracted_content": "два"},
+                    {"number": 1, "category": "word_translation", "extracted_content": "один"},
+                ]
+            }
+        ).decode()
+        mock_create = AsyncMock(return_value=_make_response(content))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            results = await asyncio.gather(
+                ai_service.categorize_message("один"),
+                ai_service.categorize_message("два"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_content_from_another_message_is_recategorized(self):
+        """Test that a result quoting another message is replaced by a request of its own."""
+        ai_service = AIService()
+        batch = orjson.dumps(
+            {
+                "results": [
+                    {"number": 1, "category": "word_translation", "extracted_content": "один"},
+                    {"number": 2, "category": "word_translation", "extracted_content": "один"},
+                ]
+            }
+        ).decode()
+        single = orjson.dumps({"category": "word_translation", "extracted_content": "два"}).decode()
+        mock_create = AsyncMock(side_effect=[_make_response(batch), _make_response(single)])
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            first, second = await asyncio.gather(
+                ai_service.categorize_message("один"),
+                ai_service.categorize_message("два"),
+            )
+
+        assert first["extracted_content"] == "один"
+        assert second["extracted_content"] == "два"
+        assert mock_create.await_count == 2
+        assert "results" not in mock_create.await_args.kwargs["messages"][-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_single_non_object_response_is_empty(self):
+        """Test that a lone message answered with a non-object gets an empty result."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("[]"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.categorize_message("спити")
+
+        assert result == {}
+
+
+class TestDeckSuggestion:
+    """Tests for choosing an existing deck for a word."""
+
+    @pytest.mark.asyncio
+    async def test_deck_named_in_translation_skips_api(self):
+        """Test that a deck whose name occurs in the translation is picked locally."""
+        ai_service = AIService()
+        mock_create = AsyncMock()
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.suggest_deck_for_word(
+                "το φαγητό", "еда, пища", ["Еда", "Транспорт"]
+            )
+
+        assert result == "Еда"
+        mock_create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_decks_use_api(self):
+        """Test that the API decides when no single deck matches by name."""
+        ai_service = AIService()
+        mock_create = AsyncMock(return_value=_make_response("Фрукты"))
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.suggest_deck_for_word("το μήλο", "яблоко", ["Еда", "Фрукты"])
+
+        assert result == "Фрукты"
+        assert mock_create.await_count == 1
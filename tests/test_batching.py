@@ -0,0 +1,59 @@
+"""Tests for request batching utilities."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bot.utils.batching import MicroBatcher
+
+
+async def _double(items: list[int]) -> list[int]:
+    return [item * 2 for item in items]
+
+
+class TestMicroBatcher:
+    """Tests for MicroBatcher class."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_items_share_one_batch(self):
+        """Test that items submitted together are processed in one call."""
+        process = AsyncMock(side_effect=_double)
+        batcher: MicroBatcher[int, int] = MicroBatcher(process, max_size=10, max_wait=0.01)
+
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+        assert results == [0, 2, 4]
+        process.assert_awaited_once_with([0, 1, 2])
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self):
+        """Test that reaching max_size splits the items into several batches."""
+        process = AsyncMock(side_effect=_double)
+        batcher: MicroBatcher[int, int] = MicroBatcher(process, max_size=2, max_wait=10)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1
+        )
+
+        assert results == [0, 2, 4, 6]
+        assert process.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised_to_every_caller(self):
+        """Test that a failed batch raises in all waiting callers."""
+        process = AsyncMock(side_effect=RuntimeError("boom"))
+        batcher: MicroBatcher[int, int] = MicroBatcher(process, max_size=10, max_wait=0.01)
+
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_result_count_mismatch_raises(self):
+        """Test that a batch returning the wrong number of results fails."""
+        process = AsyncMock(return_value=[1])
+        batcher: MicroBatcher[int, int] = MicroBatcher(process, max_size=10, max_wait=0.01)
+
+        with pytest.raises(ValueError):
+            await asyncio.gather(batcher.submit(1), batcher.submit(2))
@@ -0,0 +1,41 @@
+"""Tests for in-memory caching utilities."""
+
+from unittest.mock import patch
+
+from bot.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache class."""
+
+    def test_returns_stored_value(self):
+        """Test that a stored value can be read back."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_missing_key_returns_none(self):
+        """Test that unknown keys return None."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_expired_entries_are_dropped(self):
+        """Test that entries are not returned after their TTL."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+        with patch("bot.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("bot.utils.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
@@ -249,3 +249,73 @@ class TestCardMultiDeckQueries:
 
         due_cards = await card_repo.get_due_cards_from_decks([deck1.id, deck2.id], limit=3)
         assert len(due_cards) == 3
+
+    async def test_get_user_card_checks_deck_owner(
+        self, db_session: AsyncSession, user: User, deck1: Deck
+    ):
+        """Test that a card is only returned to the owner of its deck."""
+        card_repo = CardRepository(db_session)
+        card = await card_repo.create(deck_id=deck1.id, front="Word", back="Translation")
+
+        assert await card_repo.get_user_card(card.id, user.id) == card
+        assert await card_repo.get_user_card(card.id, user.id + 1) is None
+        assert await card_repo.get_user_card(card.id + 1, user.id) is None
+
+    async def test_count_deck_cards(self, db_session: AsyncSession, deck1: Deck, deck2: Deck):
+        """Test that total, new and due counts come from one deck."""
+        card_repo = CardRepository(db_session)
+        now = datetime.now(UTC)
+
+        await card_repo.create(deck_id=deck1.id, front="New", back="-", repetitions=0)
+        await card_repo.create(
+            deck_id=deck1.id,
+            front="Due",
+            back="-",
+            repetitions=1,
+            next_review=now - timedelta(days=1),
+        )
+        await card_repo.create(
+            deck_id=deck1.id,
+            front="Later",
+            back="-",
+            repetitions=1,
+            next_review=now + timedelta(days=1),
+        )
+        await card_repo.create(deck_id=deck2.id, front="Other", back="-", repetitions=0)
+
+        assert await card_repo.count_deck_cards(deck1.id, now) == (3, 1, 1)
+
+    async def test_get_deck_progress_counts(self, db_session: AsyncSession, deck1: Deck):
+        """Test that cards are counted by stage and success is averaged over reviewed cards."""
+        card_repo = CardRepository(db_session)
+        for repetitions, total_reviews, correct_reviews in [(0, 0, 0), (2, 4, 3), (6, 8, 4)]:
+            await card_repo.create(
+                deck_id=deck1.id,
+                front=f"Word {repetitions}",
+                back="-",
+                repetitions=repetitions,
+                total_reviews=total_reviews,
+                correct_reviews=correct_reviews,
+            )
+
+        assert await card_repo.get_deck_progress_counts(deck1.id) == (3, 1, 1, 1, 62.5)
+
+    async def test_get_deck_progress_counts_empty_deck(self, db_session: AsyncSession, deck1: Deck):
+        """Test that an empty deck yields zero counts."""
+        card_repo = CardRepository(db_session)
+
+        assert await card_repo.get_deck_progress_counts(deck1.id) == (0, 0, 0, 0, 0.0)
+
+    async def test_find_existing_lemmas(
+        self, db_session: AsyncSession, user: User, deck1: Deck, deck2: Deck
+    ):
+        """Test that lemmas matching a front or back in any deck are found."""
+        card_repo = CardRepository(db_session)
+        await card_repo.create(deck_id=deck1.id, front="Dog", back="perro")
+        await card_repo.create(deck_id=deck2.id, front="cat", back="gato")
+
+        found = await card_repo.find_existing_lemmas(user.id, ["dog", "gato", "bird"])
+
+        assert found == {"dog", "gato"}
+        assert await card_repo.find_existing_lemmas(user.id + 1, ["dog"]) == set()
+        assert await card_repo.find_existing_lemmas(user.id, []) == set()
@@ -0,0 +1,100 @@
+"""Tests for the circuit breaker."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from bot.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+async def _fail(breaker: CircuitBreaker, error: Exception) -> None:
+    with pytest.raises(type(error)):
+        async with breaker:
+            raise error
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker class."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self):
+        """Test that calls are rejected once fail_max failures happen in a row."""
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=30)
+
+        await _fail(breaker, ConnectionError())
+        assert not breaker.is_open
+        await _fail(breaker, ConnectionError())
+
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            async with breaker:
+                pass
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failure_count(self):
+        """Test that a successful call clears earlier failures."""
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=30)
+
+        await _fail(breaker, ConnectionError())
+        async with breaker:
+            pass
+        await _fail(breaker, ConnectionError())
+
+        assert not breaker.is_open
+
+    @pytest.mark.asyncio
+    async def test_ignored_errors_do_not_count(self):
+        """Test that errors rejected by is_failure leave the circuit closed."""
+        breaker = CircuitBreaker(
+            fail_max=1,
+            reset_timeout=30,
+            is_failure=lambda error: isinstance(error, ConnectionError),
+        )
+
+        await _fail(breaker, ValueError())
+
+        assert not breaker.is_open
+
+    @pytest.mark.asyncio
+    async def test_probe_after_timeout(self):
+        """Test that one probe is let through after the timeout and decides the state."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+        with patch("bot.utils.circuit_breaker.time.monotonic", return_value=100.0):
+            await _fail(breaker, ConnectionError())
+
+        with patch("bot.utils.circuit_breaker.time.monotonic", return_value=131.0):
+            async with breaker:
+                # Concurrent calls are rejected while the probe is running
+                with pytest.raises(CircuitOpenError):
+                    async with breaker:
+                        pass
+            assert not breaker.is_open
+
+            await _fail(breaker, ConnectionError())
+            assert breaker.is_open
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens_circuit(self):
+        """Test that a failing probe starts a new cooldown."""
+        breaker = CircuitBreaker(fail_max=3, reset_timeout=30)
+        with patch("bot.utils.circuit_breaker.time.monotonic", return_value=100.0):
+            for _ in range(3):
+                await _fail(breaker, ConnectionError())
+
+        with patch("bot.utils.circuit_breaker.time.monotonic", return_value=131.0):
+            await _fail(breaker, ConnectionError())
+            assert breaker.is_open
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_allows_another(self):
+        """Test that a cancelled probe does not leave the circuit stuck open."""
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+        with patch("bot.utils.circuit_breaker.time.monotonic", return_value=100.0):
+            await _fail(breaker, ConnectionError())
+
+        with patch("bot.utils.circuit_breaker.time.monotonic", return_value=131.0):
+            with pytest.raises(asyncio.CancelledError):
+                async with breaker:
+                    raise asyncio.CancelledError
+            assert not breaker.is_open
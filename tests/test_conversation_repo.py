@@ -79,6 +79,18 @@ class TestConversationRepository:
         assert messages[0].content == "Message 5"
         assert messages[9].content == "Message 14"
 
+    @pytest.mark.asyncio
+    async def test_get_recent_message_contents(self, db_session, sample_user):
+        """Test that recent roles and contents are returned oldest first."""
+        repo = ConversationRepository(db_session)
+
+        await repo.add_message(user_id=sample_user.id, role=MessageRole.USER, content="First")
+        await repo.add_message(user_id=sample_user.id, role=MessageRole.ASSISTANT, content="Second")
+        await repo.add_message(user_id=sample_user.id, role=MessageRole.USER, content="Third")
+
+        rows = await repo.get_recent_message_contents(user_id=sample_user.id, limit=2)
+        assert rows == [("assistant", "Second"), ("user", "Third")]
+
     @pytest.mark.asyncio
     async def test_count_messages(self, db_session, sample_user):
         """Test counting messages in conversation."""
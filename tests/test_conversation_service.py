@@ -1,5 +1,8 @@
 """Tests for conversation service."""
 
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
 import pytest
 
 from bot.database.models.user import User
@@ -41,6 +44,28 @@ class TestConversationService:
         assert msg.role == "assistant"
         assert msg.message_type == "ask_question"
 
+    @pytest.mark.asyncio
+    async def test_add_turn(self, db_session, sample_user):
+        """Test that a turn stores the user message before the reply."""
+        service = ConversationService(db_session)
+        await service.get_context_messages(sample_user)
+
+        await service.add_turn(
+            sample_user,
+            "What is hello in Greek?",
+            "Γεια σου",
+            message_type="ask_question",
+            user_sent_at=datetime.now(UTC) + timedelta(minutes=1),
+        )
+
+        expected = [
+            {"role": "user", "content": "What is hello in Greek?"},
+            {"role": "assistant", "content": "Γεια σου"},
+        ]
+        assert await service.get_context_messages(sample_user) == expected
+        ConversationService.clear_cache()
+        assert await service.get_context_messages(sample_user) == expected
+
     @pytest.mark.asyncio
     async def test_get_context_messages_format(self, db_session, sample_user):
         """Test that context messages are formatted correctly for OpenAI API."""
@@ -68,6 +93,22 @@ class TestConversationService:
         assert context[0]["content"] == "Message 5"
         assert context[9]["content"] == "Message 14"
 
+    @pytest.mark.asyncio
+    async def test_context_window_advances_in_steps(self, db_session, sample_user):
+        """Test that the window start stays put until a full step has accumulated."""
+        service = ConversationService(db_session)
+
+        starts = []
+        for i in range(16):
+            await service.add_user_message(sample_user, f"Message {i}")
+            context = await service.get_context_messages(sample_user, limit=10)
+            assert len(context) <= 10
+            starts.append(context[0]["content"])
+
+        assert starts[:10] == ["Message 0"] * 10
+        assert starts[10:15] == ["Message 5"] * 5
+        assert starts[15] == "Message 10"
+
     @pytest.mark.asyncio
     async def test_clear_conversation(self, db_session, sample_user):
         """Test clearing conversation history."""
@@ -118,3 +159,64 @@ class TestConversationService:
         assert len(context2) == 1
         assert context1[0]["content"] == "Conv 1 message"
         assert context2[0]["content"] == "Conv 2 message"
+
+    @pytest.mark.asyncio
+    async def test_cached_history_follows_new_messages(self, db_session, sample_user):
+        """Test that history is read once and then kept up to date in memory."""
+        service = ConversationService(db_session)
+        await service.add_user_message(sample_user, "Message 0")
+        await service.get_context_messages(sample_user, limit=4)
+        await db_session.commit()
+
+        with (
+            patch.object(service.repo, "count_messages") as count_messages,
+            patch.object(service.repo, "get_recent_message_contents") as get_recent,
+        ):
+            contexts = []
+            for i in range(1, 6):
+                await service.add_user_message(sample_user, f"Message {i}")
+                await db_session.commit()
+                context = await service.get_context_messages(sample_user, limit=4)
+                contexts.append([message["content"] for message in context])
+
+        count_messages.assert_not_called()
+        get_recent.assert_not_called()
+        assert contexts == [
+            ["Message 0", "Message 1"],
+            ["Message 0", "Message 1", "Message 2"],
+            ["Message 0", "Message 1", "Message 2", "Message 3"],
+            ["Message 2", "Message 3", "Message 4"],
+            ["Message 2", "Message 3", "Message 4", "Message 5"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_messages_are_not_cached(self, db_session, sample_user):
+        """Test that history cache updates are dropped when the transaction rolls back."""
+        service = ConversationService(db_session)
+        await service.add_user_message(sample_user, "Kept")
+        await service.get_context_messages(sample_user)
+        await db_session.commit()
+
+        await service.add_turn(sample_user, "Lost question", "Lost answer")
+        await db_session.rollback()
+        await db_session.refresh(sample_user)
+
+        with patch.object(service.repo, "get_recent_message_contents") as get_recent:
+            context = await service.get_context_messages(sample_user)
+
+        get_recent.assert_not_called()
+        assert context == [{"role": "user", "content": "Kept"}]
+
+    @pytest.mark.asyncio
+    async def test_cleared_conversation_is_not_served_from_cache(self, db_session, sample_user):
+        """Test that clearing a conversation also clears its cached history."""
+        service = ConversationService(db_session)
+        await service.add_user_message(sample_user, "Old message")
+        await service.get_context_messages(sample_user)
+
+        await service.clear_conversation(sample_user)
+        await service.add_user_message(sample_user, "New message")
+
+        assert await service.get_context_messages(sample_user) == [
+            {"role": "user", "content": "New message"}
+        ]
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.database.models.deck import Deck
 from bot.database.models.user import User
+from bot.database.repositories.card_repo import CardRepository
 from bot.database.repositories.deck_repo import DeckRepository
 from bot.database.repositories.user_repo import UserRepository
 
@@ -138,6 +139,16 @@ class TestDeckRepositorySortedMethods:
         count = await deck_repo.count_active_decks(user.id)
         assert count == 0
 
+    async def test_get_deck_with_card_count(self, db_session: AsyncSession, active_deck: Deck):
+        """Test that a deck is returned with its card count."""
+        deck_repo = DeckRepository(db_session)
+        card_repo = CardRepository(db_session)
+        for front in ("Word 1", "Word 2"):
+            await card_repo.create(deck_id=active_deck.id, front=front, back="Translation")
+
+        assert await deck_repo.get_deck_with_card_count(active_deck.id) == (active_deck, 2)
+        assert await deck_repo.get_deck_with_card_count(active_deck.id + 100) == (None, 0)
+
 
 class TestDeckToggle:
     """Tests for deck toggle functionality."""
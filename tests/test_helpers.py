@@ -0,0 +1,23 @@
+"""Tests for generic helper utilities."""
+
+import sys
+
+from bot.utils.helpers import intern_constants
+
+
+class TestInternConstants:
+    """Tests for intern_constants function."""
+
+    def test_interns_uppercase_strings(self):
+        """Test that uppercase string constants are replaced by interned copies."""
+        namespace: dict[str, object] = {"MSG_HELLO": "".join(["При", "вет!"])}
+        intern_constants(namespace)
+        assert namespace["MSG_HELLO"] is sys.intern("Привет!")
+
+    def test_skips_non_constants(self):
+        """Test that lowercase names and non-string values are left untouched."""
+        value = "".join(["lower", " case"])
+        namespace: dict[str, object] = {"value": value, "MAX_LENGTH": 100}
+        intern_constants(namespace)
+        assert namespace["value"] is value
+        assert namespace["MAX_LENGTH"] == 100
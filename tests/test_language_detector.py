@@ -65,6 +65,14 @@ class TestDetectLanguage:
         result = detect_language(text)
         assert result in ["greek", "russian"]
 
+    def test_repeated_text_is_cached(self):
+        """Test that detecting the same text again reuses the cached result."""
+        detect_language.cache_clear()
+
+        assert detect_language("ο σκύλος и кошка") == "greek"
+        assert detect_language("ο σκύλος и кошка") == "greek"
+        assert detect_language.cache_info().hits == 1
+
 
 class TestIsGreek:
     """Tests for is_greek function."""
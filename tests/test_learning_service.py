@@ -0,0 +1,142 @@
+"""Tests for learning service."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from bot.database.models.user import User
+from bot.database.repositories.card_repo import CardRepository
+from bot.database.repositories.deck_repo import DeckRepository
+from bot.database.repositories.review_repo import ReviewRepository
+from bot.services.learning_service import LearningService
+
+
+@pytest.fixture
+async def sample_user(db_session, sample_user_data) -> User:
+    """Create a sample user for testing."""
+    user = User(**sample_user_data)
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+class TestProcessCardReview:
+    """Tests for LearningService.process_card_review()."""
+
+    @pytest.mark.asyncio
+    async def test_review_updates_card_and_records_review(self, db_session, sample_user):
+        """Test that a review updates SRS data and stores the state before it."""
+        deck = await DeckRepository(db_session).create(user_id=sample_user.id, name="Deck")
+        card = await CardRepository(db_session).create(deck_id=deck.id, front="Word", back="-")
+        ease_factor_before = card.ease_factor
+        now = datetime(2026, 3, 10, 12, tzinfo=UTC)
+
+        updated = await LearningService(db_session).process_card_review(
+            card_id=card.id, user_id=sample_user.id, quality=5, time_spent=7, current_time=now
+        )
+
+        assert updated.repetitions == 1
+        assert updated.total_reviews == 1
+        assert updated.correct_reviews == 1
+        assert updated.next_review > now
+
+        reviews = await ReviewRepository(db_session).get_card_reviews(card.id)
+        assert len(reviews) == 1
+        assert reviews[0].quality == 5
+        assert reviews[0].time_spent == 7
+        assert reviews[0].ease_factor_before == ease_factor_before
+
+    @pytest.mark.asyncio
+    async def test_unknown_card_raises(self, db_session, sample_user):
+        """Test that reviewing a missing card fails."""
+        with pytest.raises(ValueError):
+            await LearningService(db_session).process_card_review(
+                card_id=404, user_id=sample_user.id, quality=3
+            )
+
+
+class TestGetNextCard:
+    """Tests for LearningService.get_next_card()."""
+
+    @pytest.mark.asyncio
+    async def test_prefers_newest_new_card_then_most_overdue(self, db_session, sample_user):
+        """Test that the database picks the same card as the scheduler order."""
+        deck = await DeckRepository(db_session).create(user_id=sample_user.id, name="Deck")
+        card_repo = CardRepository(db_session)
+        now = datetime.now(UTC)
+
+        overdue = await card_repo.create(
+            deck_id=deck.id, front="a", back="-", repetitions=2, next_review=now - timedelta(days=3)
+        )
+        await card_repo.create(
+            deck_id=deck.id, front="b", back="-", repetitions=2, next_review=now - timedelta(days=1)
+        )
+        await card_repo.create(
+            deck_id=deck.id, front="c", back="-", repetitions=2, next_review=now + timedelta(days=1)
+        )
+        await card_repo.create(
+            deck_id=deck.id, front="d", back="-", created_at=now - timedelta(days=2)
+        )
+        newest = await card_repo.create(
+            deck_id=deck.id, front="e", back="-", created_at=now - timedelta(days=1)
+        )
+        service = LearningService(db_session)
+
+        assert await service.get_next_card(deck.id) == newest
+
+        for card in await card_repo.get_new_cards(deck.id):
+            card.repetitions = 1
+            card.next_review = now + timedelta(days=5)
+        await db_session.flush()
+
+        assert await service.get_next_card(deck.id) == overdue
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_nothing_is_due(self, db_session, sample_user):
+        """Test that cards scheduled in the future are not returned."""
+        deck = await DeckRepository(db_session).create(user_id=sample_user.id, name="Deck")
+        await CardRepository(db_session).create(
+            deck_id=deck.id,
+            front="a",
+            back="-",
+            repetitions=1,
+            next_review=datetime.now(UTC) + timedelta(days=1),
+        )
+
+        assert await LearningService(db_session).get_next_card(deck.id) is None
+
+
+class TestGetLearningSession:
+    """Tests for LearningService.get_learning_session()."""
+
+    @pytest.mark.asyncio
+    async def test_mixes_limited_new_and_due_cards(self, db_session, sample_user):
+        """Test that new and due cards are limited, ordered and interleaved."""
+        deck = await DeckRepository(db_session).create(user_id=sample_user.id, name="Deck")
+        card_repo = CardRepository(db_session)
+        now = datetime.now(UTC)
+
+        due = [
+            await card_repo.create(
+                deck_id=deck.id,
+                front=f"due{days}",
+                back="-",
+                repetitions=1,
+                next_review=now - timedelta(days=days),
+            )
+            for days in (1, 4, 2, 3)
+        ]
+        await card_repo.create(
+            deck_id=deck.id, front="later", back="-", repetitions=1, next_review=now + timedelta(1)
+        )
+        new = [await card_repo.create(deck_id=deck.id, front=f"new{i}", back="-") for i in range(3)]
+
+        session = await LearningService(db_session).get_learning_session(
+            deck.id, max_cards=5, max_new_cards=2
+        )
+
+        assert [card.front for card in session[:3]] == ["due4", "due3", "due2"]
+        assert session[3] in new
+        assert session[4] in new
+        assert len({card.id for card in session}) == 5
+        assert due[0] not in session
@@ -0,0 +1,63 @@
+"""Tests for message categorization service."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bot.core.message_categories import CONFIDENCE_HIGH, MessageCategory
+from bot.services.message_categorization_service import MessageCategorizationService
+
+
+class TestCategorizeMessage:
+    """Tests for MessageCategorizationService.categorize_message()."""
+
+    @pytest.mark.asyncio
+    async def test_single_word_request_skips_ai(self):
+        """Test that a short word translation request is categorized locally."""
+        service = MessageCategorizationService()
+
+        with patch.object(service.ai_service, "categorize_message", new=AsyncMock()) as ai:
+            result = await service.categorize_message("как переводится σπίτι?")
+
+        ai.assert_not_awaited()
+        assert result.category == MessageCategory.WORD_TRANSLATION
+        assert result.confidence == CONFIDENCE_HIGH
+        assert result.intent.word == "σπίτι"
+        assert result.intent.source_language == "greek"
+
+    @pytest.mark.asyncio
+    async def test_bare_question_word_goes_to_ai(self):
+        """Test that a single question word is not taken for a word translation."""
+        service = MessageCategorizationService()
+        ai_result = {
+            "category": "language_question",
+            "confidence": 0.8,
+            "extracted_content": "почему?",
+        }
+
+        with patch.object(
+            service.ai_service, "categorize_message", new=AsyncMock(return_value=ai_result)
+        ) as ai:
+            result = await service.categorize_message("почему?")
+
+        ai.assert_awaited_once()
+        assert result.category == MessageCategory.LANGUAGE_QUESTION
+
+    @pytest.mark.asyncio
+    async def test_phrase_request_goes_to_ai(self):
+        """Test that a pattern capturing several words is left to the AI."""
+        service = MessageCategorizationService()
+        ai_result = {
+            "category": "text_translation",
+            "confidence": 0.9,
+            "extracted_content": "я иду домой",
+            "source_language": "russian",
+        }
+
+        with patch.object(
+            service.ai_service, "categorize_message", new=AsyncMock(return_value=ai_result)
+        ) as ai:
+            result = await service.categorize_message("переведи я иду домой")
+
+        ai.assert_awaited_once()
+        assert result.category == MessageCategory.TEXT_TRANSLATION
@@ -0,0 +1,42 @@
+"""Tests for client-side rate limiting utilities."""
+
+import time
+
+import pytest
+
+from bot.utils.rate_limit import AsyncTokenBucket
+
+
+class TestAsyncTokenBucket:
+    """Tests for AsyncTokenBucket class."""
+
+    @pytest.mark.asyncio
+    async def test_full_bucket_does_not_wait(self):
+        """Test that requests within capacity are granted immediately."""
+        bucket = AsyncTokenBucket(capacity=10, period=60)
+
+        start = time.monotonic()
+        for _ in range(10):
+            await bucket.acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        """Test that exceeding capacity waits for the bucket to refill."""
+        bucket = AsyncTokenBucket(capacity=2, period=0.1)
+        await bucket.acquire(2)
+
+        start = time.monotonic()
+        await bucket.acquire(1)
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_clamped(self):
+        """Test that a request above capacity proceeds once the bucket is full."""
+        bucket = AsyncTokenBucket(capacity=5, period=60)
+
+        await bucket.acquire(100)
+
+        assert bucket._level == 0
@@ -0,0 +1,102 @@
+"""Tests for review repository."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from bot.database.models.card import Card
+from bot.database.models.user import User
+from bot.database.repositories.card_repo import CardRepository
+from bot.database.repositories.deck_repo import DeckRepository
+from bot.database.repositories.review_repo import ReviewRepository
+
+
+@pytest.fixture
+async def sample_user(db_session, sample_user_data) -> User:
+    """Create a sample user for testing."""
+    user = User(**sample_user_data)
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+@pytest.fixture
+async def sample_card(db_session, sample_user) -> Card:
+    """Create a card to review."""
+    deck = await DeckRepository(db_session).create(user_id=sample_user.id, name="Deck")
+    return await CardRepository(db_session).create(deck_id=deck.id, front="Word", back="-")
+
+
+class TestReviewRepository:
+    """Tests for ReviewRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_aggregates(self, db_session, sample_user, sample_card):
+        """Test that reviews are counted, summed and grouped by day within the range."""
+        repo = ReviewRepository(db_session)
+        day = datetime(2026, 3, 10, 12, tzinfo=UTC)
+        for reviewed_at, quality, time_spent in [
+            (day, 5, 10),
+            (day + timedelta(hours=1), 0, None),
+            (day + timedelta(days=1), 3, 5),
+            (day + timedelta(days=5), 3, 7),
+        ]:
+            await repo.create(
+                card_id=sample_card.id,
+                user_id=sample_user.id,
+                quality=quality,
+                reviewed_at=reviewed_at,
+                time_spent=time_spent,
+            )
+
+        assert await repo.get_aggregates(sample_user.id) == (4, 3, 22, 3)
+        assert await repo.get_aggregates(
+            sample_user.id, start_date=day, end_date=day + timedelta(days=5)
+        ) == (3, 2, 15, 2)
+
+    @pytest.mark.asyncio
+    async def test_days_split_at_utc_midnight(self, db_session, sample_user, sample_card):
+        """Test that reviews on either side of UTC midnight count as two days."""
+        repo = ReviewRepository(db_session)
+        midnight = datetime(2026, 3, 11, tzinfo=UTC)
+        for reviewed_at in [
+            midnight - timedelta(minutes=30),
+            midnight + timedelta(minutes=10),
+            midnight + timedelta(minutes=30),
+        ]:
+            await repo.create(
+                card_id=sample_card.id,
+                user_id=sample_user.id,
+                quality=5,
+                reviewed_at=reviewed_at,
+            )
+
+        assert (await repo.get_aggregates(sample_user.id))[3] == 2
+
+    @pytest.mark.asyncio
+    async def test_postgres_days_are_taken_in_utc(self, db_session, sample_user):
+        """Test that Postgres converts review times to UTC before taking the date."""
+        repo = ReviewRepository(db_session)
+        result = MagicMock()
+        result.one.return_value = (0, 0, 0, 0)
+        execute = AsyncMock(return_value=result)
+
+        with (
+            patch.object(
+                db_session, "get_bind", return_value=MagicMock(dialect=postgresql.dialect())
+            ),
+            patch.object(db_session, "execute", new=execute),
+        ):
+            await repo.get_aggregates(sample_user.id)
+
+        sql = str(execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "date(timezone(%(timezone_1)s, reviews.reviewed_at))" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_aggregates_without_reviews(self, db_session, sample_user):
+        """Test that a user without reviews gets zeros."""
+        repo = ReviewRepository(db_session)
+
+        assert await repo.get_aggregates(sample_user.id) == (0, 0, 0, 0)
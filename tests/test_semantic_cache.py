@@ -0,0 +1,58 @@
+"""Tests for similarity-based caching utilities."""
+
+from unittest.mock import patch
+
+from bot.utils.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache class."""
+
+    def test_similar_embedding_hits(self):
+        """Test that a vector above the similarity threshold returns the value."""
+        cache: SemanticCache[str] = SemanticCache(maxsize=4, ttl=60, threshold=0.9)
+        cache.set([1.0, 0.0], "answer")
+
+        assert cache.get([2.0, 0.1]) == "answer"
+
+    def test_dissimilar_embedding_misses(self):
+        """Test that a vector below the similarity threshold is a miss."""
+        cache: SemanticCache[str] = SemanticCache(maxsize=4, ttl=60, threshold=0.9)
+        cache.set([1.0, 0.0], "answer")
+
+        assert cache.get([0.5, 0.5]) is None
+
+    def test_returns_most_similar_entry(self):
+        """Test that the closest of several matching entries wins."""
+        cache: SemanticCache[str] = SemanticCache(maxsize=4, ttl=60, threshold=0.5)
+        cache.set([1.0, 0.0], "first")
+        cache.set([0.8, 0.6], "second")
+
+        assert cache.get([0.7, 0.7]) == "second"
+
+    def test_oldest_entry_is_overwritten_when_full(self):
+        """Test that adding beyond maxsize evicts the oldest entry."""
+        cache: SemanticCache[str] = SemanticCache(maxsize=2, ttl=60, threshold=0.99)
+        cache.set([1.0, 0.0, 0.0], "a")
+        cache.set([0.0, 1.0, 0.0], "b")
+        cache.set([0.0, 0.0, 1.0], "c")
+
+        assert cache.get([1.0, 0.0, 0.0]) is None
+        assert cache.get([0.0, 1.0, 0.0]) == "b"
+        assert len(cache) == 2
+
+    def test_expired_entries_are_ignored(self):
+        """Test that entries past their TTL are not returned."""
+        cache: SemanticCache[str] = SemanticCache(maxsize=4, ttl=10, threshold=0.9)
+
+        with patch("bot.utils.semantic_cache.time.monotonic", return_value=100.0):
+            cache.set([1.0, 0.0], "answer")
+        with patch("bot.utils.semantic_cache.time.monotonic", return_value=111.0):
+            assert cache.get([1.0, 0.0]) is None
+
+    def test_dimension_mismatch_misses(self):
+        """Test that vectors from another embedding model never match."""
+        cache: SemanticCache[str] = SemanticCache(maxsize=4, ttl=60, threshold=0.9)
+        cache.set([1.0, 0.0], "answer")
+
+        assert cache.get([1.0, 0.0, 0.0]) is None
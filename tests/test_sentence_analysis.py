@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from bot.messages.ai import MSG_AI_RATE_LIMIT
 from bot.services.ai_service import AIService
 from bot.services.translation_service import SentenceAnalysisResult, TranslationService
 
@@ -159,6 +160,26 @@ class TestAIServiceSentenceAnalysis:
         assert result["is_correct"] is True
         assert result["translation"] == "Я хочу домой"
 
+    @pytest.mark.asyncio
+    async def test_api_error_is_not_retried_as_translation(self):
+        """Test that an API failure reports the error without a second request."""
+        from openai import RateLimitError
+
+        ai_service = AIService()
+        mock_create = AsyncMock(
+            side_effect=RateLimitError("rate limited", response=MagicMock(), body=None)
+        )
+
+        with patch.object(ai_service.client.chat.completions, "create", new=mock_create):
+            result = await ai_service.analyze_and_translate_sentence(
+                sentence="Θέλω σπίτι",
+                source_language="greek",
+            )
+
+        assert result["is_correct"] is True
+        assert result["translation"] == MSG_AI_RATE_LIMIT
+        assert mock_create.await_count == 1
+
 
 class TestTranslationServiceAnalyze:
     """Tests for TranslationService.analyze_and_translate_text()."""
@@ -0,0 +1,54 @@
+"""Tests for statistics message formatting."""
+
+import pytest
+
+from bot.messages.statistics import format_time, get_statistics_message
+
+
+class TestFormatTime:
+    """Tests for format_time function."""
+
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (0, "0мин"),
+            (59, "0мин"),
+            (60, "1мин"),
+            (3599, "59мин"),
+            (3600, "1ч 0мин"),
+            (3725, "1ч 2мин"),
+            (90000, "25ч 0мин"),
+        ],
+    )
+    def test_format_time(self, seconds: int, expected: str):
+        """Test formatting of study time."""
+        assert format_time(seconds) == expected
+
+
+class TestGetStatisticsMessage:
+    """Tests for get_statistics_message function."""
+
+    def test_renders_all_sections(self):
+        """Test that totals, daily and weekly values are rendered."""
+        text = get_statistics_message(
+            total_reviews=120,
+            accuracy=87.456,
+            total_time_seconds=7260,
+            current_streak=5,
+            total_days_active=12,
+            daily_reviews=10,
+            daily_accuracy=90.0,
+            daily_time_seconds=600,
+            weekly_reviews=40,
+            weekly_avg_daily=5.714,
+            weekly_days_active=4,
+            weekly_time_seconds=30,
+        )
+
+        assert "- Повторений: 120\n" in text
+        assert "- Точность: 87.5%\n" in text
+        assert "- Время обучения: 2ч 1мин\n" in text
+        assert "- Время обучения: 10мин\n" in text
+        assert "- В среднем в день: 5.7\n" in text
+        assert "- Дней активности: 4/7\n" in text
+        assert text.endswith("- Время обучения: 0мин")
@@ -0,0 +1,197 @@
+"""Tests for translation service."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bot.database.models.user import User
+from bot.database.repositories.card_repo import CardRepository
+from bot.database.repositories.deck_repo import DeckRepository
+from bot.services.translation_service import TranslationService
+
+
+@pytest.fixture
+async def sample_user(db_session, sample_user_data) -> User:
+    """Create a sample user for testing."""
+    user = User(**sample_user_data)
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+class TestTranslateWithCardCheck:
+    """Tests for TranslationService.translate_with_card_check()."""
+
+    @pytest.mark.asyncio
+    async def test_card_prefetch_starts_before_translation(self, db_session, sample_user):
+        """Test that a new word's card is generated alongside its translation."""
+        service = TranslationService(db_session)
+        calls = []
+
+        async def translate_word(*args):
+            calls.append("translate")
+            return "дом"
+
+        with (
+            patch.object(
+                service.ai_service,
+                "prefetch_card",
+                new=MagicMock(side_effect=lambda *args: calls.append("prefetch")),
+            ),
+            patch.object(service.ai_service, "translate_word", new=translate_word),
+            patch.object(
+                service.ai_service, "generate_deck_name", new=AsyncMock(return_value="Дом")
+            ),
+        ):
+            result = await service.translate_with_card_check(sample_user, "σπίτι", "greek")
+
+        assert sorted(calls) == ["prefetch", "translate"]
+        assert result.translation == "дом"
+        assert result.suggested_deck_name == "Дом"
+
+    @pytest.mark.asyncio
+    async def test_decks_load_while_translating(self, db_session, sample_user):
+        """Test that the translation request is already running during the deck query."""
+        service = TranslationService(db_session)
+        calls = []
+
+        async def translate_word(*args):
+            calls.append("translate")
+            return "дом"
+
+        async def get_user_decks(*args):
+            await asyncio.sleep(0)
+            calls.append("decks")
+            return []
+
+        with (
+            patch.object(service.ai_service, "prefetch_card"),
+            patch.object(service.ai_service, "translate_word", new=translate_word),
+            patch.object(service.deck_repo, "get_user_decks", new=get_user_decks),
+            patch.object(
+                service.ai_service, "generate_deck_name", new=AsyncMock(return_value="Дом")
+            ),
+        ):
+            await service.translate_with_card_check(sample_user, "σπίτι", "greek")
+
+        assert calls == ["translate", "decks"]
+
+    @pytest.mark.asyncio
+    async def test_card_lookup_runs_while_translating(self, db_session, sample_user):
+        """Test that the translation request is already running during the card lookup."""
+        service = TranslationService(db_session)
+        calls = []
+
+        async def translate_word(*args):
+            calls.append("translate")
+            return "дом"
+
+        async def find_user_card(*args):
+            await asyncio.sleep(0)
+            calls.append("cards")
+            return MagicMock(), MagicMock(), 1
+
+        with (
+            patch.object(service.ai_service, "translate_word", new=translate_word),
+            patch.object(service.card_repo, "find_user_card", new=find_user_card),
+        ):
+            result = await service.translate_with_card_check(sample_user, "σπίτι", "greek")
+
+        assert calls == ["translate", "cards"]
+        assert result.translation == "дом"
+        assert result.existing_count == 1
+
+    @pytest.mark.asyncio
+    async def test_existing_card_comes_with_its_deck(self, db_session, sample_user):
+        """Test that a found card is returned with its deck and no card prefetch."""
+        deck = await DeckRepository(db_session).create(user_id=sample_user.id, name="Дом")
+        card = await CardRepository(db_session).create(
+            deck_id=deck.id, front="το σπίτι", back="дом"
+        )
+        service = TranslationService(db_session)
+
+        with (
+            patch.object(service.ai_service, "prefetch_card") as prefetch_card,
+            patch.object(service.ai_service, "translate_word", new=AsyncMock(return_value="дом")),
+        ):
+            result = await service.translate_with_card_check(sample_user, "σπίτι", "greek")
+
+        prefetch_card.assert_not_called()
+        assert result.existing_card == card
+        assert result.existing_deck == deck
+        assert result.existing_count == 1
+
+    @pytest.mark.asyncio
+    async def test_existing_count_covers_all_matches(self, db_session, sample_user):
+        """Test that every matching card is counted, not just the one returned."""
+        deck_repo = DeckRepository(db_session)
+        card_repo = CardRepository(db_session)
+        for index in range(12):
+            deck = await deck_repo.create(user_id=sample_user.id, name=f"Deck {index}")
+            await card_repo.create(deck_id=deck.id, front="το σπίτι", back="дом")
+        service = TranslationService(db_session)
+
+        with patch.object(service.ai_service, "translate_word", new=AsyncMock(return_value="дом")):
+            result = await service.translate_with_card_check(sample_user, "σπίτι", "greek")
+
+        assert result.existing_card is not None
+        assert result.existing_count == 12
+
+
+class TestPrepareCard:
+    """Tests for TranslationService.prepare_card()."""
+
+    @pytest.mark.asyncio
+    async def test_card_generates_while_deck_query_runs(self, db_session):
+        """Test that the card request is already running during the deck query."""
+        service = TranslationService(db_session)
+        calls = []
+
+        async def generate_card_from_word(*args):
+            calls.append("card")
+            return {"front": "το σπίτι", "back": "дом", "example": ""}
+
+        async def deck_query():
+            await asyncio.sleep(0)
+            calls.append("deck")
+            return "deck"
+
+        with patch.object(
+            service.ai_service, "generate_card_from_word", new=generate_card_from_word
+        ):
+            card_data, deck = await service.prepare_card("σπίτι", "greek", deck_query())
+
+        assert calls == ["card", "deck"]
+        assert card_data.front == "το σπίτι"
+        assert deck == "deck"
+
+    @pytest.mark.asyncio
+    async def test_failed_deck_query_cancels_card(self, db_session):
+        """Test that card generation is cancelled when the deck query fails."""
+        service = TranslationService(db_session)
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def generate_card_from_word(*args):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def deck_query():
+            await started.wait()
+            raise ValueError("duplicate deck")
+
+        with (
+            patch.object(
+                service.ai_service, "generate_card_from_word", new=generate_card_from_word
+            ),
+            pytest.raises(ValueError),
+        ):
+            await service.prepare_card("σπίτι", "greek", deck_query())
+
+        await asyncio.sleep(0)
+        assert cancelled.is_set()
@@ -0,0 +1,65 @@
+"""Tests for the unified message handler."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiogram.types import ReplyKeyboardMarkup
+
+from bot.core.message_categories import (
+    CategorizationResult,
+    LanguageQuestionIntent,
+    MessageCategory,
+)
+from bot.database.models.user import User
+from bot.telegram.handlers import unified_message
+
+
+@pytest.fixture
+async def sample_user(db_session, sample_user_data) -> User:
+    """Create a sample user for testing."""
+    user = User(**sample_user_data)
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+def _question_result(question: str) -> CategorizationResult:
+    """Build a categorization result for a language question."""
+    return CategorizationResult(
+        category=MessageCategory.LANGUAGE_QUESTION,
+        confidence=0.9,
+        intent=LanguageQuestionIntent(question=question),
+        raw_message=question,
+    )
+
+
+def _user_message() -> MagicMock:
+    """Build a Telegram message mock whose answer returns an editable message."""
+    message = MagicMock()
+    message.date = datetime.now(UTC)
+    message.answer = AsyncMock(return_value=MagicMock(edit_text=AsyncMock()))
+    return message
+
+
+class TestHandleLanguageQuestion:
+    """Tests for _handle_language_question()."""
+
+    @pytest.mark.asyncio
+    async def test_answer_keeps_main_menu_keyboard(self, db_session, sample_user):
+        """Test that the streamed answer is sent with the main menu keyboard."""
+        message = _user_message()
+
+        async def stream_question(**kwargs):
+            yield "Ответ"
+
+        ai_service = MagicMock(stream_question=stream_question)
+        with patch.object(unified_message, "get_ai_service", return_value=ai_service):
+            await unified_message._handle_language_question(
+                message, db_session, sample_user, _question_result("Что значит σπίτι?")
+            )
+
+        message.answer.assert_awaited_once()
+        reply_markup = message.answer.await_args.kwargs["reply_markup"]
+        assert isinstance(reply_markup, ReplyKeyboardMarkup)
+        message.answer.return_value.edit_text.assert_awaited()
@@ -0,0 +1,45 @@
+"""Tests for user repository."""
+
+import pytest
+
+from bot.database.repositories.user_repo import UserRepository
+
+
+class TestGetOrCreateByTelegramId:
+    """Tests for UserRepository.get_or_create_by_telegram_id()."""
+
+    @pytest.mark.asyncio
+    async def test_creates_then_returns_existing_user(self, db_session, sample_user_data):
+        """Test that the first call creates the user and later calls find it."""
+        repo = UserRepository(db_session)
+
+        user, created = await repo.get_or_create_by_telegram_id(**sample_user_data)
+        again, created_again = await repo.get_or_create_by_telegram_id(**sample_user_data)
+
+        assert created is True
+        assert user.id is not None
+        assert user.username == "test_user"
+        assert created_again is False
+        assert again is user
+
+    @pytest.mark.asyncio
+    async def test_updates_changed_profile_fields(self, db_session, sample_user_data):
+        """Test that new profile values are stored and missing ones are kept."""
+        repo = UserRepository(db_session)
+        await repo.get_or_create_by_telegram_id(**sample_user_data)
+
+        user, created = await repo.get_or_create_by_telegram_id(
+            telegram_id=sample_user_data["telegram_id"], username="renamed", first_name=None
+        )
+
+        assert created is False
+        assert user.username == "renamed"
+        assert user.first_name == "Test"
+
+    @pytest.mark.asyncio
+    async def test_insert_skips_existing_telegram_id(self, db_session, sample_user_data):
+        """Test that inserting a known Telegram ID returns None instead of failing."""
+        repo = UserRepository(db_session)
+        await repo.get_or_create_by_telegram_id(**sample_user_data)
+
+        assert await repo._insert_if_absent(telegram_id=sample_user_data["telegram_id"]) is None